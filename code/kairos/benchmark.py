@@ -1,5 +1,8 @@
 import json
+import platform
+import time
 from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
 import torch
@@ -7,26 +10,193 @@ import tqdm
 from datasets import Dataset, DatasetDict
 from loguru import logger
 from more_itertools import chunked
-from transformers import AutoModelForSeq2SeqLM, EvalPrediction, T5TokenizerFast, Trainer
+from transformers import AutoModelForSeq2SeqLM, EvalPrediction, StoppingCriteriaList, T5TokenizerFast, Trainer, set_seed
+from transformers.modeling_outputs import BaseModelOutput
 
-from kairos.config import get_config
+from kairos.config import InferenceConf, InferenceDevice, SourceType, get_config
+from kairos.data.checksum import compute_dataset_checksum
+from kairos.data.collation import collate_arrow_rows, pad_arrow_list_column, pad_sequences
+from kairos.data.formatters import INPUT_TAG_BLOCKS
 from kairos.data.morph_tokenizer import get_morph_tokenizer
-from kairos.evaluation.main import get_compute_metrics
+from kairos.data.tokenize import get_raw_input_column
+from kairos.data.utils import decode_batch
+from kairos.evaluation.main import DecodedEvalPrediction, get_compute_metrics
+from kairos.inference.batching import (
+    TokenBudgetCache,
+    get_expected_output_lengths,
+    get_max_token_budget,
+    get_token_budget_schedule,
+    probe_token_budget,
+)
+from kairos.inference.encoder_cache import DEFAULT_ENCODER_CACHE_SIZE_BYTES, EncoderOutputCache, encode
+from kairos.inference.pipeline import InferenceBatch, run_pipelined_inference
+from kairos.inference.prediction_cache import (
+    PredictionCache,
+    compute_model_fingerprint,
+    compute_split_fingerprint,
+    get_prediction_cache_key,
+)
+from kairos.inference.profiling import (
+    DecodeStepTimer,
+    StageTimer,
+    get_peak_memory_mb,
+    reset_peak_memory,
+    summarize_latencies,
+)
+from kairos.inference.sharded import run_sharded_inference
+from kairos.models.cache import StaticKVCache
+from kairos.models.generation import get_assisted_generation_kwargs, get_block_count_generation_kwargs
+from kairos.models.main import (
+    get_draft_model,
+    get_target_vocabulary,
+    has_sdpa_attention,
+    is_morph_model,
+    set_sdpa_attention,
+    supports_static_kv_cache,
+    supports_target_vocabulary_trimming,
+)
+from kairos.models.vocabulary import TargetVocabulary
 from kairos.neptune_utils import log_metrics, tmp_enable_neptune_logging
 from kairos.training.main import get_generation_max_length
 
+# Stages which each batch goes through during the performance benchmark, see `run_performance_benchmark`
+BATCH_STAGES = ("collate", "encode", "decode_loop")
+
 
 def pad_to_same_length(tensors: list[torch.Tensor], pad_token_id: int) -> torch.Tensor:
     """Pad a list of tensors to the same length using the specified pad token."""
-    correct_length = max(x.shape[0] for x in tensors)
-    tensors_padded: list[torch.Tensor] = []
+    return torch.from_numpy(pad_sequences(tensors, pad_value=pad_token_id, dtype=np.int64))
+
+
+def pad_arrays_to_same_length(arrays: list[np.ndarray], pad_token_id: int) -> np.ndarray:
+    """
+    Pad a list of 1-dimensional arrays into a single 2-dimensional array using the specified pad token.
+
+    >>> pad_arrays_to_same_length([np.array([0, 5, 1]), np.array([0, 1])], pad_token_id=0)
+    array([[0, 5, 1],
+           [0, 1, 0]])
+    """
+    padded = np.full((len(arrays), max((len(x) for x in arrays), default=0)), pad_token_id, dtype=np.int64)
+    for i_array, array in enumerate(arrays):
+        padded[i_array, : len(array)] = array
+    return padded
+
+
+def get_inference_schedule(lengths: list[int], batch_size: int, sort_by_length: bool = True) -> list[list[int]]:
+    """
+    Split example indices into batches, grouping examples of similar length together if requested.
+
+    Sorting is stable and longest-first, so that an out-of-memory error (if any) surfaces on the very first batch.
+
+    >>> get_inference_schedule([3, 10, 1, 7], batch_size=2)
+    [[1, 3], [0, 2]]
+    >>> get_inference_schedule([3, 10, 1, 7], batch_size=2, sort_by_length=False)
+    [[0, 1], [2, 3]]
+    """
+    order = sorted(range(len(lengths)), key=lambda idx: -lengths[idx]) if sort_by_length else list(range(len(lengths)))
+    return [list(batch_indices) for batch_indices in chunked(order, n=batch_size)]
+
+
+def compute_padding_efficiency(lengths: list[int], schedule: list[list[int]]) -> float:
+    """
+    Compute the ratio of real tokens to all the tokens (real + padding) fed to the encoder under a given schedule.
+
+    >>> round(compute_padding_efficiency([3, 10, 1, 7], schedule=[[1, 3], [0, 2]]), 3)
+    0.808
+    >>> round(compute_padding_efficiency([3, 10, 1, 7], schedule=[[0, 1], [2, 3]]), 3)
+    0.618
+    """
+    num_real_tokens = sum(lengths[idx] for batch_indices in schedule for idx in batch_indices)
+    num_all_tokens = sum(max(lengths[idx] for idx in batch_indices) * len(batch_indices) for batch_indices in schedule)
+    return num_real_tokens / num_all_tokens if num_all_tokens else 1.0
+
 
-    for tensor in tensors:
-        pads = torch.Tensor([pad_token_id] * (correct_length - len(tensor))).type(torch.int)
-        tensor_with_pads = torch.concatenate([tensor, pads]) if len(pads) else tensor
-        tensors_padded.append(tensor_with_pads)
+def get_schedule(
+    dset_split: Dataset,
+    batch_size: int,
+    sort_by_length: bool = True,
+    token_budget: int | None = None,
+) -> list[list[int]]:
+    """Batch the split by the number of examples, or by the number of padded tokens if `token_budget` is given."""
+    lengths = [len(input_ids) for input_ids in dset_split["input_ids"]]
+    if token_budget is None:
+        return get_inference_schedule(lengths, batch_size=batch_size, sort_by_length=sort_by_length)
+    output_lengths = get_expected_output_lengths(dset_split, max_new_tokens=get_generation_max_length())
+    return get_token_budget_schedule(lengths, output_lengths, token_budget=token_budget, sort_by_length=sort_by_length)
+
+
+def get_padding_report(dset_split: Dataset, batch_size: int, token_budget: int | None = None) -> dict[str, float]:
+    """Compare the padding efficiency of the dataset-order and the length-sorted schedules."""
+    lengths = [len(input_ids) for input_ids in dset_split["input_ids"]]
+    return {
+        "padding_efficiency_dataset_order": compute_padding_efficiency(
+            lengths, get_schedule(dset_split, batch_size=batch_size, sort_by_length=False, token_budget=token_budget)
+        ),
+        "padding_efficiency_sorted_by_length": compute_padding_efficiency(
+            lengths, get_schedule(dset_split, batch_size=batch_size, sort_by_length=True, token_budget=token_budget)
+        ),
+    }
+
+
+def setup_inference_backend(inference_conf: InferenceConf) -> torch.device:
+    """Set up the torch threading settings for the requested device and return the device to run inference on."""
+    if inference_conf.device == InferenceDevice.CUDA and not torch.cuda.is_available():
+        raise ValueError("CUDA inference was requested, but CUDA is not available. Pass `--inference_device cpu` instead.")
+    if inference_conf.device == InferenceDevice.CUDA and inference_conf.num_workers > 1:
+        raise ValueError("Sharding the inference across worker processes is only supported on CPU.")
 
-    return torch.stack(tensors_padded)
+    if inference_conf.num_threads is not None:
+        torch.set_num_threads(inference_conf.num_threads)
+    if inference_conf.num_interop_threads is not None and inference_conf.num_interop_threads != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(inference_conf.num_interop_threads)
+        except RuntimeError:
+            # This can only be set once, before any inter-op parallel work has started.
+            logger.warning(f"Could not change the number of inter-op threads ({torch.get_num_interop_threads()} in use)")
+
+    return torch.device(inference_conf.device.value)
+
+
+def get_backend_info(inference_conf: InferenceConf, batch_size: int, token_budget: int | None = None) -> dict[str, Any]:
+    """Describe the backend the benchmarks were run on, so that the results can be traced back to it."""
+    return {
+        "device": inference_conf.device.value,
+        "device_name": torch.cuda.get_device_name() if inference_conf.device == InferenceDevice.CUDA else platform.processor(),
+        "num_threads": torch.get_num_threads(),
+        "num_interop_threads": torch.get_num_interop_threads(),
+        "bf16_autocast": inference_conf.bf16_autocast,
+        "block_count_stopping": inference_conf.block_count_stopping,
+        "static_kv_cache": inference_conf.static_kv_cache,
+        "fold_morph_embeddings": inference_conf.fold_morph_embeddings,
+        "batch_size": batch_size,
+        "token_budget": token_budget,
+        "num_workers": inference_conf.num_workers,
+        "torch_version": torch.__version__,
+    }
+
+
+def get_pad_values(tokenizer: T5TokenizerFast) -> dict[str, int]:
+    return {
+        "input_ids": tokenizer.pad_token_id,
+        "attention_mask": tokenizer.pad_token_id,
+        "labels": tokenizer.pad_token_id,
+        "input_morphs": get_morph_tokenizer().pad_token_id,
+    }
+
+
+def get_input_columns(dset_split: Dataset) -> list[str]:
+    return ["input_ids", "attention_mask"] + (["input_morphs"] if "input_morphs" in dset_split.column_names else [])
+
+
+def pad_labels(dset_split: Dataset, pad_token_id: int) -> np.ndarray:
+    return pad_arrow_list_column(dset_split.with_format("arrow")["labels"], pad_value=pad_token_id, dtype=np.int64)
+
+
+def collate_inference_batch(dset_split: Dataset, batch_indices: list[int], pad_value: dict[str, int]) -> InferenceBatch:
+    """Pad the input columns of the given rows straight from the Arrow buffers of the dataset, see `collate_arrow_rows`."""
+    input_pad_values = {column: pad_value[column] for column in get_input_columns(dset_split)}
+    inputs = collate_arrow_rows(dset_split, batch_indices, pad_values=input_pad_values)
+    return InferenceBatch(indices=batch_indices, inputs=inputs)
 
 
 def batch_inference(
@@ -34,55 +204,821 @@ def batch_inference(
     tokenizer: T5TokenizerFast,
     dset_split: Dataset,
     batch_size: int | None = None,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+    bf16_autocast: bool = False,
+    block_count_stopping: bool = False,
+    token_budget: int | None = None,
+    static_kv_cache: bool = False,
 ) -> EvalPrediction:
-    """Run batched inference on a dataset."""
-    model = model.to("cuda")
+    """
+    Run batched inference on a dataset.
+
+    Collation, generation and moving the generated ids back to the host and decoding them overlap - see
+    `run_pipelined_inference`. The decoded predictions are returned along the ids, so that `compute_metrics` does not decode
+    them again.
+    If `sort_by_length` is set, examples of similar input length are batched together, so that short verses are not padded to
+    the length of the longest genealogies. The predictions are restored to the original dataset order afterwards, so that they
+    still line up with the labels and the `_SS` sigla.
+
+    The generation runs on `device` under `torch.inference_mode`, optionally with bf16 autocast.
+    With `block_count_stopping`, each sequence ends as soon as it has as many target blocks as its source has words.
+    If `token_budget` is given, the batches are sized by the number of padded tokens instead of `batch_size`.
+    With `static_kv_cache`, the morph model decodes with a `StaticKVCache`, whose buffers are reused by batches of the same size.
+    """
+    device = torch.device(device)
+    model = model.to(device)
     batch_size = batch_size or len(dset_split)
+    if static_kv_cache and not supports_static_kv_cache(model):
+        logger.warning("The static key/value cache is only available for the morph model, decoding with the default cache")
+        static_kv_cache = False
+    kv_cache = StaticKVCache(max_length=get_generation_max_length() + 1) if static_kv_cache else None
 
-    pad_value = {
-        "input_ids": tokenizer.pad_token_id,
-        "attention_mask": tokenizer.pad_token_id,
-        "labels": tokenizer.pad_token_id,
-        "input_morphs": get_morph_tokenizer().pad_token_id,
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+
+    lengths = [len(input_ids) for input_ids in dset_split["input_ids"]]
+    schedule = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length, token_budget=token_budget)
+    logger.info(
+        f"Padding efficiency: {compute_padding_efficiency(lengths, schedule):.2%} ({sort_by_length = }, {len(schedule)} batches)"
+    )
+
+    def generate(batch: dict[str, torch.Tensor]) -> torch.Tensor:
+        morph_kwargs = {"input_morphs": batch["input_morphs"].to(device)} if "input_morphs" in input_columns else {}
+        block_count_kwargs = (
+            get_block_count_generation_kwargs(tokenizer, batch["input_ids"], get_target_vocabulary(model))
+            if block_count_stopping
+            else {}
+        )
+        cache_kwargs = {}
+        if kv_cache is not None:
+            kv_cache.reset()
+            cache_kwargs = {"past_key_values": kv_cache}
+        with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+            return model.generate(
+                inputs=batch["input_ids"].to(device),
+                attention_mask=batch["attention_mask"].to(device),
+                max_new_tokens=get_generation_max_length(),
+                **morph_kwargs,
+                **block_count_kwargs,
+                **cache_kwargs,
+            )
+
+    def decode(predictions: np.ndarray) -> list[str]:
+        return decode_batch(tokenizer=tokenizer, batch=predictions)
+
+    # Batches are collated lazily and results are scattered back into their dataset positions as soon as they are ready,
+    # so that the predictions line up with the labels and the sigla regardless of the schedule.
+    predictions: list[np.ndarray] = [np.empty(0, dtype=np.int64)] * len(dset_split)
+    decoded_predictions: list[str] = [""] * len(dset_split)
+    batches = (collate_inference_batch(dset_split, batch_indices, pad_value=pad_value) for batch_indices in schedule)
+    results = run_pipelined_inference(batches, generate_fn=generate, decode_fn=decode)
+    for result in tqdm.tqdm(results, total=len(schedule), desc="Inference"):
+        for idx, prediction, decoded in zip(result.indices, result.predictions, result.decoded):
+            predictions[idx] = prediction
+            decoded_predictions[idx] = decoded
+
+    inferences_padded = pad_arrays_to_same_length(predictions, pad_token_id=pad_value["labels"])
+    labels_padded = pad_labels(dset_split, pad_token_id=pad_value["labels"])
+
+    return DecodedEvalPrediction(predictions=inferences_padded, label_ids=labels_padded, decoded_predictions=decoded_predictions)
+
+
+def batch_inference_with_generation_configs(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    generation_configs: dict[str, dict[str, Any]],
+    batch_size: int | None = None,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+    bf16_autocast: bool = False,
+    block_count_stopping: bool = False,
+    token_budget: int | None = None,
+    static_kv_cache: bool = False,
+    encoder_cache: EncoderOutputCache | None = None,
+) -> dict[str, DecodedEvalPrediction]:
+    """
+    Run `batch_inference` with several generation configs, encoding each batch only once.
+
+    `generation_configs` maps a name to the keyword arguments of `generate` (e.g. `{"greedy": {}, "beam4": {"num_beams": 4}}`),
+    which override the default `max_new_tokens`. Each batch is encoded once and decoded with all the configs one after
+    another; the encoder outputs are kept in `encoder_cache`, so passing the same cache to subsequent calls with the same model
+    skips the encoder for the batches seen before. Returns one `EvalPrediction` per config, keyed by the same names.
+
+    The other settings are those of `batch_inference`, so each config produces the predictions `batch_inference` would.
+    """
+    if multiple_sequences := [name for name, config in generation_configs.items() if config.get("num_return_sequences", 1) > 1]:
+        raise ValueError(f"Only one sequence per example can be returned, but {multiple_sequences} set num_return_sequences")
+
+    device = torch.device(device)
+    model = model.to(device)
+    batch_size = batch_size or len(dset_split)
+    encoder_cache = encoder_cache if encoder_cache is not None else EncoderOutputCache(DEFAULT_ENCODER_CACHE_SIZE_BYTES)
+    generation_configs = {
+        name: {"max_new_tokens": get_generation_max_length()} | generation_config
+        for name, generation_config in generation_configs.items()
     }
-    input_columns = ["input_ids", "attention_mask"] + (["input_morphs"] if "input_morphs" in dset_split.column_names else [])
-
-    batches = []
-    for batch_data in chunked(dset_split, n=batch_size):
-        current_batch = {}
-        for column in input_columns:
-            tensors = [x[column] for x in batch_data]
-            current_batch[column] = pad_to_same_length(tensors, pad_token_id=pad_value[column])
-        batches.append(current_batch)
-
-    inferences: list[torch.Tensor] = []
-    for batch in tqdm.tqdm(batches, desc="Inference"):
-        morph_inputs = batch.get("input_morphs", torch.Tensor([])).to("cuda")
-        inputs = batch["input_ids"].to("cuda")
-        attention_mask = batch["attention_mask"].to("cuda")
-
-        morph_kwargs = {"input_morphs": morph_inputs} if "input_morphs" in input_columns else {}
-
-        inference_result = model.generate(
-            inputs=inputs,
-            attention_mask=attention_mask,
-            max_new_tokens=get_generation_max_length(),
-            **morph_kwargs,
+    if static_kv_cache and not supports_static_kv_cache(model):
+        logger.warning("The static key/value cache is only available for the morph model, decoding with the default cache")
+        static_kv_cache = False
+    max_new_tokens = max(generation_config["max_new_tokens"] for generation_config in generation_configs.values())
+    kv_cache = StaticKVCache(max_length=max_new_tokens + 1) if static_kv_cache else None
+
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    schedule = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length, token_budget=token_budget)
+
+    def generate(batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        inputs = {column: batch[column].to(device) for column in input_columns}
+        outputs = {}
+        with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+            for name, generation_config in generation_configs.items():
+                block_count_kwargs = (
+                    get_block_count_generation_kwargs(tokenizer, batch["input_ids"], get_target_vocabulary(model))
+                    if block_count_stopping
+                    else {}
+                )
+                cache_kwargs = {}
+                if kv_cache is not None:
+                    kv_cache.reset()
+                    cache_kwargs = {"past_key_values": kv_cache}
+                outputs[name] = model.generate(
+                    encoder_outputs=encode(model, inputs, cache=encoder_cache),
+                    attention_mask=inputs["attention_mask"],
+                    **generation_config,
+                    **block_count_kwargs,
+                    **cache_kwargs,
+                )
+        return outputs
+
+    def decode(predictions: np.ndarray) -> list[str]:
+        return decode_batch(tokenizer=tokenizer, batch=predictions)
+
+    predictions = {name: [np.empty(0, dtype=np.int64)] * len(dset_split) for name in generation_configs}
+    decoded_predictions = {name: [""] * len(dset_split) for name in generation_configs}
+    batches = (collate_inference_batch(dset_split, batch_indices, pad_value=pad_value) for batch_indices in schedule)
+    results = run_pipelined_inference(batches, generate_fn=generate, decode_fn=decode)
+    for result in tqdm.tqdm(results, total=len(schedule), desc=f"Inference ({len(generation_configs)} generation configs)"):
+        for name, config_predictions in result.predictions.items():
+            for idx, prediction, decoded in zip(result.indices, config_predictions, result.decoded[name]):
+                predictions[name][idx] = prediction
+                decoded_predictions[name][idx] = decoded
+    logger.info(f"Encoder cache: {encoder_cache.hits} hits, {encoder_cache.misses} misses, {encoder_cache.size_bytes} bytes")
+
+    labels_padded = pad_labels(dset_split, pad_token_id=pad_value["labels"])
+    return {
+        name: DecodedEvalPrediction(
+            predictions=pad_arrays_to_same_length(config_predictions, pad_token_id=pad_value["labels"]),
+            label_ids=labels_padded,
+            decoded_predictions=decoded_predictions[name],
         )
-        inferences.append(inference_result)
+        for name, config_predictions in predictions.items()
+    }
+
 
-    if batch_size < len(dset_split):
-        max_len = max(x.shape[-1] for x in inferences)
-        logger.warning(f"Padding all tensors to the same length ({max_len = })")
-        inferences = [
-            torch.nn.functional.pad(tensor, pad=(tokenizer.pad_token_id, max_len - tensor.shape[-1])) for tensor in inferences
+def measure_generation_peak_memory(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    batch_indices: list[int],
+    device: torch.device,
+    bf16_autocast: bool = False,
+) -> int | None:
+    """Peak CUDA memory of generating the batch all the way to its expected output length, None if it runs out of memory."""
+    inputs = collate_inference_batch(dset_split, batch_indices, pad_value=get_pad_values(tokenizer)).inputs
+    max_new_tokens = max(get_expected_output_lengths(dset_split.select(batch_indices), get_generation_max_length()))
+    torch.cuda.empty_cache()
+    torch.cuda.reset_peak_memory_stats(device)
+    try:
+        with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+            model.generate(
+                inputs=inputs.pop("input_ids").to(device),
+                # Do not let an early eos make the probe optimistic
+                min_new_tokens=max_new_tokens,
+                max_new_tokens=max_new_tokens,
+                **{column: tensor.to(device) for column, tensor in inputs.items()},
+            )
+    except torch.cuda.OutOfMemoryError:
+        return None
+    finally:
+        torch.cuda.empty_cache()
+    return torch.cuda.max_memory_allocated(device)
+
+
+def find_token_budget(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    device: torch.device,
+    memory_limit_fraction: float,
+    bf16_autocast: bool = False,
+) -> int:
+    """Probe for the largest token budget whose batch of the longest examples fits the memory limit of the device."""
+    model = model.to(device)
+    lengths = [len(input_ids) for input_ids in dset_split["input_ids"]]
+    output_lengths = get_expected_output_lengths(dset_split, max_new_tokens=get_generation_max_length())
+    memory_limit = int(torch.cuda.get_device_properties(device).total_memory * memory_limit_fraction)
+
+    def measure_peak_memory(token_budget: int) -> int | None:
+        longest_batch = get_token_budget_schedule(lengths, output_lengths, token_budget=token_budget)[0]
+        return measure_generation_peak_memory(model, tokenizer, dset_split, longest_batch, device, bf16_autocast=bf16_autocast)
+
+    return probe_token_budget(
+        measure_peak_memory,
+        memory_limit=memory_limit,
+        min_budget=max(length + output_length for length, output_length in zip(lengths, output_lengths)),
+        max_budget=get_max_token_budget(lengths, output_lengths),
+    )
+
+
+def get_token_budget(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset: DatasetDict,
+    splits: list[str],
+    inference_conf: InferenceConf,
+    device: torch.device,
+) -> int | None:
+    """
+    The token budget to batch the benchmarks by - None means batching by the number of examples.
+
+    A budget found by probing is cached per checkpoint and source type (and the device and precision it was probed on).
+    """
+    if inference_conf.token_budget is not None:
+        return inference_conf.token_budget
+    if not inference_conf.auto_token_budget:
+        return None
+    if device.type != "cuda":
+        logger.warning("The token budget can only be probed on CUDA, batching by the number of examples instead")
+        return None
+
+    source_conf = get_config().source_conf
+    cache_key = "|".join(
+        [
+            source_conf.checkpoint.value,
+            source_conf.source_type.value,
+            torch.cuda.get_device_name(device),
+            f"bf16={inference_conf.bf16_autocast}",
+            f"memory_limit_fraction={inference_conf.memory_limit_fraction}",
         ]
+    )
+    cache = TokenBudgetCache(inference_conf.token_budget_cache_file) if inference_conf.token_budget_cache_file else None
+    if cache and (token_budget := cache.get(cache_key)) is not None:
+        logger.info(f"Using the cached {token_budget = } for {cache_key = }")
+        return token_budget
+
+    # The split with the longest inputs gives the worst-case batch
+    probe_split = max(splits, key=lambda split: max(len(input_ids) for input_ids in dset[split]["input_ids"]))
+    token_budget = find_token_budget(
+        model=model,
+        tokenizer=tokenizer,
+        dset_split=dset[probe_split],
+        device=device,
+        memory_limit_fraction=inference_conf.memory_limit_fraction,
+        bf16_autocast=inference_conf.bf16_autocast,
+    )
+    logger.info(f"Found {token_budget = } for {cache_key = } on {probe_split = }")
+    if cache:
+        cache.put(cache_key, token_budget)
+    return token_budget
+
+
+def get_prediction_cache(inference_conf: InferenceConf) -> PredictionCache | None:
+    if inference_conf.prediction_cache_dir is None:
+        return None
+    return PredictionCache(
+        cache_dir=inference_conf.prediction_cache_dir,
+        max_size_bytes=int(inference_conf.prediction_cache_max_size_gb * 2**30),
+    )
+
+
+def get_generation_settings(
+    model: AutoModelForSeq2SeqLM,
+    inference_conf: InferenceConf,
+    batch_size: int,
+    sort_by_length: bool,
+    token_budget: int | None = None,
+) -> dict[str, Any]:
+    """Everything besides the weights and the data the generated ids depend on."""
+    return {
+        "generation_config": model.generation_config.to_dict(),
+        "max_new_tokens": get_generation_max_length(),
+        "block_count_stopping": inference_conf.block_count_stopping,
+        "bf16_autocast": inference_conf.bf16_autocast,
+        # The fused attention and the static key/value cache reorder floating point operations as well
+        "use_sdpa": getattr(model.config, "use_sdpa", False),
+        "static_kv_cache": inference_conf.static_kv_cache and supports_static_kv_cache(model),
+        # CPU and CUDA kernels do not produce bitwise identical logits, which may flip the argmax of close tokens
+        "device": inference_conf.device.value,
+        # Padding may affect the numerics slightly, so the batching is part of the settings as well
+        "batch_size": batch_size,
+        "token_budget": token_budget,
+        "sort_by_length": sort_by_length,
+        # Each worker batches (and sorts) its own shard of the split, so the number of workers changes the batches too
+        "num_workers": inference_conf.num_workers,
+    }
+
+
+def run_performance_benchmark(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    compute_metrics: Callable[[EvalPrediction], dict[str, float]],
+    batch_size: int,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+    bf16_autocast: bool = False,
+    block_count_stopping: bool = False,
+    warmup_batches: int = 2,
+    seed: int = 42,
+    num_beams: int = 1,
+    static_kv_cache: bool = False,
+) -> dict[str, Any]:
+    """
+    Measure the throughput, latency and peak memory of the inference on a dataset split.
+
+    Unlike `batch_inference`, the stages run one after another, so that each of them can be timed on its own:
+    tokenization of the raw inputs, collation, the encoder forward pass, the decoding loop, detokenization and the metrics.
+    The first `warmup_batches` batches are run once before the measurement and are excluded from it.
+    The time to first token is measured from the start of the encoder forward pass to the end of the first decoding step.
+    The sequences are decoded with beam search if `num_beams > 1`, and with a `StaticKVCache` if `static_kv_cache` is set.
+    """
+    device = torch.device(device)
+    model = model.to(device)
+    set_seed(seed)
+    if static_kv_cache and not supports_static_kv_cache(model):
+        logger.warning("The static key/value cache is only available for the morph model, decoding with the default cache")
+        static_kv_cache = False
+    kv_cache = StaticKVCache(max_length=get_generation_max_length() + 1) if static_kv_cache else None
+    reset_peak_memory(device)
+
+    source_type = get_config().source_conf.source_type
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    lengths = [len(input_ids) for input_ids in dset_split["input_ids"]]
+    schedule = get_inference_schedule(lengths, batch_size=batch_size, sort_by_length=sort_by_length)
+    timer = StageTimer(device)
+
+    if (raw_input_column := get_raw_input_column(source_type)) in dset_split.column_names:
+        raw_inputs = dset_split[raw_input_column]
+        raw_tags = dset_split[INPUT_TAG_BLOCKS] if source_type == SourceType.TEXT_WITH_POS_EMBEDDINGS else []
+        for start in range(0, len(raw_inputs), batch_size):
+            with timer.stage("tokenization"):
+                tokenizer(
+                    raw_inputs[start : start + batch_size],
+                    max_length=get_config().source_conf.tokenizer_max_length,
+                    truncation=True,
+                )
+                for tags in raw_tags[start : start + batch_size]:
+                    get_morph_tokenizer().encode(tags)
+    else:
+        logger.warning(f"{raw_input_column = } not found in the dataset, the tokenization will not be timed")
+
+    def encode_and_generate(batch: dict[str, torch.Tensor], timer: StageTimer, step_timer: DecodeStepTimer) -> np.ndarray:
+        encoder_kwargs = {column: batch[column].to(device) for column in input_columns}
+        generate_kwargs = (
+            get_block_count_generation_kwargs(tokenizer, batch["input_ids"], get_target_vocabulary(model))
+            if block_count_stopping
+            else {}
+        )
+        stopping_criteria = generate_kwargs.pop("stopping_criteria", StoppingCriteriaList())
+        stopping_criteria.append(step_timer)
+        if kv_cache is not None:
+            kv_cache.reset()
+            generate_kwargs["past_key_values"] = kv_cache
+        with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+            with timer.stage("encode"):
+                encoder_outputs = model.get_encoder()(**encoder_kwargs, return_dict=True)
+            with timer.stage("decode_loop"):
+                generated = model.generate(
+                    encoder_outputs=encoder_outputs,
+                    attention_mask=encoder_kwargs["attention_mask"],
+                    max_new_tokens=get_generation_max_length(),
+                    num_beams=num_beams,
+                    stopping_criteria=stopping_criteria,
+                    **generate_kwargs,
+                )
+                return generated.cpu().numpy()
+
+    for batch_indices in schedule[:warmup_batches]:
+        batch = collate_inference_batch(dset_split, batch_indices, pad_value=pad_value)
+        encode_and_generate(batch.inputs, timer=StageTimer(device), step_timer=DecodeStepTimer(device))
+
+    predictions: list[np.ndarray] = [np.empty(0, dtype=np.int64)] * len(dset_split)
+    time_to_first_token, num_generated_tokens = [], 0
+    for batch_indices in tqdm.tqdm(schedule, desc=f"Performance ({batch_size = })"):
+        with timer.stage("collate"):
+            batch = collate_inference_batch(dset_split, batch_indices, pad_value=pad_value)
+        step_timer = DecodeStepTimer(device)
+        encode_start = time.perf_counter()
+        generated = encode_and_generate(batch.inputs, timer=timer, step_timer=step_timer)
+        if step_timer.step_times:
+            time_to_first_token.append(step_timer.step_times[0] - encode_start)
+        # The first position holds the decoder start token
+        num_generated_tokens += int(np.count_nonzero(generated[:, 1:] != pad_value["labels"]))
+        for idx, prediction in zip(batch_indices, generated):
+            predictions[idx] = prediction
+
+    inferences_padded = pad_arrays_to_same_length(predictions, pad_token_id=pad_value["labels"])
+    with timer.stage("detokenization"):
+        decode_batch(tokenizer=tokenizer, batch=inferences_padded)
+    labels_padded = pad_labels(dset_split, pad_token_id=pad_value["labels"])
+    with timer.stage("metrics"):
+        compute_metrics(EvalPrediction(predictions=inferences_padded, label_ids=labels_padded))
+
+    stages = timer.summary()
+    batch_latencies = [sum(durations) for durations in zip(*(timer.durations[stage] for stage in BATCH_STAGES))]
+    inference_time = sum(stages[stage]["total"] for stage in BATCH_STAGES)
+    return {
+        "batch_size": batch_size,
+        "num_beams": num_beams,
+        "static_kv_cache": static_kv_cache,
+        "num_examples": len(dset_split),
+        "num_batches": len(schedule),
+        "warmup_batches": min(warmup_batches, len(schedule)),
+        "seed": seed,
+        "num_generated_tokens": num_generated_tokens,
+        "tokens_per_second": round(num_generated_tokens / inference_time, 3),
+        "verses_per_second": round(len(dset_split) / inference_time, 3),
+        "batch_latency": summarize_latencies(batch_latencies),
+        "time_to_first_token": summarize_latencies(time_to_first_token),
+        "peak_memory_mb": get_peak_memory_mb(device),
+        "stages": stages,
+    }
+
+
+def run_attention_benchmark(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    compute_metrics: Callable[[EvalPrediction], dict[str, float]],
+    batch_size: int,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+    bf16_autocast: bool = False,
+    warmup_batches: int = 2,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """
+    Compare the eager and the fused (SDPA) attention of the morph model on a dataset split.
+
+    Each implementation is measured with `run_performance_benchmark`. The outputs are compared on the first batch: the largest
+    absolute difference of the encoder outputs and of the logits of the teacher-forced decoder. The model is switched back to
+    its original attention implementation afterwards.
+    """
+    device = torch.device(device)
+    model = model.to(device)
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    first_batch = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length)[0]
+    batch = collate_inference_batch(dset_split, first_batch, pad_value=pad_value)
+    inputs = {column: batch.inputs[column].to(device) for column in input_columns}
+    labels = torch.from_numpy(pad_labels(dset_split.select(first_batch), pad_token_id=pad_value["labels"])).to(device)
+
+    original_sdpa = getattr(model.config, "use_sdpa", False)
+    report, outputs = {}, {}
+    try:
+        for implementation, use_sdpa in {"eager": False, "sdpa": True}.items():
+            set_sdpa_attention(model, enabled=use_sdpa)
+            with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+                output = model(**inputs, labels=labels, return_dict=True)
+            outputs[implementation] = (output.encoder_last_hidden_state.float(), output.logits.float())
+            logger.info(f"Measuring the inference performance with the {implementation} attention...")
+            report[implementation] = run_performance_benchmark(
+                model=model,
+                tokenizer=tokenizer,
+                dset_split=dset_split,
+                compute_metrics=compute_metrics,
+                batch_size=batch_size,
+                sort_by_length=sort_by_length,
+                device=device,
+                bf16_autocast=bf16_autocast,
+                warmup_batches=warmup_batches,
+                seed=seed,
+            )
+    finally:
+        set_sdpa_attention(model, enabled=original_sdpa)
+
+    (eager_encoder, eager_logits), (sdpa_encoder, sdpa_logits) = outputs["eager"], outputs["sdpa"]
+    return report | {
+        "max_abs_diff_encoder_outputs": (eager_encoder - sdpa_encoder).abs().max().item(),
+        "max_abs_diff_logits": (eager_logits - sdpa_logits).abs().max().item(),
+        "speedup": round(report["sdpa"]["tokens_per_second"] / report["eager"]["tokens_per_second"], 3),
+    }
+
+
+def time_decoder_steps(
+    forward: Callable[..., Any],
+    encoder_outputs: BaseModelOutput,
+    attention_mask: torch.Tensor,
+    decoder_input_ids: torch.Tensor,
+) -> tuple[list[float], torch.Tensor]:
+    """Run the decoder one position at a time with the key/value cache, returning the duration of each step and the logits."""
+    past_key_values, step_times, logits = None, [], []
+    for position in range(decoder_input_ids.shape[1]):
+        start = time.perf_counter()
+        output = forward(
+            encoder_outputs=encoder_outputs,
+            attention_mask=attention_mask,
+            decoder_input_ids=decoder_input_ids[:, position : position + 1],
+            past_key_values=past_key_values,
+            use_cache=True,
+            return_dict=True,
+        )
+        step_times.append(time.perf_counter() - start)
+        past_key_values = output.past_key_values
+        logits.append(output.logits)
+    return step_times, torch.concat(logits, dim=1)
+
+
+def run_compile_benchmark(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    batch_size: int,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cpu",
+    num_batches: int = 8,
+    decoder_steps: int = 32,
+    warmup_batches: int = 2,
+) -> dict[str, Any]:
+    """
+    Compare the eager and the compiled (`torch.compile`) morph model: the encoder forward pass and the decoding steps.
+
+    Both are compiled as a single graph (`fullgraph=True`), so a graph break fails the benchmark instead of silently falling
+    back to eager code. The decoder runs teacher-forced over the first `decoder_steps` label positions, one position at a time
+    with the key/value cache, as in `generate`. The first `warmup_batches` batches - which include the compilation - are run
+    before the measurement and are excluded from it. The outputs are compared on the first measured batch.
+    """
+    device = torch.device(device)
+    model = model.to(device).eval()
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    schedule = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length)
+    schedule = schedule[: warmup_batches + num_batches]
+    compiled = {
+        "encoder": torch.compile(model.get_encoder(), fullgraph=True, dynamic=True),
+        "decoder_step": torch.compile(model, fullgraph=True, dynamic=True),
+    }
+
+    def run_batch(batch_indices: list[int], use_compiled: bool) -> dict[str, Any]:
+        batch = collate_inference_batch(dset_split, batch_indices, pad_value=pad_value)
+        inputs = {column: batch.inputs[column].to(device) for column in input_columns}
+        labels = torch.from_numpy(pad_labels(dset_split.select(batch_indices), pad_token_id=pad_value["labels"])).to(device)
+        decoder_input_ids = model._shift_right(labels[:, :decoder_steps])
+        encoder = compiled["encoder"] if use_compiled else model.get_encoder()
+        with torch.inference_mode():
+            start = time.perf_counter()
+            encoder_outputs = encoder(**inputs, return_dict=True)
+            encoder_time = time.perf_counter() - start
+            step_times, logits = time_decoder_steps(
+                compiled["decoder_step"] if use_compiled else model, encoder_outputs, inputs["attention_mask"], decoder_input_ids
+            )
+        return {"encoder": encoder_time, "decoder_step": step_times, "outputs": (encoder_outputs.last_hidden_state, logits)}
+
+    report, outputs = {}, {}
+    for implementation, use_compiled in {"eager": False, "compiled": True}.items():
+        logger.info(f"Measuring the {implementation} encoder and decoder steps...")
+        start = time.perf_counter()
+        for batch_indices in schedule[:warmup_batches]:
+            run_batch(batch_indices, use_compiled=use_compiled)
+        warmup_time = time.perf_counter() - start
+        encoder_times, step_times = [], []
+        for batch_indices in tqdm.tqdm(schedule[warmup_batches:], desc=f"Compile benchmark ({implementation})"):
+            result = run_batch(batch_indices, use_compiled=use_compiled)
+            encoder_times.append(result["encoder"])
+            step_times.extend(result["decoder_step"])
+            outputs.setdefault(implementation, result["outputs"])
+        report[implementation] = {
+            "warmup_seconds": round(warmup_time, 3),
+            "encoder": summarize_latencies(encoder_times),
+            "decoder_step": summarize_latencies(step_times),
+        }
+
+    (eager_encoder, eager_logits), (compiled_encoder, compiled_logits) = outputs["eager"], outputs["compiled"]
+    return report | {
+        "batch_size": batch_size,
+        "num_batches": len(schedule) - warmup_batches,
+        "warmup_batches": warmup_batches,
+        "decoder_steps": decoder_steps,
+        "max_abs_diff_encoder_outputs": (eager_encoder - compiled_encoder).abs().max().item(),
+        "max_abs_diff_logits": (eager_logits - compiled_logits).abs().max().item(),
+        "encoder_speedup": round(report["eager"]["encoder"]["mean"] / report["compiled"]["encoder"]["mean"], 3),
+        "decoder_step_speedup": round(report["eager"]["decoder_step"]["mean"] / report["compiled"]["decoder_step"]["mean"], 3),
+    }
+
+
+def run_speculative_benchmark(
+    model: AutoModelForSeq2SeqLM,
+    draft_model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    device: torch.device | str = "cuda",
+    num_draft_tokens: int = 5,
+    bf16_autocast: bool = False,
+    block_count_stopping: bool = False,
+    warmup_batches: int = 2,
+) -> dict[str, Any]:
+    """
+    Compare greedy decoding with and without speculative (assisted) decoding by a draft model.
+
+    `generate` only supports assisted decoding of a single sequence at a time, so both are run one example at a time. The
+    timings include the encoder forward passes - both the model's and the draft model's for the assisted decoding. The first
+    `warmup_batches` examples are run before the measurement and are excluded from it. Assisted greedy decoding should
+    produce the same sequences, the number of examples where it does not (up to numerical noise) is reported.
+    """
+    device = torch.device(device)
+    model, draft_model = model.to(device), draft_model.to(device)
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    num_decoder_calls = 0
+
+    def count_decoder_call(*args) -> None:
+        nonlocal num_decoder_calls
+        num_decoder_calls += 1
 
-    inferences_flattened = torch.concatenate(inferences)
-    inferences_padded = np.array(pad_to_same_length(inferences_flattened, pad_token_id=pad_value["labels"]).cpu())
-    labels_padded = np.array(pad_to_same_length(dset_split["labels"], pad_token_id=pad_value["labels"]).cpu())
+    def generate(batch_indices: list[int], assisted: bool, timer: StageTimer) -> np.ndarray:
+        batch = collate_inference_batch(dset_split, batch_indices, pad_value=pad_value)
+        encoder_kwargs = {column: batch.inputs[column].to(device) for column in input_columns}
+        generate_kwargs = get_block_count_generation_kwargs(tokenizer, batch.inputs["input_ids"]) if block_count_stopping else {}
+        with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=bf16_autocast):
+            with timer.stage("assisted" if assisted else "greedy"):
+                if assisted:
+                    generate_kwargs |= get_assisted_generation_kwargs(draft_model, encoder_kwargs, num_draft_tokens)
+                generated = model.generate(
+                    encoder_outputs=model.get_encoder()(**encoder_kwargs, return_dict=True),
+                    attention_mask=encoder_kwargs["attention_mask"],
+                    max_new_tokens=get_generation_max_length(),
+                    num_beams=1,
+                    do_sample=False,
+                    **generate_kwargs,
+                )
+        return generated.cpu().numpy()
 
-    return EvalPrediction(predictions=inferences_padded, label_ids=labels_padded)
+    schedule = [[idx] for idx in range(len(dset_split))]
+    for batch_indices in schedule[:warmup_batches]:
+        for assisted in (False, True):
+            generate(batch_indices, assisted=assisted, timer=StageTimer(device))
+
+    timer = StageTimer(device)
+    predictions: dict[str, list[np.ndarray]] = {}
+    decoder_calls: dict[str, int] = {}
+    hook = model.get_decoder().register_forward_pre_hook(count_decoder_call)
+    try:
+        for name, assisted in {"greedy": False, "assisted": True}.items():
+            num_decoder_calls = 0
+            predictions[name] = [
+                generate(batch_indices, assisted=assisted, timer=timer)
+                for batch_indices in tqdm.tqdm(schedule[warmup_batches:], desc=f"Speculative decoding ({name})")
+            ]
+            decoder_calls[name] = num_decoder_calls
+    finally:
+        hook.remove()
+
+    # The first position holds the decoder start token
+    num_generated_tokens = sum(int(np.count_nonzero(p[:, 1:] != pad_value["labels"])) for p in predictions["greedy"])
+    num_mismatches = sum(not np.array_equal(*pair) for pair in zip(predictions["greedy"], predictions["assisted"]))
+    stages = timer.summary()
+    return {
+        "num_examples": len(schedule) - warmup_batches,
+        "warmup_batches": min(warmup_batches, len(schedule)),
+        "num_draft_tokens": num_draft_tokens,
+        "num_generated_tokens": num_generated_tokens,
+        "num_mismatches": num_mismatches,
+        "tokens_per_second": {
+            name: round(num_generated_tokens / stage["total"], 3) for name, stage in stages.items() if stage["total"]
+        },
+        "tokens_per_model_forward": {
+            name: round(num_generated_tokens / calls, 3) for name, calls in decoder_calls.items() if calls
+        },
+        "speedup": round(stages["greedy"]["total"] / stages["assisted"]["total"], 3),
+        "stages": stages,
+    }
+
+
+def fold_morph_embeddings(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    batch_size: int,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+) -> float:
+    """
+    Fold the morph layers of the morph model's encoder into lookup tables, see `MT5PreTrainedModel.fold_morph_embeddings`.
+
+    Returns the largest absolute difference between the encoder outputs of the first batch before and after the folding.
+    """
+    device = torch.device(device)
+    model = model.to(device)
+    first_batch = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length)[0]
+    batch = collate_inference_batch(dset_split, first_batch, pad_value=get_pad_values(tokenizer))
+    inputs = {column: batch.inputs[column].to(device) for column in get_input_columns(dset_split)}
+    with torch.inference_mode():
+        unfolded_outputs = model.get_encoder()(**inputs, return_dict=True).last_hidden_state
+    model.fold_morph_embeddings()
+    with torch.inference_mode():
+        folded_outputs = model.get_encoder()(**inputs, return_dict=True).last_hidden_state
+    return (folded_outputs - unfolded_outputs).abs().max().item()
+
+
+def build_target_vocabulary(
+    tokenizer: T5TokenizerFast,
+    train_split: Dataset,
+    vocabulary_file: Path | None = None,
+) -> TargetVocabulary:
+    """
+    Collect the target vocabulary from the `labels` of the training split, along with the tokenizer's special tokens.
+
+    If `vocabulary_file` is set, the vocabulary is loaded from it if it exists and saved to it otherwise.
+    """
+    if vocabulary_file is not None and vocabulary_file.exists():
+        return TargetVocabulary.load(vocabulary_file)
+    target_vocabulary = TargetVocabulary.from_labels(train_split["labels"], special_token_ids=tokenizer.all_special_ids)
+    if vocabulary_file is not None:
+        vocabulary_file.parent.mkdir(parents=True, exist_ok=True)
+        target_vocabulary.save(vocabulary_file)
+    return target_vocabulary
+
+
+def get_parameter_bytes(model: AutoModelForSeq2SeqLM) -> int:
+    return sum(parameter.numel() * parameter.element_size() for parameter in model.parameters())
+
+
+def trim_target_vocabulary(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    target_vocabulary: TargetVocabulary,
+    dset_split: Dataset,
+    batch_size: int,
+    sort_by_length: bool = True,
+    device: torch.device | str = "cuda",
+    num_batches: int = 8,
+    decoder_steps: int = 32,
+    warmup_batches: int = 2,
+) -> dict[str, Any]:
+    """
+    Trim the morph model's output vocabulary to `target_vocabulary`, see `TargetVocabularyMixin.trim_target_vocabulary`.
+
+    Returns the memory and decoding step latency savings: the parameter memory and the mean duration of a decoder step
+    (teacher-forced over the first `decoder_steps` label positions with the key/value cache, as in `run_compile_benchmark`)
+    before and after the trimming, the share of the split's label tokens the vocabulary covers (the model cannot generate
+    the others) and the largest difference between the logits of the target tokens before and after the trimming.
+    """
+    device = torch.device(device)
+    model = model.to(device).eval()
+    pad_value = get_pad_values(tokenizer)
+    input_columns = get_input_columns(dset_split)
+    schedule = get_schedule(dset_split, batch_size=batch_size, sort_by_length=sort_by_length)
+    schedule = schedule[: warmup_batches + num_batches]
+
+    def run_decoder_steps() -> tuple[list[float], torch.Tensor]:
+        step_times, first_logits = [], None
+        for batch_number, batch_indices in enumerate(schedule):
+            batch = collate_inference_batch(dset_split, batch_indices, pad_value=pad_value)
+            inputs = {column: batch.inputs[column].to(device) for column in input_columns}
+            labels = pad_labels(dset_split.select(batch_indices), pad_token_id=pad_value["labels"])
+            decoder_input_ids = model._shift_right(torch.from_numpy(labels[:, :decoder_steps]).to(device))
+            # Both runs feed the label tokens the trimmed decoder cannot take as the pad token, to compare their logits
+            in_vocabulary = torch.isin(decoder_input_ids, target_vocabulary.token_ids.to(device))
+            decoder_input_ids = decoder_input_ids.where(in_vocabulary, tokenizer.pad_token_id)
+            if get_target_vocabulary(model) is not None:
+                decoder_input_ids = target_vocabulary.to_reduced(decoder_input_ids)
+            with torch.inference_mode():
+                encoder_outputs = model.get_encoder()(**inputs, return_dict=True)
+                batch_step_times, logits = time_decoder_steps(model, encoder_outputs, inputs["attention_mask"], decoder_input_ids)
+            if batch_number >= warmup_batches:
+                step_times.extend(batch_step_times)
+                first_logits = logits if first_logits is None else first_logits
+        return step_times, first_logits
+
+    label_tokens = torch.tensor([token_id for labels in dset_split["labels"] for token_id in labels if token_id >= 0])
+    num_covered = torch.isin(label_tokens, target_vocabulary.token_ids).sum().item()
+    full_bytes = get_parameter_bytes(model)
+    full_step_times, full_logits = run_decoder_steps()
+    model.trim_target_vocabulary(target_vocabulary)
+    trimmed_bytes = get_parameter_bytes(model)
+    trimmed_step_times, trimmed_logits = run_decoder_steps()
+    full_logits = full_logits[..., target_vocabulary.token_ids.to(device)]
+
+    full_latency, trimmed_latency = summarize_latencies(full_step_times), summarize_latencies(trimmed_step_times)
+    return {
+        "full_vocab_size": model.config.vocab_size,
+        "target_vocab_size": len(target_vocabulary),
+        "label_token_coverage": round(num_covered / max(len(label_tokens), 1), 6),
+        "full_parameter_bytes": full_bytes,
+        "trimmed_parameter_bytes": trimmed_bytes,
+        "saved_parameter_bytes": full_bytes - trimmed_bytes,
+        "full_decoder_step": full_latency,
+        "trimmed_decoder_step": trimmed_latency,
+        "decoder_step_speedup": round(full_latency["mean"] / trimmed_latency["mean"], 3),
+        "max_abs_diff_target_logits": (full_logits - trimmed_logits).abs().max().item(),
+        "batch_size": batch_size,
+        "num_batches": len(schedule) - warmup_batches,
+        "warmup_batches": warmup_batches,
+        "decoder_steps": decoder_steps,
+    }
 
 
 def run_benchmarks(
@@ -90,16 +1026,75 @@ def run_benchmarks(
     dset: DatasetDict,
     batch_size: int | None = None,
     splits: list[str] = ["bench", "test", "train"],
+    sort_by_length: bool = True,
 ) -> None:
     """Run benchmarks using the existing trainer and preprocessed dataset."""
-
-    batch_size = batch_size or get_config().train_conf.eval_batch_size
+    inference_conf = get_config().inference_conf
+    batch_size = batch_size or inference_conf.batch_size or get_config().train_conf.eval_batch_size
+    device = setup_inference_backend(inference_conf)
+    if inference_conf.fold_morph_embeddings:
+        if not is_morph_model(trainer.model):
+            logger.warning("Only the morph model has morph layers to fold, skipping the folding")
+        else:
+            max_abs_diff = fold_morph_embeddings(
+                trainer.model, trainer.tokenizer, dset[splits[0]], batch_size=batch_size, sort_by_length=sort_by_length, device=device
+            )
+            logger.info(f"Folded the morph embeddings, the encoder outputs differ by at most {max_abs_diff:.2e}")
+    target_vocabulary_report = None
+    if inference_conf.trim_target_vocabulary:
+        if not supports_target_vocabulary_trimming(trainer.model):
+            logger.warning("Only the morph model's output vocabulary can be trimmed, skipping the trimming")
+        else:
+            target_vocabulary = build_target_vocabulary(
+                trainer.tokenizer, dset["train"], vocabulary_file=inference_conf.target_vocabulary_file
+            )
+            target_vocabulary_report = trim_target_vocabulary(
+                trainer.model,
+                trainer.tokenizer,
+                target_vocabulary,
+                dset[splits[0]],
+                batch_size=batch_size,
+                sort_by_length=sort_by_length,
+                device=device,
+                warmup_batches=inference_conf.warmup_batches,
+            )
+            logger.info(
+                f"Trimmed the output vocabulary to {len(target_vocabulary)} tokens, saving "
+                f"{target_vocabulary_report['saved_parameter_bytes'] / 2**20:.1f} MiB of parameters"
+            )
+    token_budget = get_token_budget(trainer.model, trainer.tokenizer, dset, splits, inference_conf, device)
 
     save_dir = Path(trainer.args.output_dir) / "benchmarks"
     save_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Benchmark results will be saved to {save_dir = }")
 
+    backend_info = get_backend_info(inference_conf, batch_size=batch_size, token_budget=token_budget)
+    logger.info(f"Running benchmarks with {backend_info = }")
+    (save_dir / "backend").with_suffix(".json").write_text(json.dumps(backend_info, indent=2))
+    if target_vocabulary_report is not None:
+        (save_dir / "target_vocabulary").with_suffix(".json").write_text(json.dumps(target_vocabulary_report, indent=2))
+
+    if prediction_cache := get_prediction_cache(inference_conf):
+        logger.info(f"Using the prediction cache at {inference_conf.prediction_cache_dir = }")
+        model_fingerprint = compute_model_fingerprint(trainer.model)
+        dataset_checksum = compute_dataset_checksum(dset)
+        generation_settings = get_generation_settings(trainer.model, inference_conf, batch_size, sort_by_length, token_budget)
+
     all_metrics = {}
+    padding_report = {}
+    performance_report: dict[str, dict[int, dict[str, Any]]] = {}
+    attention_report: dict[str, dict[str, Any]] = {}
+    beam_search_report: dict[str, dict[int, dict[str, Any]]] = {}
+    compile_report: dict[str, dict[str, Any]] = {}
+    speculative_report: dict[str, dict[str, Any]] = {}
+    draft_model = None
+    if inference_conf.speculative_benchmark:
+        if inference_conf.draft_checkpoint is None:
+            logger.warning("The speculative decoding benchmark needs a draft model (draft_checkpoint), skipping it")
+        elif get_target_vocabulary(trainer.model) is not None:
+            logger.warning("The draft model proposes tokens of the full vocabulary, skipping the speculative decoding benchmark")
+        else:
+            draft_model = get_draft_model(inference_conf.draft_checkpoint, model=trainer.model)
     for split in splits:
         save_dir_split = save_dir / split
         save_dir_split.mkdir(parents=True, exist_ok=True)
@@ -111,17 +1106,166 @@ def run_benchmarks(
             identifier=f"benchmark-{split}",
             run_inside_training=False,
         )
-        with torch.no_grad():
-            eval_pred = batch_inference(
-                model=trainer.model,
-                tokenizer=trainer.tokenizer,
-                dset_split=dset[split],
+        cached_predictions = None
+        if prediction_cache:
+            cache_key = get_prediction_cache_key(
+                model=model_fingerprint,
+                dataset=dataset_checksum,
+                split=split,
+                inputs=compute_split_fingerprint(dset[split], columns=get_input_columns(dset[split])),
+                generation=generation_settings,
+            )
+            cached_predictions = prediction_cache.get(cache_key)
+
+        if cached_predictions is not None:
+            label_ids = pad_labels(dset[split], pad_token_id=trainer.tokenizer.pad_token_id)
+            eval_pred = EvalPrediction(predictions=cached_predictions, label_ids=label_ids)
+        else:
+            inference_kwargs = dict(
                 batch_size=batch_size,
+                sort_by_length=sort_by_length,
+                bf16_autocast=inference_conf.bf16_autocast,
+                block_count_stopping=inference_conf.block_count_stopping,
+                token_budget=token_budget,
+                static_kv_cache=inference_conf.static_kv_cache,
             )
+            if inference_conf.num_workers > 1:
+                eval_pred = run_sharded_inference(
+                    model=trainer.model,
+                    tokenizer=trainer.tokenizer,
+                    dset_split=dset[split],
+                    num_workers=inference_conf.num_workers,
+                    threads_per_worker=inference_conf.threads_per_worker,
+                    **inference_kwargs,
+                )
+            else:
+                eval_pred = batch_inference(
+                    model=trainer.model, tokenizer=trainer.tokenizer, dset_split=dset[split], device=device, **inference_kwargs
+                )
+            if prediction_cache:
+                prediction_cache.put(cache_key, eval_pred.predictions)
+        padding_report[split] = get_padding_report(dset[split], batch_size=batch_size, token_budget=token_budget) | {
+            "sort_by_length": sort_by_length
+        }
         metrics = compute_metrics(eval_pred)
         (save_dir / f"{split}-metrics").with_suffix(".json").write_text(json.dumps(metrics, ensure_ascii=False, indent=2))
         all_metrics[split] = metrics
+
+        if inference_conf.performance_benchmark:
+            performance_report[split] = {}
+            for performance_batch_size in inference_conf.performance_batch_sizes or [batch_size]:
+                logger.info(f"Measuring the inference performance for {split = } {performance_batch_size = }...")
+                performance_report[split][performance_batch_size] = run_performance_benchmark(
+                    model=trainer.model,
+                    tokenizer=trainer.tokenizer,
+                    dset_split=dset[split],
+                    compute_metrics=get_compute_metrics(
+                        tokenizer=trainer.tokenizer,
+                        dset=dset,
+                        split=split,
+                        identifier=f"performance-{split}-{performance_batch_size}",
+                        run_inside_training=False,
+                    ),
+                    batch_size=performance_batch_size,
+                    sort_by_length=sort_by_length,
+                    device=device,
+                    bf16_autocast=inference_conf.bf16_autocast,
+                    block_count_stopping=inference_conf.block_count_stopping,
+                    warmup_batches=inference_conf.warmup_batches,
+                    seed=inference_conf.seed,
+                    static_kv_cache=inference_conf.static_kv_cache,
+                )
+
+        if inference_conf.beam_search_benchmark:
+            beam_search_report[split] = {}
+            for num_beams in inference_conf.beam_search_num_beams:
+                logger.info(f"Measuring the beam search performance for {split = } {num_beams = }...")
+                beam_search_report[split][num_beams] = run_performance_benchmark(
+                    model=trainer.model,
+                    tokenizer=trainer.tokenizer,
+                    dset_split=dset[split],
+                    compute_metrics=get_compute_metrics(
+                        tokenizer=trainer.tokenizer,
+                        dset=dset,
+                        split=split,
+                        identifier=f"beam-search-{split}-{num_beams}",
+                        run_inside_training=False,
+                    ),
+                    batch_size=batch_size,
+                    sort_by_length=sort_by_length,
+                    device=device,
+                    bf16_autocast=inference_conf.bf16_autocast,
+                    block_count_stopping=inference_conf.block_count_stopping,
+                    warmup_batches=inference_conf.warmup_batches,
+                    seed=inference_conf.seed,
+                    num_beams=num_beams,
+                    static_kv_cache=inference_conf.static_kv_cache,
+                )
+
+        if inference_conf.attention_benchmark:
+            if not has_sdpa_attention(trainer.model):
+                logger.warning("The attention benchmark is only available for the morph model, skipping it")
+            else:
+                logger.info(f"Comparing the eager and the fused attention for {split = }...")
+                attention_report[split] = run_attention_benchmark(
+                    model=trainer.model,
+                    tokenizer=trainer.tokenizer,
+                    dset_split=dset[split],
+                    compute_metrics=get_compute_metrics(
+                        tokenizer=trainer.tokenizer,
+                        dset=dset,
+                        split=split,
+                        identifier=f"attention-{split}",
+                        run_inside_training=False,
+                    ),
+                    batch_size=batch_size,
+                    sort_by_length=sort_by_length,
+                    device=device,
+                    bf16_autocast=inference_conf.bf16_autocast,
+                    warmup_batches=inference_conf.warmup_batches,
+                    seed=inference_conf.seed,
+                )
+
+        if inference_conf.compile_benchmark:
+            if not is_morph_model(trainer.model):
+                logger.warning("The compile benchmark is only available for the morph model, skipping it")
+            else:
+                logger.info(f"Comparing the eager and the compiled model for {split = }...")
+                compile_report[split] = run_compile_benchmark(
+                    model=trainer.model,
+                    tokenizer=trainer.tokenizer,
+                    dset_split=dset[split],
+                    batch_size=batch_size,
+                    sort_by_length=sort_by_length,
+                    device=device,
+                    warmup_batches=inference_conf.warmup_batches,
+                )
+
+        if draft_model is not None:
+            logger.info(f"Comparing greedy decoding with and without the draft model for {split = }...")
+            speculative_report[split] = run_speculative_benchmark(
+                model=trainer.model,
+                draft_model=draft_model,
+                tokenizer=trainer.tokenizer,
+                dset_split=dset[split],
+                device=device,
+                num_draft_tokens=inference_conf.num_draft_tokens,
+                bf16_autocast=inference_conf.bf16_autocast,
+                block_count_stopping=inference_conf.block_count_stopping,
+                warmup_batches=inference_conf.warmup_batches,
+            )
     (save_dir / "all_metrics").with_suffix(".json").write_text(json.dumps(all_metrics, ensure_ascii=False, indent=2))
+    (save_dir / "padding_efficiency").with_suffix(".json").write_text(json.dumps(padding_report, indent=2))
+    if performance_report:
+        (save_dir / "performance").with_suffix(".json").write_text(json.dumps(performance_report, indent=2))
+    if attention_report:
+        (save_dir / "attention").with_suffix(".json").write_text(json.dumps(attention_report, indent=2))
+    if beam_search_report:
+        (save_dir / "beam_search").with_suffix(".json").write_text(json.dumps(beam_search_report, indent=2))
+    if compile_report:
+        (save_dir / "compile").with_suffix(".json").write_text(json.dumps(compile_report, indent=2))
+    if speculative_report:
+        (save_dir / "speculative").with_suffix(".json").write_text(json.dumps(speculative_report, indent=2))
 
     with tmp_enable_neptune_logging(run_id=get_config().neptune_run_id) as run:
         for split in splits:
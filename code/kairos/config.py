@@ -86,6 +86,11 @@ class MorphArchitecture(Enum):
     CONCATENATE = "concatenate"
 
 
+class InferenceDevice(Enum):
+    CUDA = "cuda"
+    CPU = "cpu"
+
+
 @dataclasses.dataclass
 class TrainConf:
     # TODO: Remove, this is no longer used as the generation max length is suited to
@@ -113,6 +118,7 @@ class TrainConf:
     compute_generation_max_length: bool = True
     found_truncated_dataset: bool = False
     num_train_samples: int | None = None
+    loss_chunk_size: int | None = None  # morph model only, compute the loss this many label positions at a time
 
 
 @dataclasses.dataclass
@@ -121,6 +127,7 @@ class MorphSpecificConf:
     pos_embedding_dim: int
     morph_learning_rate: float = 1e-3
     arch: MorphArchitecture = MorphArchitecture.SIMPLE_SUM
+    sdpa_attention: bool = False  # fused scaled_dot_product_attention instead of the eager attention
 
     save_grads_every: int = 0
     debug_morph_embeddings_mode: bool = False
@@ -188,12 +195,48 @@ class SourceConf:
     truncate_to_most_pessimistic_block_count: bool = True
 
 
+@dataclasses.dataclass
+class InferenceConf:
+    """Contains configs related to running inference outside of the training loop (e.g. the benchmarks)."""
+
+    device: InferenceDevice = InferenceDevice.CUDA
+    batch_size: int | None = None  # falls back to train_conf.eval_batch_size
+    num_threads: int | None = None  # intra-op threads, torch default if None
+    num_interop_threads: int | None = None  # inter-op threads, torch default if None
+    bf16_autocast: bool = False
+    block_count_stopping: bool = False  # end each sequence once it has as many target blocks as the source has words
+    performance_benchmark: bool = False  # also measure throughput, latency and memory of the inference
+    performance_batch_sizes: list[int] = dataclasses.field(default_factory=list)  # falls back to batch_size
+    warmup_batches: int = 2  # run before each performance measurement and excluded from it
+    seed: int = 42
+    prediction_cache_dir: Path | None = None  # generated ids are cached across benchmark runs if set
+    prediction_cache_max_size_gb: float = 10.0
+    token_budget: int | None = None  # batch by the number of padded input + output tokens instead of batch_size
+    auto_token_budget: bool = False  # probe for the largest token budget that fits memory_limit_fraction (CUDA only)
+    memory_limit_fraction: float = 0.9
+    token_budget_cache_file: Path | None = None  # probed token budgets are cached in this file if set
+    num_workers: int = 1  # CPU only, each worker process runs over a contiguous shard of the split
+    threads_per_worker: int | None = None  # defaults to an equal share of the available cores
+    attention_benchmark: bool = False  # compare the performance and outputs of the eager and the fused (SDPA) attention
+    static_kv_cache: bool = False  # morph model only, decode with a preallocated key/value cache written in place
+    beam_search_benchmark: bool = False  # also measure the performance of beam search with each of beam_search_num_beams
+    beam_search_num_beams: list[int] = dataclasses.field(default_factory=lambda: [1, 4, 8])
+    fold_morph_embeddings: bool = False  # morph model only, fold the morph layers of the encoder into lookup tables
+    compile_benchmark: bool = False  # compare the eager and the compiled (torch.compile) encoder and decoder steps
+    draft_checkpoint: Path | None = None  # smaller fine-tuned model proposing tokens for speculative (assisted) decoding
+    num_draft_tokens: int = 5  # initial number of tokens the draft model proposes per step, adjusted by generate
+    speculative_benchmark: bool = False  # compare greedy decoding with and without the draft model
+    trim_target_vocabulary: bool = False  # morph model only, slice lm_head and the decoder embeddings to the train targets
+    target_vocabulary_file: Path | None = None  # the trimmed vocabulary is loaded from this file if it exists, else saved
+
+
 @dataclasses.dataclass
 class Config:
     logconf: LogConf
     source_conf: SourceConf
     train_conf: TrainConf
     morph_conf: MorphSpecificConf | None = None
+    inference_conf: InferenceConf = dataclasses.field(default_factory=InferenceConf)
 
     tags: list[str] = dataclasses.field(default_factory=list)
     neptune_run_id: str | None = None
@@ -0,0 +1,106 @@
+"""
+Vectorized collation of token id sequences into padded batches.
+
+A batch of sequences is represented the way Arrow stores a list column: one flat buffer with the values of all the rows and an
+offsets array marking where each row starts. Padding is then a single scatter into a preallocated tensor - no per-row Python
+objects are created, and for contiguous rows of an Arrow-backed dataset the values are not even copied before the scatter.
+"""
+
+import numpy as np
+import pyarrow as pa
+import torch
+from datasets import Dataset
+
+
+def pad_ragged(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    pad_value: int,
+    length: int | None = None,
+    dtype: np.dtype = np.int32,
+    padding_side: str = "right",
+) -> np.ndarray:
+    """
+    Pad a ragged array given as flat values and offsets into a dense array of shape (num_rows, max(row_length, length)).
+
+    The rows are padded on the right, or on the left with `padding_side="left"` (like a tokenizer would).
+
+    >>> pad_ragged(np.array([5, 6, 7, 8, 9, 4]), offsets=np.array([0, 3, 4, 6]), pad_value=0)
+    array([[5, 6, 7],
+           [8, 0, 0],
+           [9, 4, 0]], dtype=int32)
+    >>> pad_ragged(np.array([-1, 5, 6, 7, 8]), offsets=np.array([1, 3, 5]), pad_value=-100, length=3, dtype=np.int64)
+    array([[   5,    6, -100],
+           [   7,    8, -100]])
+    >>> pad_ragged(np.array([5, 6, 7]), offsets=np.array([0, 2, 3]), pad_value=0, padding_side="left")
+    array([[5, 6],
+           [0, 7]], dtype=int32)
+    """
+    offsets = np.asarray(offsets)
+    row_lengths = np.diff(offsets)
+    num_rows = len(row_lengths)
+    width = max(int(row_lengths.max(initial=0)), length or 0)
+    padded = np.full((num_rows, width), pad_value, dtype=dtype)
+
+    # Offsets of a sliced Arrow array do not necessarily start at 0
+    start, end = int(offsets[0]), int(offsets[-1])
+    row_idx = np.repeat(np.arange(num_rows), row_lengths)
+    col_idx = np.arange(end - start) - np.repeat(offsets[:-1] - start, row_lengths)
+    if padding_side == "left":
+        col_idx += np.repeat(width - row_lengths, row_lengths)
+    padded[row_idx, col_idx] = values[start:end]
+    return padded
+
+
+def pad_arrow_list_column(
+    column: pa.Array | pa.ChunkedArray,
+    pad_value: int,
+    length: int | None = None,
+    dtype: np.dtype = np.int32,
+) -> np.ndarray:
+    """Pad an Arrow list column, reading its offsets and values buffers directly."""
+    if isinstance(column, pa.ChunkedArray):
+        # Zero-copy for a single chunk, which is the case for a contiguous slice of a dataset
+        column = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+    offsets = column.offsets.to_numpy()
+    values = column.values.to_numpy(zero_copy_only=False)
+    return pad_ragged(values, offsets, pad_value=pad_value, length=length, dtype=dtype)
+
+
+def pad_sequences(
+    sequences: list[torch.Tensor] | list[np.ndarray] | list[list[int]],
+    pad_value: int,
+    length: int | None = None,
+    dtype: np.dtype = np.int32,
+    padding_side: str = "right",
+) -> np.ndarray:
+    """
+    Pad sequences which are already materialized (e.g. rows handed over by a DataLoader) with a single concatenation.
+
+    >>> pad_sequences([torch.tensor([5, 6]), torch.tensor([7])], pad_value=0, length=3)
+    array([[5, 6, 0],
+           [7, 0, 0]], dtype=int32)
+    """
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+    values = np.concatenate([np.asarray(sequence) for sequence in sequences]) if sequences else np.empty(0, dtype=dtype)
+    return pad_ragged(values, offsets, pad_value=pad_value, length=length, dtype=dtype, padding_side=padding_side)
+
+
+def collate_arrow_rows(
+    dset_split: Dataset,
+    indices: list[int],
+    pad_values: dict[str, int],
+    dtypes: dict[str, np.dtype] | None = None,
+) -> dict[str, torch.Tensor]:
+    """
+    Gather the given rows of an Arrow-backed dataset and pad each of the `pad_values` columns into a single tensor.
+
+    The columns are int32 unless overridden in `dtypes` (e.g. labels, which the loss needs as int64).
+    """
+    dtypes = dtypes or {}
+    table = dset_split.with_format("arrow")[indices]
+    return {
+        column: torch.from_numpy(pad_arrow_list_column(table[column], pad_value, dtype=dtypes.get(column, np.int32)))
+        for column, pad_value in pad_values.items()
+    }
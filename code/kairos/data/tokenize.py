@@ -219,6 +219,11 @@ def get_final_columns(source_type: SourceType) -> list[str]:
     )
 
 
+def get_raw_input_column(source_type: SourceType) -> str:
+    """The untokenized column the input_ids of the given source type are tokenized from."""
+    return RAW_INPUT_TEXT_WITH_MORPHS if source_type == SourceType.TEXT_WITH_POS else RAW_INPUT_TEXT_ONLY
+
+
 def get_tokenizer(checkpoint: Checkpoint) -> T5TokenizerFast:
     tokenizer = AutoTokenizer.from_pretrained(checkpoint.value, legacy=False)
     ensure_sentinel_tokens_are_in_place(tokenizer)
@@ -152,6 +152,14 @@ def get_trimmed_decoded_preds_and_references(
     return trimmed_decoded_preds, trimmed_decoded_references
 
 
+class DecodedEvalPrediction(EvalPrediction):
+    """An `EvalPrediction` whose predictions were already decoded by the inference, see `batch_inference`."""
+
+    def __init__(self, predictions: np.ndarray, label_ids: np.ndarray, decoded_predictions: list[str]):
+        super().__init__(predictions=predictions, label_ids=label_ids)
+        self.decoded_predictions = decoded_predictions
+
+
 def get_compute_metrics(
     *,
     tokenizer: T5TokenizerFast,
@@ -180,14 +188,19 @@ def get_compute_metrics(
         # Both preds and references are of shape (eval_size, max_len)
         assert isinstance(preds, np.ndarray) and isinstance(references, np.ndarray)
 
-        # We're decoding both preds and references.
-        # We're also making the references a nested list.
-        decoded_preds, decoded_references = decode_preds_and_references(
-            tokenizer=tokenizer,
-            preds=preds,
-            references=references,
-            safe_decode=False,
-        )
+        if isinstance(eval_preds, DecodedEvalPrediction):
+            # The predictions were decoded while the next batches were being generated, only the references are left
+            decoded_preds = eval_preds.decoded_predictions
+            decoded_references = [[decoded_ref] for decoded_ref in decode_batch(tokenizer=tokenizer, batch=references)]
+        else:
+            # We're decoding both preds and references.
+            # We're also making the references a nested list.
+            decoded_preds, decoded_references = decode_preds_and_references(
+                tokenizer=tokenizer,
+                preds=preds,
+                references=references,
+                safe_decode=False,
+            )
 
         raw_metrics = compute_raw_metrics(
             tokenizer=tokenizer,
@@ -0,0 +1,150 @@
+"""
+Batching by a token budget rather than by a fixed number of examples.
+
+The cost of a batch is estimated as the number of padded tokens it holds: the number of examples times the sum of the
+longest input and the longest expected output in it. A single token budget lets short verses be batched in large numbers,
+while the longest genealogies still fit into memory.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from datasets import Dataset
+from loguru import logger
+
+
+def get_expected_output_lengths(dset_split: Dataset, max_new_tokens: int) -> list[int]:
+    """
+    Estimate the number of tokens generated for each example.
+
+    Every verse produces exactly one target block per source word, so the length of the reference is a good estimate - the
+    worst case (`max_new_tokens`) is used if there are no references.
+    """
+    if "labels" not in dset_split.column_names:
+        return [max_new_tokens] * len(dset_split)
+    # +1 for the decoder start token
+    return [min(len(labels) + 1, max_new_tokens) for labels in dset_split["labels"]]
+
+
+def get_token_budget_schedule(
+    input_lengths: list[int],
+    output_lengths: list[int],
+    token_budget: int,
+    sort_by_length: bool = True,
+) -> list[list[int]]:
+    """
+    Split example indices into batches whose padded size (inputs + expected outputs) does not exceed the token budget.
+
+    An example which exceeds the budget on its own still gets a batch of its own. Sorting is stable and longest-first, just as
+    in `get_inference_schedule`.
+
+    >>> get_token_budget_schedule([3, 10, 1, 7], output_lengths=[3, 10, 1, 7], token_budget=40)
+    [[1, 3], [0, 2]]
+    >>> get_token_budget_schedule([3, 10, 1, 7], output_lengths=[3, 10, 1, 7], token_budget=20)
+    [[1], [3], [0, 2]]
+    >>> get_token_budget_schedule([3, 10, 1, 7], output_lengths=[3, 10, 1, 7], token_budget=40, sort_by_length=False)
+    [[0, 1], [2, 3]]
+    """
+    order = range(len(input_lengths))
+    if sort_by_length:
+        order = sorted(order, key=lambda idx: -input_lengths[idx])
+
+    schedule: list[list[int]] = []
+    batch: list[int] = []
+    max_input_length = max_output_length = 0
+    for idx in order:
+        new_max_input_length = max(max_input_length, input_lengths[idx])
+        new_max_output_length = max(max_output_length, output_lengths[idx])
+        if batch and (len(batch) + 1) * (new_max_input_length + new_max_output_length) > token_budget:
+            schedule.append(batch)
+            batch, new_max_input_length, new_max_output_length = [], input_lengths[idx], output_lengths[idx]
+        batch.append(idx)
+        max_input_length, max_output_length = new_max_input_length, new_max_output_length
+
+    if batch:
+        schedule.append(batch)
+    return schedule
+
+
+def probe_token_budget(
+    measure_peak_memory: Callable[[int], int | None],
+    memory_limit: int,
+    min_budget: int,
+    max_budget: int,
+    tolerance: float = 0.05,
+) -> int:
+    """
+    Find the largest token budget whose peak memory fits the limit.
+
+    `measure_peak_memory` runs the worst-case batch of a given budget and returns its peak memory in bytes (or None if it ran
+    out of memory). The budget is doubled until it no longer fits and then bisected until the bounds are within `tolerance`.
+
+    >>> probe_token_budget(lambda budget: 1000 + 10 * budget, memory_limit=11_000, min_budget=50, max_budget=10_000)
+    1000
+    >>> probe_token_budget(lambda budget: None if budget > 300 else budget, memory_limit=10**9, min_budget=50, max_budget=10_000)
+    300
+    >>> probe_token_budget(lambda budget: budget, memory_limit=10**9, min_budget=50, max_budget=1_000)
+    1000
+    """
+
+    def fits(budget: int) -> bool:
+        peak_memory = measure_peak_memory(budget)
+        logger.info(f"Probing the token budget: {budget = } {peak_memory = } {memory_limit = }")
+        return peak_memory is not None and peak_memory <= memory_limit
+
+    if not fits(min_budget):
+        logger.warning(f"Even the smallest token budget ({min_budget}) does not fit the memory limit, using it anyway")
+        return min_budget
+
+    good, bad = min_budget, None
+    while bad is None:
+        candidate = min(good * 2, max_budget)
+        if fits(candidate):
+            good = candidate
+            if candidate == max_budget:
+                return good
+        else:
+            bad = candidate
+
+    while (bad - good) / good > tolerance:
+        candidate = (good + bad) // 2
+        if fits(candidate):
+            good = candidate
+        else:
+            bad = candidate
+    return good
+
+
+class TokenBudgetCache:
+    """Token budgets found by probing, stored in a json file so that each setup is only probed once."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _load(self) -> dict[str, int]:
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, key: str) -> int | None:
+        return self._load().get(key)
+
+    def put(self, key: str, token_budget: int) -> None:
+        budgets = self._load() | {key: token_budget}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(budgets, indent=2, sort_keys=True))
+        tmp_path.replace(self.path)
+
+
+def get_max_token_budget(input_lengths: list[int], output_lengths: list[int]) -> int:
+    """
+    The budget which fits the whole split into a single batch - there is no point in probing beyond it.
+
+    >>> get_max_token_budget([3, 10, 1, 7], [4, 2, 1, 9])
+    76
+    """
+    return len(input_lengths) * (int(np.max(input_lengths)) + int(np.max(output_lengths)))
@@ -0,0 +1,94 @@
+"""
+Reuse of the encoder outputs across several generations from the same inputs.
+
+The encoder (including the morph embeddings) only depends on the inputs, so comparing e.g. greedy decoding with beam search
+on the same split does not need to encode every batch again. The encoder outputs are cached by the content of the inputs and
+kept on the device they were computed on, with the least recently used entries evicted once the cache outgrows its size limit.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import torch
+from transformers import AutoModelForSeq2SeqLM
+from transformers.modeling_outputs import BaseModelOutput
+
+DEFAULT_ENCODER_CACHE_SIZE_BYTES = 2 * 1024**3
+
+
+def get_inputs_key(inputs: dict[str, torch.Tensor]) -> str:
+    """
+    Hash the content of a collated batch.
+
+    >>> get_inputs_key({"input_ids": torch.tensor([[5, 6]])}) == get_inputs_key({"input_ids": torch.tensor([[5, 6]])})
+    True
+    >>> get_inputs_key({"input_ids": torch.tensor([[5, 6]])}) == get_inputs_key({"input_ids": torch.tensor([[5], [6]])})
+    False
+    """
+    digest = hashlib.sha256()
+    for column, tensor in sorted(inputs.items()):
+        digest.update(f"{column}:{tuple(tensor.shape)}:{tensor.dtype}".encode())
+        digest.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    return digest.hexdigest()
+
+
+def get_size_in_bytes(encoder_outputs: BaseModelOutput) -> int:
+    return sum(tensor.numel() * tensor.element_size() for tensor in encoder_outputs.values() if isinstance(tensor, torch.Tensor))
+
+
+class EncoderOutputCache:
+    """
+    A bounded LRU cache of encoder outputs, keyed by the content of the inputs.
+
+    The cached outputs are only valid for the model (and the autocast setting) they were computed with - use one cache per model.
+    """
+
+    def __init__(self, max_size_bytes: int):
+        self.max_size_bytes = max_size_bytes
+        self.size_bytes = 0
+        self.hits = self.misses = 0
+        self._entries: OrderedDict[str, BaseModelOutput] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> BaseModelOutput | None:
+        if (encoder_outputs := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return encoder_outputs
+
+    def put(self, key: str, encoder_outputs: BaseModelOutput) -> None:
+        if key in self._entries:
+            self.size_bytes -= get_size_in_bytes(self._entries.pop(key))
+        self._entries[key] = encoder_outputs
+        self.size_bytes += get_size_in_bytes(encoder_outputs)
+        # Always keep the newest entry, even if it exceeds the limit on its own - it is about to be used
+        while self.size_bytes > self.max_size_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= get_size_in_bytes(evicted)
+
+
+def encode(
+    model: AutoModelForSeq2SeqLM,
+    inputs: dict[str, torch.Tensor],
+    cache: EncoderOutputCache | None = None,
+) -> BaseModelOutput:
+    """
+    Run the encoder on a collated batch (already on the model's device), reusing the cached outputs if possible.
+
+    A fresh `BaseModelOutput` is returned on every call, since `generate` expands the encoder outputs of beam search in place.
+    The outputs are cached per attention implementation and autocast setting as well, which change their numerics.
+    """
+    key = None
+    if cache is not None:
+        use_sdpa = getattr(model.config, "use_sdpa", False)
+        autocast = torch.is_autocast_enabled() or torch.is_autocast_cpu_enabled()
+        key = f"{get_inputs_key(inputs)}:{use_sdpa=}:{autocast=}"
+    if cache is None or (encoder_outputs := cache.get(key)) is None:
+        encoder_outputs = model.get_encoder()(**inputs, return_dict=True)
+        if cache is not None:
+            cache.put(key, encoder_outputs)
+    return BaseModelOutput(**encoder_outputs)
@@ -0,0 +1,154 @@
+"""
+This module deals with running inference as a pipeline of overlapping stages.
+
+The collation of the next batch (producer thread), the generation of the current batch (calling thread) and the decoding of
+the already generated batches (consumer thread) run concurrently, connected by bounded queues.
+"""
+
+import dataclasses
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+import torch
+
+_END_OF_STREAM = object()
+_QUEUE_POLL_INTERVAL = 0.1
+
+
+@dataclasses.dataclass
+class InferenceBatch:
+    indices: list[int]  # positions of the examples in the dataset split
+    inputs: dict[str, torch.Tensor]
+
+
+@dataclasses.dataclass
+class InferenceResult:
+    indices: list[int]
+    predictions: np.ndarray | dict[str, np.ndarray]  # (batch_size, generated_length), or one such array per generation config
+    decoded: list[str] | dict[str, list[str]] | None = None
+
+
+class _Stage(threading.Thread):
+    """A daemon thread which keeps the exception it failed with, so that it can be re-raised by the calling thread."""
+
+    def __init__(self, target: Callable[[], None], name: str):
+        super().__init__(name=name, daemon=True)
+        self._stage_fn = target
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            self._stage_fn()
+        except BaseException as e:  # noqa: BLE001
+            self.error = e
+
+
+def _with_end_of_stream(batches: Iterable[InferenceBatch]) -> Iterator[object]:
+    yield from batches
+    yield _END_OF_STREAM
+
+
+def run_pipelined_inference(
+    batches: Iterable[InferenceBatch],
+    generate_fn: Callable[[dict[str, torch.Tensor]], torch.Tensor | dict[str, torch.Tensor]],
+    decode_fn: Callable[[np.ndarray], list[str]] | None = None,
+    queue_size: int = 2,
+) -> Iterator[InferenceResult]:
+    """
+    Run `generate_fn` over lazily collated `batches`, overlapping collation, generation and decoding.
+
+    `batches` is consumed by a prefetch thread, so the collation done by the iterable happens while the previous batch is being
+    generated. The generated ids are moved to the host (and decoded with `decode_fn`, if given) by a background thread.
+    `generate_fn` may also return several outputs keyed by name (e.g. one per generation config), each of which is then moved to
+    the host and decoded on its own. Results are yielded in the order of `batches`, and at most `queue_size` batches wait
+    between any two stages.
+    """
+    collated: queue.Queue = queue.Queue(maxsize=queue_size)
+    generated: queue.Queue = queue.Queue(maxsize=queue_size)
+    finished: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put_unless_stopped(target: queue.Queue, item: object) -> None:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        for item in _with_end_of_stream(batches):
+            put_unless_stopped(collated, item)
+            if stop.is_set():
+                return
+
+    def consume() -> None:
+        # Keeps draining the queue even after a failure, so that the generation stage never blocks on a full queue.
+        while (item := generated.get()) is not _END_OF_STREAM:
+            if consumer.error is not None or stop.is_set():
+                continue
+            indices, output = item
+            try:
+                if isinstance(output, dict):
+                    predictions = {name: output_ids.cpu().numpy() for name, output_ids in output.items()}
+                    decoded = {name: decode_fn(p) for name, p in predictions.items()} if decode_fn is not None else None
+                else:
+                    predictions = output.cpu().numpy()
+                    decoded = decode_fn(predictions) if decode_fn is not None else None
+            except BaseException as e:  # noqa: BLE001
+                consumer.error = e
+            else:
+                put_unless_stopped(finished, InferenceResult(indices=indices, predictions=predictions, decoded=decoded))
+
+    producer = _Stage(produce, name="inference-collate")
+    consumer = _Stage(consume, name="inference-decode")
+    producer.start()
+    consumer.start()
+
+    def yield_finished() -> Iterator[InferenceResult]:
+        while True:
+            try:
+                yield finished.get_nowait()
+            except queue.Empty:
+                return
+
+    def put_generated(item: object) -> Iterator[InferenceResult]:
+        # The decoding stage may itself wait for its results to be taken, so they are yielded while waiting for room
+        while True:
+            try:
+                generated.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                yield from yield_finished()
+
+    try:
+        while True:
+            try:
+                batch = collated.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                if producer.error is not None:
+                    raise producer.error
+                continue
+            if batch is _END_OF_STREAM:
+                break
+            if consumer.error is not None:
+                raise consumer.error
+
+            yield from put_generated((batch.indices, generate_fn(batch.inputs)))
+            yield from yield_finished()
+
+        yield from put_generated(_END_OF_STREAM)
+        while consumer.is_alive():
+            try:
+                yield finished.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        if consumer.error is not None:
+            raise consumer.error
+        yield from yield_finished()
+    finally:
+        stop.set()
+        if consumer.is_alive():
+            generated.put(_END_OF_STREAM)
@@ -0,0 +1,94 @@
+"""
+On-disk cache of the generated token ids, so that the benchmarks only recompute the metrics when nothing else changed.
+
+The predictions are stored as `.npy` files named after a key which covers everything the generated ids depend on: the model
+weights, the generation settings and the evaluated data. Once the cache outgrows its size limit, the least recently used
+entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+from datasets import Dataset
+from loguru import logger
+
+
+def compute_model_fingerprint(model: torch.nn.Module) -> str:
+    """Hash the raw bytes of all the model weights (and buffers), regardless of their dtype and device."""
+    digest = hashlib.sha256()
+    for name, tensor in sorted(model.state_dict().items()):
+        digest.update(name.encode())
+        digest.update(str(tensor.dtype).encode())
+        digest.update(str(tuple(tensor.shape)).encode())
+        digest.update(tensor.detach().contiguous().reshape(-1).view(torch.uint8).cpu().numpy().tobytes())
+    return digest.hexdigest()
+
+
+def compute_split_fingerprint(dset_split: Dataset, columns: list[str]) -> str:
+    """Hash the model inputs of a split, so that a change in the preprocessing invalidates the cached predictions."""
+    digest = hashlib.sha256()
+    for column in columns:
+        digest.update(column.encode())
+        for row in dset_split.with_format("numpy")[column]:
+            digest.update(np.asarray(row, dtype=np.int64).tobytes())
+            digest.update(b"|")
+    return digest.hexdigest()
+
+
+def get_prediction_cache_key(**components: Any) -> str:
+    """
+    Combine the components the predictions depend on into a single cache key.
+
+    >>> get_prediction_cache_key(model="abc", split="test") == get_prediction_cache_key(split="test", model="abc")
+    True
+    >>> get_prediction_cache_key(model="abc", split="test") == get_prediction_cache_key(model="abc", split="bench")
+    False
+    """
+    return hashlib.sha256(json.dumps(components, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class PredictionCache:
+    def __init__(self, cache_dir: Path, max_size_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npy"
+
+    def get(self, key: str) -> np.ndarray | None:
+        path = self._path(key)
+        try:
+            predictions = np.load(path)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        # Mark the entry as recently used, the eviction goes by modification time
+        os.utime(path)
+        logger.info(f"Reusing cached predictions from {path = }")
+        return predictions
+
+    def put(self, key: str, predictions: np.ndarray) -> None:
+        path = self._path(key)
+        # Write to a temporary file first, so that a concurrent reader never sees a partially written entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, predictions)
+        tmp_path.replace(path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within its size limit."""
+        entries = sorted(self.cache_dir.glob("*.npy"), key=lambda p: p.stat().st_mtime)
+        total_size = sum(entry.stat().st_size for entry in entries)
+        # Never evict the newest entry, even if it exceeds the limit on its own
+        for entry in entries[:-1]:
+            if total_size <= self.max_size_bytes:
+                break
+            total_size -= entry.stat().st_size
+            entry.unlink(missing_ok=True)
+            logger.info(f"Evicted {entry = } from the prediction cache")
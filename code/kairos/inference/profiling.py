@@ -0,0 +1,101 @@
+"""
+Timing and memory bookkeeping used by the performance benchmarks.
+
+All timings are wall-clock seconds. On CUDA the device is synchronized before every reading, so that the asynchronously
+launched kernels are attributed to the stage which launched them.
+"""
+
+import contextlib
+import resource
+import sys
+import time
+from collections import defaultdict
+from typing import Iterator
+
+import numpy as np
+import torch
+from transformers import StoppingCriteria
+
+
+def synchronize(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    """
+    Summarize a list of latencies (in seconds).
+
+    >>> summarize_latencies([0.1, 0.2, 0.3, 0.4])
+    {'total': 1.0, 'mean': 0.25, 'p50': 0.25, 'p95': 0.385, 'max': 0.4, 'count': 4}
+    >>> summarize_latencies([])
+    {'total': 0.0, 'count': 0}
+    """
+    if not latencies:
+        return {"total": 0.0, "count": 0}
+    arr = np.array(latencies)
+    return {
+        "total": round(float(arr.sum()), 6),
+        "mean": round(float(arr.mean()), 6),
+        "p50": round(float(np.percentile(arr, 50)), 6),
+        "p95": round(float(np.percentile(arr, 95)), 6),
+        "max": round(float(arr.max()), 6),
+        "count": len(arr),
+    }
+
+
+class StageTimer:
+    """Accumulates the durations of named stages, e.g. `with timer.stage("collate"): ...`."""
+
+    def __init__(self, device: torch.device):
+        self.device = device
+        self.durations: dict[str, list[float]] = defaultdict(list)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        synchronize(self.device)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            synchronize(self.device)
+            self.durations[name].append(time.perf_counter() - start)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {name: summarize_latencies(durations) for name, durations in self.durations.items()}
+
+
+class DecodeStepTimer(StoppingCriteria):
+    """
+    Never stops the generation - only records the moment each decoding step finishes.
+
+    `generate` calls the stopping criteria once per generated token, which lets us measure the time to the first token
+    without reimplementing the decoding loop.
+    """
+
+    def __init__(self, device: torch.device):
+        self.device = device
+        self.step_times: list[float] = []
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> bool:
+        synchronize(self.device)
+        self.step_times.append(time.perf_counter())
+        return False
+
+
+def reset_peak_memory(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.reset_peak_memory_stats(device)
+
+
+def get_peak_memory_mb(device: torch.device) -> float:
+    """
+    Peak memory in MiB - allocated by torch on CUDA, resident set size of the whole process on CPU.
+
+    Unlike the CUDA counter, the peak RSS of a process cannot be reset, so on CPU it is a high-water mark of the whole run.
+    """
+    if device.type == "cuda":
+        return round(torch.cuda.max_memory_allocated(device) / 2**20, 1)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux
+    return round(max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10, 1)
@@ -0,0 +1,152 @@
+"""
+Inference sharded across several CPU worker processes.
+
+Each worker runs `batch_inference` over a contiguous shard of the split, pinned to its own share of the CPU cores. The model
+weights are moved to shared memory before the workers are spawned, so the workers map the very same weights instead of each
+holding a copy of its own.
+"""
+
+import dataclasses
+import os
+import queue
+import traceback
+from typing import Any
+
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from datasets import Dataset
+from loguru import logger
+from transformers import AutoModelForSeq2SeqLM, EvalPrediction, T5TokenizerFast
+
+from kairos.config import SINGLETON, Config, LogConf, get_config
+
+_RESULT_POLL_INTERVAL = 1.0
+
+
+def get_shard_bounds(num_examples: int, num_shards: int) -> list[tuple[int, int]]:
+    """
+    Split `range(num_examples)` into contiguous shards of (almost) equal size.
+
+    >>> get_shard_bounds(10, num_shards=3)
+    [(0, 4), (4, 7), (7, 10)]
+    >>> get_shard_bounds(2, num_shards=3)
+    [(0, 1), (1, 2)]
+    """
+    num_shards = min(num_shards, num_examples) or 1
+    shard_size, remainder = divmod(num_examples, num_shards)
+    bounds, start = [], 0
+    for i_shard in range(num_shards):
+        end = start + shard_size + (i_shard < remainder)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def get_core_assignment(cores: list[int], num_workers: int, threads_per_worker: int | None = None) -> list[list[int]]:
+    """
+    Assign disjoint, contiguous sets of cores to the workers.
+
+    >>> get_core_assignment(list(range(8)), num_workers=3)
+    [[0, 1], [2, 3], [4, 5]]
+    >>> get_core_assignment(list(range(8)), num_workers=2, threads_per_worker=3)
+    [[0, 1, 2], [3, 4, 5]]
+    """
+    threads_per_worker = threads_per_worker or max(len(cores) // num_workers, 1)
+    if threads_per_worker * num_workers > len(cores):
+        logger.warning(f"{num_workers} workers x {threads_per_worker} threads oversubscribe the {len(cores)} available cores")
+    return [
+        [cores[(i_worker * threads_per_worker + i_thread) % len(cores)] for i_thread in range(threads_per_worker)]
+        for i_worker in range(num_workers)
+    ]
+
+
+def _get_picklable_config() -> Config:
+    # The neptune run cannot be sent to the workers, and they do not log to it anyway
+    return dataclasses.replace(get_config(), logconf=LogConf())
+
+
+def _inference_worker(
+    i_worker: int,
+    config: Config,
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    shard: Dataset,
+    cores: list[int],
+    inference_kwargs: dict[str, Any],
+    results: mp.Queue,
+) -> None:
+    # Imported here to avoid a circular import - the benchmarks use the sharded inference
+    from kairos.benchmark import batch_inference
+
+    try:
+        SINGLETON.config = config
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cores)
+        torch.set_num_threads(len(cores))
+        eval_pred = batch_inference(model=model, tokenizer=tokenizer, dset_split=shard, device="cpu", **inference_kwargs)
+        results.put((i_worker, eval_pred.predictions, None))
+    except Exception:
+        results.put((i_worker, None, traceback.format_exc()))
+
+
+def run_sharded_inference(
+    model: AutoModelForSeq2SeqLM,
+    tokenizer: T5TokenizerFast,
+    dset_split: Dataset,
+    num_workers: int,
+    threads_per_worker: int | None = None,
+    **inference_kwargs: Any,
+) -> EvalPrediction:
+    """
+    Run `batch_inference` on CPU in `num_workers` processes, each over a contiguous shard of the split.
+
+    The predictions are merged back in the original order, so the result is the same `EvalPrediction` that `batch_inference`
+    would return. `inference_kwargs` are passed on to `batch_inference`.
+    """
+    # Imported here to avoid a circular import - the benchmarks use the sharded inference
+    from kairos.benchmark import pad_arrays_to_same_length, pad_labels
+
+    shard_bounds = get_shard_bounds(len(dset_split), num_shards=num_workers)
+    available_cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    core_assignment = get_core_assignment(available_cores, num_workers=len(shard_bounds), threads_per_worker=threads_per_worker)
+    logger.info(f"Running sharded inference: {shard_bounds = } {core_assignment = }")
+
+    model = model.to("cpu").share_memory()
+    config = _get_picklable_config()
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_inference_worker,
+            args=(i_worker, config, model, tokenizer, dset_split.select(range(start, end)), cores, inference_kwargs, results),
+            daemon=True,
+        )
+        for i_worker, ((start, end), cores) in enumerate(zip(shard_bounds, core_assignment))
+    ]
+    for worker in workers:
+        worker.start()
+
+    shard_predictions: dict[int, np.ndarray] = {}
+    try:
+        while len(shard_predictions) < len(workers):
+            try:
+                i_worker, predictions, error = results.get(timeout=_RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                if dead := [i for i, w in enumerate(workers) if i not in shard_predictions and w.exitcode not in (None, 0)]:
+                    raise RuntimeError(f"Inference workers {dead} died without returning their predictions") from None
+                continue
+            if error is not None:
+                raise RuntimeError(f"Inference worker {i_worker} failed:\n{error}")
+            shard_predictions[i_worker] = predictions
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+
+    # Rows of each shard are in the original order already, and so are the shards
+    rows = [row for i_worker in range(len(workers)) for row in shard_predictions[i_worker]]
+    inferences_padded = pad_arrays_to_same_length(rows, pad_token_id=tokenizer.pad_token_id)
+    labels_padded = pad_labels(dset_split, pad_token_id=tokenizer.pad_token_id)
+    return EvalPrediction(predictions=inferences_padded, label_ids=labels_padded)
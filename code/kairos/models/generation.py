@@ -2,7 +2,21 @@
 This module deals with generation-related logic.
 """
 
-from kairos.config import Checkpoint, Language, get_config
+from typing import Any
+
+import torch
+from transformers import (
+    LogitsProcessor,
+    LogitsProcessorList,
+    PreTrainedModel,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    T5TokenizerFast,
+)
+
+from kairos.config import SOURCE_BLOCK_SEP_TOKEN, TARGET_BLOCK_SEP_TOKEN, Checkpoint, Language, get_config
+from kairos.data.sentinel_tokens import get_sentinel_token_id
+from kairos.models.vocabulary import TargetVocabulary
 
 
 def calculate_generation_max_length(checkpoint: Checkpoint, language: Language) -> int:
@@ -50,3 +64,125 @@ def get_generation_max_length() -> int:
             get_config().source_conf.language,
         )
     return get_config().train_conf.generation_max_length
+
+
+def count_separators(input_ids: torch.Tensor, separator_token_id: int) -> torch.Tensor:
+    """
+    Count the block separators in each row of a batch.
+
+    >>> count_separators(torch.tensor([[5, 3, 6, 3, 7, 1], [5, 3, 6, 1, 0, 0]]), separator_token_id=3)
+    tensor([2, 1])
+    """
+    return (input_ids == separator_token_id).sum(dim=-1)
+
+
+class _BlockCount:
+    """
+    Shared bookkeeping of the block-count-aware generation helpers.
+
+    An interlinear target has exactly one block per source word, so a source with `n` source block separators should produce
+    exactly `n` target block separators. The expected counts are computed once from the (unexpanded) encoder inputs and
+    repeated for beam search / sampling with `num_return_sequences > 1`, which expand the batch in place.
+    """
+
+    def __init__(
+        self,
+        source_input_ids: torch.Tensor,
+        source_block_sep_token_id: int,
+        target_block_sep_token_id: int,
+        eos_token_id: int,
+    ):
+        self.expected_separators = count_separators(source_input_ids, source_block_sep_token_id)
+        self.target_block_sep_token_id = target_block_sep_token_id
+        self.eos_token_id = eos_token_id
+
+    def get_expected_separators(self, input_ids: torch.Tensor) -> torch.Tensor:
+        expected = self.expected_separators.to(input_ids.device)
+        if (num_expanded := input_ids.shape[0] // expected.shape[0]) > 1:
+            expected = expected.repeat_interleave(num_expanded)
+        return expected
+
+    def has_all_blocks(self, input_ids: torch.Tensor) -> torch.Tensor:
+        return count_separators(input_ids, self.target_block_sep_token_id) >= self.get_expected_separators(input_ids)
+
+
+class BlockCountLogitsProcessor(_BlockCount, LogitsProcessor):
+    """
+    Ends a sequence once it has emitted as many target blocks as its source has words.
+
+    As soon as a sequence has emitted all of its target block separators, the separator can no longer be chosen - whatever
+    probability mass the model puts on opening yet another block is moved to the eos token instead.
+    """
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        done = self.has_all_blocks(input_ids)
+        if done.any():
+            sep_scores = scores[done, self.target_block_sep_token_id]
+            scores[done, self.eos_token_id] = torch.logaddexp(scores[done, self.eos_token_id], sep_scores)
+            scores[done, self.target_block_sep_token_id] = -float("inf")
+        return scores
+
+
+class BlockCountStoppingCriteria(_BlockCount, StoppingCriteria):
+    """
+    Stops the generation once every sequence has either finished or started a block its source does not have.
+
+    On its own it only cuts the runaway generation short (the surplus blocks still need to be trimmed); combined with
+    `BlockCountLogitsProcessor` every sequence ends with the eos token in place of the surplus block.
+    """
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> bool:
+        overflown = count_separators(input_ids, self.target_block_sep_token_id) > self.get_expected_separators(input_ids)
+        finished = (input_ids[:, 1:] == self.eos_token_id).any(dim=-1)
+        return bool((overflown | finished).all())
+
+
+def get_block_count_generation_kwargs(
+    tokenizer: T5TokenizerFast,
+    source_input_ids: torch.Tensor,
+    target_vocabulary: TargetVocabulary | None = None,
+) -> dict[str, LogitsProcessorList | StoppingCriteriaList]:
+    """
+    Build the `model.generate` kwargs that stop each sequence once it has as many target blocks as its source.
+
+    The target token ids are mapped to the `target_vocabulary` of a trimmed model, see `TargetVocabularyMixin`.
+    """
+    target_block_sep_token_id = get_sentinel_token_id(tokenizer, TARGET_BLOCK_SEP_TOKEN)
+    eos_token_id = tokenizer.eos_token_id
+    if target_vocabulary is not None:
+        target_block_sep_token_id, eos_token_id = target_vocabulary.to_reduced(
+            torch.tensor([target_block_sep_token_id, eos_token_id])
+        ).tolist()
+    block_count_kwargs = dict(
+        source_input_ids=source_input_ids,
+        source_block_sep_token_id=get_sentinel_token_id(tokenizer, SOURCE_BLOCK_SEP_TOKEN),
+        target_block_sep_token_id=target_block_sep_token_id,
+        eos_token_id=eos_token_id,
+    )
+    return {
+        "logits_processor": LogitsProcessorList([BlockCountLogitsProcessor(**block_count_kwargs)]),
+        "stopping_criteria": StoppingCriteriaList([BlockCountStoppingCriteria(**block_count_kwargs)]),
+    }
+
+
+def get_assisted_generation_kwargs(
+    draft_model: PreTrainedModel,
+    encoder_kwargs: dict[str, torch.Tensor],
+    num_draft_tokens: int,
+) -> dict[str, Any]:
+    """
+    Build the `model.generate` kwargs of speculative (assisted) decoding with a draft model.
+
+    The draft model proposes `num_draft_tokens` tokens (adjusted by `generate` as the proposals get accepted or rejected) and
+    the model verifies all of them in a single forward pass, so greedy search produces the same sequences as without the
+    draft model. The draft encoder is run here on the same encoder inputs as the model's, `input_morphs` included.
+    `generate` only supports assisted decoding of a single sequence at a time.
+
+    transformers 4.31 reads the draft length from `max_assistant_tokens` of the draft model, later releases from its
+    generation config. Both are set, which also resets the length `generate` adjusted in place during the previous call.
+    """
+    draft_model.max_assistant_tokens = num_draft_tokens
+    draft_model.generation_config.num_assistant_tokens = num_draft_tokens
+    with torch.inference_mode():
+        assistant_encoder_outputs = draft_model.get_encoder()(**encoder_kwargs, return_dict=True)
+    return {"assistant_model": draft_model, "assistant_encoder_outputs": assistant_encoder_outputs}
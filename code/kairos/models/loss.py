@@ -0,0 +1,41 @@
+"""
+This module deals with the cross-entropy loss of the morph model which never materializes the logits of all the labels.
+"""
+
+import torch
+from torch import nn
+from torch.nn.functional import cross_entropy
+from torch.utils.checkpoint import checkpoint
+
+
+def chunked_cross_entropy(
+    sequence_output: torch.Tensor,
+    lm_head: nn.Module,
+    labels: torch.Tensor,
+    chunk_size: int,
+    ignore_index: int = -100,
+) -> torch.Tensor:
+    """
+    Mean cross-entropy of `lm_head(sequence_output)` against `labels`, computed `chunk_size` label positions at a time.
+
+    Only the logits of a single chunk exist at any time: when gradients are enabled every chunk is checkpointed, so its
+    logits are recomputed in the backward pass instead of being kept for it. The result equals
+    `CrossEntropyLoss(ignore_index=ignore_index)` applied to the full logits, up to the order the losses are summed in.
+
+    Args:
+        sequence_output: Decoder outputs, already rescaled if the embeddings are tied, of shape `(batch, length, d_model)`
+        lm_head: The output projection onto the vocabulary
+        labels: Target token ids of shape `(batch, length)`, positions set to `ignore_index` do not count
+        chunk_size: Number of label positions (across the whole batch) whose logits are computed at once
+    """
+    sequence_output = sequence_output.reshape(-1, sequence_output.shape[-1])
+    labels = labels.reshape(-1).to(sequence_output.device)
+
+    def chunk_loss(chunk_output: torch.Tensor, chunk_labels: torch.Tensor) -> torch.Tensor:
+        return cross_entropy(lm_head(chunk_output), chunk_labels, ignore_index=ignore_index, reduction="sum")
+
+    loss = 0.0
+    for start in range(0, labels.shape[0], chunk_size):
+        chunk = (sequence_output[start : start + chunk_size], labels[start : start + chunk_size])
+        loss = loss + (checkpoint(chunk_loss, *chunk, use_reentrant=False) if torch.is_grad_enabled() else chunk_loss(*chunk))
+    return loss / (labels != ignore_index).sum()
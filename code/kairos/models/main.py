@@ -1,7 +1,15 @@
-from transformers import AutoModelForSeq2SeqLM, T5ForConditionalGeneration, T5TokenizerFast
+from pathlib import Path
+from typing import Any
 
-from kairos.config import SINGLETON, SourceType, get_config
+from loguru import logger
+from torch import nn
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, T5ForConditionalGeneration, T5TokenizerFast
+
+from kairos.config import SINGLETON, MorphSpecificConf, SourceType, get_config
+from kairos.data.morph_tokenizer import get_morph_tokenizer
+from kairos.models.modeling_morph_mt5 import MT5Attention
 from kairos.models.modeling_morph_mt5 import MT5ForConditionalGeneration as MT5MorphsForConditionalGeneration
+from kairos.models.vocabulary import TargetVocabulary, TargetVocabularyMixin
 
 
 def get_model(
@@ -11,12 +19,82 @@ def get_model(
     checkpoint = get_config().source_conf.checkpoint
     match source_type:
         case SourceType.TEXT_ONLY | SourceType.TEXT_WITH_POS:
+            if get_config().train_conf.loss_chunk_size is not None:
+                logger.warning("Only the morph model computes a chunked loss, the full logits loss will be used")
             model = AutoModelForSeq2SeqLM.from_pretrained(checkpoint.value)
         case SourceType.TEXT_WITH_POS_EMBEDDINGS:
             assert SINGLETON.config is not None
             assert SINGLETON.config.morph_conf is not None
-            model = MT5MorphsForConditionalGeneration.from_pretrained(checkpoint.value)
+            model = MT5MorphsForConditionalGeneration.from_pretrained(
+                checkpoint.value,
+                loss_chunk_size=get_config().train_conf.loss_chunk_size,
+                **get_morph_config_kwargs(SINGLETON.config.morph_conf),
+            )
         case _:
             assert False
     model.resize_token_embeddings(len(tokenizer))
     return model
+
+
+def get_morph_config_kwargs(morph_conf: MorphSpecificConf) -> dict[str, Any]:
+    """
+    The morph settings recorded on the morph model's config. The model builds its morph embeddings from them (see
+    `kairos.models.modeling_morph_mt5.get_morph_embeddings`), so it does not depend on the global config once constructed.
+    """
+    return dict(
+        morph_arch=morph_conf.arch.value,
+        morph_vocabulary_size=get_morph_tokenizer().vocabulary_size,
+        morph_compressed_embedding_size=morph_conf.compressed_embedding_size,
+        morph_pos_embedding_dim=morph_conf.pos_embedding_dim,
+        use_sdpa=morph_conf.sdpa_attention,
+    )
+
+
+def get_draft_model(checkpoint: Path | str, model: nn.Module) -> T5ForConditionalGeneration:
+    """
+    Load the draft model of speculative decoding: a smaller model fine-tuned with the same tokenizer and inputs as `model`.
+
+    A morph draft model is built from the morph settings saved in its config, see `get_morph_config_kwargs`.
+    """
+    if hasattr(AutoConfig.from_pretrained(checkpoint), "morph_arch"):
+        draft_model = MT5MorphsForConditionalGeneration.from_pretrained(checkpoint)
+    else:
+        draft_model = AutoModelForSeq2SeqLM.from_pretrained(checkpoint)
+    if is_morph_model(draft_model) != is_morph_model(model):
+        raise ValueError("The draft model must take the same inputs as the model, either both or neither of them morph models")
+    for attr in ("vocab_size", "morph_vocabulary_size"):
+        if getattr(draft_model.config, attr, None) != getattr(model.config, attr, None):
+            raise ValueError(f"The draft model must share the vocabularies of the model, but their {attr} differ")
+    return draft_model.eval()
+
+
+def is_morph_model(model: nn.Module) -> bool:
+    return isinstance(model, MT5MorphsForConditionalGeneration)
+
+
+def supports_static_kv_cache(model: nn.Module) -> bool:
+    """Whether the model can decode with a `StaticKVCache` (only the morph model can)."""
+    return isinstance(model, MT5MorphsForConditionalGeneration)
+
+
+def supports_target_vocabulary_trimming(model: nn.Module) -> bool:
+    """Whether the output vocabulary of the model can be trimmed to its targets (only the morph model's can)."""
+    return isinstance(model, TargetVocabularyMixin)
+
+
+def get_target_vocabulary(model: nn.Module) -> TargetVocabulary | None:
+    """The target vocabulary the model was trimmed to, None if it decodes over the full vocabulary."""
+    return getattr(model, "target_vocabulary", None)
+
+
+def has_sdpa_attention(model: nn.Module) -> bool:
+    """Whether the model's attention can be switched to the fused SDPA path (only the morph model's can)."""
+    return any(isinstance(module, MT5Attention) for module in model.modules())
+
+
+def set_sdpa_attention(model: nn.Module, enabled: bool) -> None:
+    """Switch all the attention modules of the morph model between the eager and the fused (SDPA) attention."""
+    model.config.use_sdpa = enabled
+    for module in model.modules():
+        if isinstance(module, MT5Attention):
+            module.use_sdpa = enabled
@@ -17,7 +17,9 @@ PyTorch mT5 model.
 Copied from transformers.morph.mt5.
 """
 
+import abc
 import copy
+import functools
 import math
 import os
 import warnings
@@ -47,15 +49,19 @@ from transformers.utils import (
 )
 from transformers.utils.model_parallel_utils import assert_device_map, get_device_map
 
-from kairos.config import SINGLETON
 from kairos.config import MorphArchitecture as Arch
-from kairos.data.morph_tokenizer import get_morph_tokenizer
+from kairos.models.cache import StaticKVCache, StaticKVCacheLayer
+from kairos.models.loss import chunked_cross_entropy
+from kairos.models.vocabulary import TargetVocabularyMixin
 
 logger = logging.get_logger(__name__)
 
 _CONFIG_FOR_DOC = "MT5Config"
 _CHECKPOINT_FOR_DOC = "mt5-small"
 
+# Number of key lengths whose relative position buckets of a single (incremental decoding) query are memoized
+RELATIVE_POSITION_BUCKETS_CACHE_SIZE = 1024
+
 
 PARALLELIZE_DOCSTRING = r"""
     This is an experimental feature and is a subject to change at a moment's notice.
@@ -226,6 +232,8 @@ class MT5Attention(nn.Module):
             self.relative_attention_bias = nn.Embedding(self.relative_attention_num_buckets, self.n_heads)
         self.pruned_heads: set[int] = set()
         self.gradient_checkpointing = False
+        # Use the fused torch.nn.functional.scaled_dot_product_attention instead of the eager attention
+        self.use_sdpa = getattr(config, "use_sdpa", False)
 
     def prune_heads(self, heads: list[int]) -> None:
         if len(heads) == 0:
@@ -288,19 +296,53 @@ class MT5Attention(nn.Module):
         relative_buckets += torch.where(is_small, relative_position, relative_position_if_large)
         return relative_buckets
 
-    def compute_bias(self, query_length, key_length, device=None):
-        """Compute binned relative position bias."""
-        if device is None:
-            device = self.relative_attention_bias.weight.device
-        context_position = torch.arange(query_length, dtype=torch.long, device=device)[:, None]
+    @staticmethod
+    def _get_relative_position_buckets(query_length, key_length, bidirectional, num_buckets, max_distance, device):
+        """Relative position buckets of the last `query_length` query positions over `key_length` key positions."""
+        context_position = torch.arange(key_length - query_length, key_length, dtype=torch.long, device=device)[:, None]
         memory_position = torch.arange(key_length, dtype=torch.long, device=device)[None, :]
         relative_position = memory_position - context_position  # shape (query_length, key_length)
-        relative_position_bucket = self._relative_position_bucket(
+        return MT5Attention._relative_position_bucket(
             relative_position,  # shape (query_length, key_length)
-            bidirectional=(not self.is_decoder),
-            num_buckets=self.relative_attention_num_buckets,
-            max_distance=self.relative_attention_max_distance,
+            bidirectional=bidirectional,
+            num_buckets=num_buckets,
+            max_distance=max_distance,
         )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=RELATIVE_POSITION_BUCKETS_CACHE_SIZE)
+    def _get_single_query_relative_position_buckets(key_length, bidirectional, num_buckets, max_distance, device):
+        """
+        Relative position buckets of the last query position over `key_length` key positions.
+
+        In incremental decoding, they are memoized instead of being recomputed at every generated token. Only the
+        buckets of a single query are, so that every cached tensor holds `key_length` integers. They are created outside
+        of inference mode, so that they can be used for training afterwards.
+        """
+        with torch.inference_mode(False):
+            return MT5Attention._get_relative_position_buckets(
+                1, key_length, bidirectional, num_buckets, max_distance, device
+            )
+
+    def compute_bias(self, query_length, key_length, device=None):
+        """
+        Compute binned relative position bias.
+
+        Only the last `query_length` query positions are computed - in incremental decoding, the single new position.
+        """
+        if device is None:
+            device = self.relative_attention_bias.weight.device
+        bucket_kwargs = {
+            "bidirectional": not self.is_decoder,
+            "num_buckets": self.relative_attention_num_buckets,
+            "max_distance": self.relative_attention_max_distance,
+            "device": device,
+        }
+        # The buckets become part of the compiled graph, there is no point in tracing through the cache
+        if query_length == 1 and not torch._dynamo.is_compiling():
+            relative_position_bucket = self._get_single_query_relative_position_buckets(key_length, **bucket_kwargs)
+        else:
+            relative_position_bucket = self._get_relative_position_buckets(query_length, key_length, **bucket_kwargs)
         values = self.relative_attention_bias(relative_position_bucket)  # shape (query_length, key_length, num_heads)
         values = values.permute([2, 0, 1]).unsqueeze(0)  # shape (1, num_heads, query_length, key_length)
         return values
@@ -325,6 +367,13 @@ class MT5Attention(nn.Module):
 
         real_seq_length = seq_length
 
+        if isinstance(past_key_value, StaticKVCacheLayer):
+            # The past self-attention states are written to / read from the preallocated buffers of the cache instead
+            static_cache, past_key_value = past_key_value, None
+            real_seq_length += static_cache.get_seq_length()
+        else:
+            static_cache = None
+
         if past_key_value is not None:
             assert (
                 len(past_key_value) == 2
@@ -374,26 +423,20 @@ class MT5Attention(nn.Module):
         # get key/value states
         key_states = project(hidden_states, self.k, key_value_states, past_key_value[0] if past_key_value is not None else None)
         value_states = project(hidden_states, self.v, key_value_states, past_key_value[1] if past_key_value is not None else None)
-
-        # compute scores
-        scores = torch.matmul(
-            query_states, key_states.transpose(3, 2)
-        )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
+        if static_cache is not None:
+            key_states, value_states = static_cache.update(key_states, value_states)
 
         if position_bias is None:
+            # if key and values are already calculated
+            # we want only the last query position bias
             if not self.has_relative_attention_bias:
                 position_bias = torch.zeros(
-                    (1, self.n_heads, real_seq_length, key_length), device=scores.device, dtype=scores.dtype
+                    (1, self.n_heads, seq_length, key_length), device=query_states.device, dtype=query_states.dtype
                 )
                 if self.gradient_checkpointing and self.training:
                     position_bias.requires_grad = True
             else:
-                position_bias = self.compute_bias(real_seq_length, key_length, device=scores.device)
-
-            # if key and values are already calculated
-            # we want only the last query position bias
-            if past_key_value is not None:
-                position_bias = position_bias[:, :, -hidden_states.size(1) :, :]
+                position_bias = self.compute_bias(seq_length, key_length, device=query_states.device)
 
             if mask is not None:
                 position_bias = position_bias + mask  # (batch_size, n_heads, seq_length, key_length)
@@ -405,20 +448,38 @@ class MT5Attention(nn.Module):
         else:
             position_bias_masked = position_bias
 
-        scores += position_bias_masked
-        attn_weights = nn.functional.softmax(scores.float(), dim=-1).type_as(
-            scores
-        )  # (batch_size, n_heads, seq_length, key_length)
-        attn_weights = nn.functional.dropout(
-            attn_weights, p=self.dropout, training=self.training
-        )  # (batch_size, n_heads, seq_length, key_length)
-
-        # Mask heads if we want to
-        if layer_head_mask is not None:
-            attn_weights = attn_weights * layer_head_mask
-
-        attn_output = unshape(torch.matmul(attn_weights, value_states))  # (batch_size, seq_length, dim)
-        attn_output = self.o(attn_output)
+        if self.use_sdpa and not output_attentions and layer_head_mask is None:
+            # The position bias (with the mask already added) is passed as the additive attention mask, so that the scores
+            # are never materialized. T5 does not scale the scores, hence scale=1.
+            attn_output = nn.functional.scaled_dot_product_attention(
+                query_states,
+                key_states,
+                value_states,
+                attn_mask=position_bias_masked.to(query_states.dtype),
+                dropout_p=self.dropout if self.training else 0.0,
+                scale=1.0,
+            )  # (batch_size, n_heads, seq_length, dim_per_head)
+            attn_weights = None
+        else:
+            # compute scores
+            scores = torch.matmul(
+                query_states, key_states.transpose(3, 2)
+            )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
+            scores += position_bias_masked
+            attn_weights = nn.functional.softmax(scores.float(), dim=-1).type_as(
+                scores
+            )  # (batch_size, n_heads, seq_length, key_length)
+            attn_weights = nn.functional.dropout(
+                attn_weights, p=self.dropout, training=self.training
+            )  # (batch_size, n_heads, seq_length, key_length)
+
+            # Mask heads if we want to
+            if layer_head_mask is not None:
+                attn_weights = attn_weights * layer_head_mask
+
+            attn_output = torch.matmul(attn_weights, value_states)
+
+        attn_output = self.o(unshape(attn_output))  # (batch_size, seq_length, dim)
 
         present_key_value_state = (key_states, value_states) if (self.is_decoder and use_cache) else None
         outputs = (attn_output,) + (present_key_value_state,) + (position_bias,)
@@ -525,7 +586,9 @@ class MT5Block(nn.Module):
         output_attentions=False,
         return_dict=True,
     ):
-        if past_key_value is not None:
+        if isinstance(past_key_value, StaticKVCacheLayer):
+            self_attn_past_key_value, cross_attn_past_key_value = past_key_value, past_key_value.cross_attention_states
+        elif past_key_value is not None:
             if not self.is_decoder:
                 logger.warning("`past_key_values` is passed to the encoder. Please make sure this is intended.")
             expected_num_past_key_values = 2 if encoder_hidden_states is None else 4
@@ -611,6 +674,117 @@ class MT5Block(nn.Module):
         return outputs  # hidden-states, present_key_value_states, (self-attention position bias), (self-attention weights), (cross-attention position bias), (cross-attention weights)
 
 
+class MT5MorphEmbeddings(nn.Module, abc.ABC):
+    """
+    Input embeddings of the morph encoder: the token embeddings combined with the embeddings of the morph tags.
+
+    There is one subclass per morph architecture, picked once from the model config by `get_morph_embeddings`, so the forward
+    pass neither dispatches on the architecture nor reads the global config - which keeps it traceable by `torch.compile`.
+    """
+
+    @abc.abstractmethod
+    def forward(self, embed_tokens: nn.Embedding, input_ids: torch.Tensor, input_morphs: torch.Tensor) -> torch.Tensor:
+        ...
+
+    def fold(self, embed_tokens: nn.Embedding) -> "MT5MorphEmbeddings":
+        """
+        The same embeddings with their layers precomputed into lookup tables, see `MT5PreTrainedModel.fold_morph_embeddings`.
+        """
+        return self
+
+
+class MT5SumMorphEmbeddings(MT5MorphEmbeddings):
+    """`Arch.SIMPLE_SUM`, and the folded `Arch.AUTOENCODER`: the morph embeddings are added to the token embeddings."""
+
+    def __init__(self, embed_morphs: nn.Embedding):
+        super().__init__()
+        self.embed_morphs = embed_morphs
+
+    def forward(self, embed_tokens: nn.Embedding, input_ids: torch.Tensor, input_morphs: torch.Tensor) -> torch.Tensor:
+        return embed_tokens(input_ids) + self.embed_morphs(input_morphs)
+
+
+class MT5AutoencoderMorphEmbeddings(MT5MorphEmbeddings):
+    """`Arch.AUTOENCODER`: the morph embeddings go through a bottleneck before being added to the token embeddings."""
+
+    def __init__(self, compress_morphs: nn.Embedding, decompress_morphs: nn.Linear):
+        super().__init__()
+        self.compress_morphs = compress_morphs
+        self.decompress_morphs = decompress_morphs
+
+    def forward(self, embed_tokens: nn.Embedding, input_ids: torch.Tensor, input_morphs: torch.Tensor) -> torch.Tensor:
+        return embed_tokens(input_ids) + self.decompress_morphs(self.compress_morphs(input_morphs))
+
+    def fold(self, embed_tokens: nn.Embedding) -> MT5MorphEmbeddings:
+        morph_table = self.decompress_morphs(self.compress_morphs.weight)  # (morph_vocabulary_size, d_model)
+        return MT5SumMorphEmbeddings(nn.Embedding.from_pretrained(morph_table, freeze=False))
+
+
+class MT5ConcatMorphEmbeddings(MT5MorphEmbeddings):
+    """`Arch.CONCATENATE`: the token embeddings are projected to a smaller size and concatenated with the morph embeddings."""
+
+    def __init__(self, compress_words: nn.Linear, embed_morphs: nn.Embedding):
+        super().__init__()
+        self.compress_words = compress_words
+        self.embed_morphs = embed_morphs
+
+    def forward(self, embed_tokens: nn.Embedding, input_ids: torch.Tensor, input_morphs: torch.Tensor) -> torch.Tensor:
+        # The dimensions are (batch_size, sequence length, embed dim), we concatenate along the last one
+        return torch.concat((self.compress_words(embed_tokens(input_ids)), self.embed_morphs(input_morphs)), dim=-1)
+
+    def fold(self, embed_tokens: nn.Embedding) -> MT5MorphEmbeddings:
+        word_table = self.compress_words(embed_tokens.weight)  # (vocab_size, d_model - morph_pos_embedding_dim)
+        return MT5FoldedConcatMorphEmbeddings(nn.Embedding.from_pretrained(word_table, freeze=False), self.embed_morphs)
+
+
+class MT5FoldedConcatMorphEmbeddings(MT5MorphEmbeddings):
+    """The folded `Arch.CONCATENATE`: the projected token embeddings are looked up directly."""
+
+    def __init__(self, embed_words: nn.Embedding, embed_morphs: nn.Embedding):
+        super().__init__()
+        self.embed_words = embed_words
+        self.embed_morphs = embed_morphs
+
+    def forward(self, embed_tokens: nn.Embedding, input_ids: torch.Tensor, input_morphs: torch.Tensor) -> torch.Tensor:
+        return torch.concat((self.embed_words(input_ids), self.embed_morphs(input_morphs)), dim=-1)
+
+
+def get_morph_embeddings(config: MT5Config) -> MT5MorphEmbeddings:
+    """
+    Build the morph embeddings of the encoder from the morph settings recorded on the config, see
+    `kairos.models.main.get_morph_config_kwargs`.
+    """
+    vocabulary_size = config.morph_vocabulary_size
+    match Arch(config.morph_arch), getattr(config, "morph_folded_embeddings", False):
+        case (Arch.SIMPLE_SUM, _) | (Arch.AUTOENCODER, True):
+            return MT5SumMorphEmbeddings(nn.Embedding(num_embeddings=vocabulary_size, embedding_dim=config.d_model))
+        case Arch.AUTOENCODER, False:
+            return MT5AutoencoderMorphEmbeddings(
+                nn.Embedding(num_embeddings=vocabulary_size, embedding_dim=config.morph_compressed_embedding_size),
+                nn.Linear(config.morph_compressed_embedding_size, config.d_model),
+            )
+        case Arch.CONCATENATE, True:
+            return MT5FoldedConcatMorphEmbeddings(
+                nn.Embedding(num_embeddings=config.vocab_size, embedding_dim=config.d_model - config.morph_pos_embedding_dim),
+                nn.Embedding(num_embeddings=vocabulary_size, embedding_dim=config.morph_pos_embedding_dim),
+            )
+        case Arch.CONCATENATE, False:
+            return MT5ConcatMorphEmbeddings(
+                nn.Linear(in_features=config.d_model, out_features=config.d_model - config.morph_pos_embedding_dim),
+                nn.Embedding(num_embeddings=vocabulary_size, embedding_dim=config.morph_pos_embedding_dim),
+            )
+        case _:
+            assert False
+
+
+def _rename_legacy_morph_keys(state_dict, prefix, *args) -> None:
+    """Load checkpoints saved when the morph layers were attributes of the stack (`morph_<layer>` instead of `morph_embeddings.<layer>`)."""
+    for key in list(state_dict):
+        name = key.removeprefix(prefix)
+        if key.startswith(prefix) and name.startswith("morph_") and not name.startswith("morph_embeddings."):
+            state_dict[f"{prefix}morph_embeddings.{name.removeprefix('morph_')}"] = state_dict.pop(key)
+
+
 def load_tf_weights_in_mt5(model, config, tf_checkpoint_path):
     """Load tf checkpoints in a pytorch model."""
     try:
@@ -735,6 +909,19 @@ class MT5PreTrainedModel(PreTrainedModel):
         }
         return dummy_inputs
 
+    def fold_morph_embeddings(self) -> None:
+        """
+        Fold the morph layers of the encoder into a single lookup table, for inference.
+
+        With the autoencoder architecture, `compress_morphs` (an embedding) followed by `decompress_morphs` (a linear layer)
+        is a linear function of the morph tag, so the decompressed embedding of every tag is computed once and the encoder input
+        becomes a single gather. With the concatenation architecture, `compress_words` is a constant function of the token id,
+        so the projected word table is computed once and the encoder input becomes two gathers and a concat.
+        The config is updated as well, so that the folded model can be saved and loaded with `from_pretrained`.
+        """
+        self.get_encoder().fold_morph_embeddings()
+        self.config.morph_folded_embeddings = True
+
     def _init_weights(self, module):
         """Initialize the weights."""
         factor = self.config.initializer_factor  # Used for testing weights initialization
@@ -821,29 +1008,10 @@ class MT5Stack(MT5PreTrainedModel):
 
         self.embed_tokens = embed_tokens
         self.is_decoder = config.is_decoder
-        morph_config = SINGLETON.config.morph_conf
         if not self.is_decoder:
             # Morphs
-            vocabulary_size = get_morph_tokenizer().vocabulary_size
-            match morph_config.arch:
-                case Arch.SIMPLE_SUM:
-                    self.morph_embed_morphs = nn.Embedding(num_embeddings=vocabulary_size, embedding_dim=config.d_model)
-                case Arch.AUTOENCODER:
-                    self.morph_compress_morphs = nn.Embedding(
-                        num_embeddings=vocabulary_size, embedding_dim=morph_config.compressed_embedding_size
-                    )
-                    self.morph_decompress_morphs = nn.Linear(morph_config.compressed_embedding_size, config.d_model)
-                case Arch.CONCATENATE:
-                    compressed_word_emb_dim = config.d_model - morph_config.pos_embedding_dim
-                    self.morph_compress_words = nn.Linear(
-                        in_features=self.embed_tokens.embedding_dim,
-                        out_features=compressed_word_emb_dim,
-                    )
-                    self.morph_embed_morphs = nn.Embedding(
-                        num_embeddings=vocabulary_size, embedding_dim=morph_config.pos_embedding_dim
-                    )
-                case _:
-                    assert False
+            self.morph_embeddings = get_morph_embeddings(config)
+            self._register_load_state_dict_pre_hook(_rename_legacy_morph_keys)
 
         self.block = nn.ModuleList([MT5Block(config, has_relative_attention_bias=bool(i == 0)) for i in range(config.num_layers)])
         self.final_layer_norm = MT5LayerNorm(config.d_model, eps=config.layer_norm_epsilon)
@@ -875,10 +1043,8 @@ class MT5Stack(MT5PreTrainedModel):
         self.embed_tokens = self.embed_tokens.to(self.first_device)
 
         # Morph
-        for attr, value in self.__dict__.items():
-            if attr.startswith("morph_"):
-                logger.info(f"Moving {attr} to {self.first_device}...")
-                setattr(self, attr, value.to(self.first_device))
+        if not self.is_decoder:
+            self.morph_embeddings = self.morph_embeddings.to(self.first_device)
 
         # Set final layer norm to last device
         self.final_layer_norm = self.final_layer_norm.to(self.last_device)
@@ -896,10 +1062,8 @@ class MT5Stack(MT5PreTrainedModel):
         self.embed_tokens = self.embed_tokens.to("cpu")
 
         # Morph
-        for attr, value in self.__dict__.items():
-            if attr.startswith("morph_"):
-                logger.info(f"Moving {attr} to cpu...")
-                setattr(self, attr, value.to("cpu"))
+        if not self.is_decoder:
+            self.morph_embeddings = self.morph_embeddings.to("cpu")
 
         self.final_layer_norm = self.final_layer_norm.to("cpu")
         torch.cuda.empty_cache()
@@ -910,6 +1074,13 @@ class MT5Stack(MT5PreTrainedModel):
     def set_input_embeddings(self, new_embeddings):
         self.embed_tokens = new_embeddings
 
+    @torch.no_grad()
+    def fold_morph_embeddings(self) -> None:
+        if self.is_decoder:
+            return
+        self.morph_embeddings = self.morph_embeddings.fold(self.embed_tokens)
+        self.config.morph_folded_embeddings = True
+
     def forward(
         self,
         input_ids: torch.Tensor | None = None,
@@ -932,10 +1103,8 @@ class MT5Stack(MT5PreTrainedModel):
             self.embed_tokens = self.embed_tokens.to(self.first_device)
 
             # Morph
-            for attr, value in self.__dict__.items():
-                if attr.startswith("morph_"):
-                    logger.info(f"Moving {attr} to {self.first_device}...")
-                    setattr(self, attr, value.to(self.first_device))
+            if not self.is_decoder:
+                self.morph_embeddings = self.morph_embeddings.to(self.first_device)
 
         use_cache = use_cache if use_cache is not None else self.config.use_cache
         output_attentions = output_attentions if output_attentions is not None else self.config.output_attentions
@@ -967,35 +1136,25 @@ class MT5Stack(MT5PreTrainedModel):
 
         if inputs_embeds is None:
             assert self.embed_tokens is not None, "You have to initialize the model with valid token embeddings"
-            inputs_embeds = self.embed_tokens(input_ids)
-            if not self.is_decoder:
+            if self.is_decoder:
+                inputs_embeds = self.embed_tokens(input_ids)
+            else:
                 assert input_morphs is not None
                 # Morph
-                assert SINGLETON.config is not None
-                assert (morph_config := SINGLETON.config.morph_conf) is not None
-
-                match morph_config.arch:
-                    case Arch.SIMPLE_SUM:
-                        inputs_morphs = self.morph_embed_morphs(input_morphs)
-                        inputs_embeds += inputs_morphs
-                    case Arch.AUTOENCODER:
-                        compressed_morphs = self.morph_compress_morphs(input_morphs)
-                        decompressed_morphs = self.morph_decompress_morphs(compressed_morphs)
-                        inputs_embeds += decompressed_morphs
-                    case Arch.CONCATENATE:
-                        compressed_inputs_embeds: torch.Tensor = self.morph_compress_words(inputs_embeds)
-                        embedded_morphs: torch.Tensor = self.morph_embed_morphs(input_morphs)
-
-                        # We want to concatenate along the last dimension
-                        # The dimensions are (batch_size, sequence length, embed dim)
-                        inputs_embeds = torch.concat((compressed_inputs_embeds, embedded_morphs), dim=-1)
-                    case _:
-                        assert False
+                inputs_embeds = self.morph_embeddings(self.embed_tokens, input_ids, input_morphs)
 
         batch_size, seq_length = input_shape
 
         # required mask seq length can be calculated via length of past
-        mask_seq_length = past_key_values[0][0].shape[2] + seq_length if past_key_values is not None else seq_length
+        if isinstance(past_key_values, StaticKVCache) and not self.is_decoder:
+            # `generate` passes the model kwargs on to the encoder as well, but the cache only holds the decoder states
+            past_key_values = None
+        if isinstance(past_key_values, StaticKVCache):
+            static_cache, past_key_values = past_key_values, past_key_values.layers(len(self.block))
+            mask_seq_length = static_cache.get_seq_length() + seq_length
+        else:
+            static_cache = None
+            mask_seq_length = past_key_values[0][0].shape[2] + seq_length if past_key_values is not None else seq_length
 
         if use_cache is True:
             assert self.is_decoder, f"`use_cache` can only be set to `True` if {self} is used as a decoder"
@@ -1115,6 +1274,8 @@ class MT5Stack(MT5PreTrainedModel):
             # append next layer key value states
             if use_cache:
                 present_key_value_states = present_key_value_states + (present_key_value_state,)  # type: ignore
+                if static_cache is not None and encoder_hidden_states is not None:
+                    static_cache.set_cross_attention_states(i, present_key_value_state[2:])
 
             if output_attentions:
                 all_attentions = all_attentions + (layer_outputs[3],)  # type: ignore
@@ -1127,6 +1288,9 @@ class MT5Stack(MT5PreTrainedModel):
                     if i == v[-1] and "cuda:" + str(k) != self.last_device:
                         hidden_states = hidden_states.to("cuda:" + str(k + 1))
 
+        if static_cache is not None and use_cache:
+            present_key_value_states = static_cache
+
         hidden_states = self.final_layer_norm(hidden_states)
         hidden_states = self.dropout(hidden_states)
 
@@ -1548,7 +1712,7 @@ class MT5Model(MT5PreTrainedModel):
 
 
 @add_start_docstrings("""MT5 Model with a `language modeling` head on top.""", MT5_START_DOCSTRING)
-class MT5ForConditionalGeneration(MT5PreTrainedModel):
+class MT5ForConditionalGeneration(TargetVocabularyMixin, MT5PreTrainedModel):
     r"""
     Examples:
     ```python
@@ -1607,7 +1771,7 @@ class MT5ForConditionalGeneration(MT5PreTrainedModel):
             self.logged_grads: set[int] = set()
 
         for layer, weights in self.named_parameters():
-            if layer in ("encoder.embed_morphs.weight", "shared.weight"):
+            if layer in ("encoder.morph_embeddings.embed_morphs.weight", "shared.weight"):
                 save_grads(layer)
 
         super().zero_grad(set_to_none=set_to_none)
@@ -1825,13 +1989,17 @@ class MT5ForConditionalGeneration(MT5PreTrainedModel):
             # See https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/transformer/transformer.py#L586
             sequence_output = sequence_output * (self.model_dim**-0.5)
 
-        lm_logits = self.lm_head(sequence_output)
-
         loss = None
-        if labels is not None:
-            loss_fct = CrossEntropyLoss(ignore_index=-100)
-            loss = loss_fct(lm_logits.view(-1, lm_logits.size(-1)), labels.view(-1))
-            # TODO(thom): Add z_loss https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/layers.py#L666
+        if labels is not None and (loss_chunk_size := getattr(self.config, "loss_chunk_size", None)) is not None:
+            # The logits of the whole label sequence are never materialized, so none are returned
+            lm_logits = None
+            loss = chunked_cross_entropy(sequence_output, self.lm_head, labels, chunk_size=loss_chunk_size)
+        else:
+            lm_logits = self.lm_head(sequence_output)
+            if labels is not None:
+                loss_fct = CrossEntropyLoss(ignore_index=-100)
+                loss = loss_fct(lm_logits.view(-1, lm_logits.size(-1)), labels.view(-1))
+                # TODO(thom): Add z_loss https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/layers.py#L666
 
         if not return_dict:
             output = (lm_logits,) + decoder_outputs[1:] + encoder_outputs
@@ -1863,8 +2031,13 @@ class MT5ForConditionalGeneration(MT5PreTrainedModel):
         **kwargs,
     ):
         # cut decoder_input_ids if past is used
-        if past_key_values is not None:
-            input_ids = input_ids[:, -1:]
+        if isinstance(past_key_values, StaticKVCache):
+            input_ids = input_ids[:, past_key_values.get_seq_length() :]
+        elif past_key_values is not None:
+            past_length = past_key_values[0][0].shape[2]
+            # Assisted (speculative) decoding passes all the tokens the draft model proposed, the other methods only the last one
+            remove_prefix_length = past_length if input_ids.shape[1] > past_length else input_ids.shape[1] - 1
+            input_ids = input_ids[:, remove_prefix_length:]
 
         return {
             "decoder_input_ids": input_ids,
@@ -1889,16 +2062,23 @@ class MT5ForConditionalGeneration(MT5PreTrainedModel):
             logger.warning("You might want to consider setting `use_cache=True` to speed up decoding")
             return past
 
+        if isinstance(past, StaticKVCache):
+            past.reorder_cache(beam_idx)
+            return past
+
         reordered_decoder_past = ()
         for layer_past_states in past:
             # get the correct batch idx from layer past batch dim
             # batch dim of `past` is at 2nd position
             reordered_layer_past_states = ()
-            for layer_past_state in layer_past_states:
-                # need to set correct `past` for each of the four key / value states
+            for layer_past_state in layer_past_states[:2]:
+                # need to set correct `past` for the self-attention key / value states
                 reordered_layer_past_states = reordered_layer_past_states + (
                     layer_past_state.index_select(0, beam_idx.to(layer_past_state.device)),
                 )
+            # the cross-attention key / value states are the same for all the beams of an example, and beams are only ever
+            # reordered within an example, so they are kept as they are
+            reordered_layer_past_states = reordered_layer_past_states + tuple(layer_past_states[2:])
 
             assert reordered_layer_past_states[0].shape == layer_past_states[0].shape
             assert len(reordered_layer_past_states) == len(layer_past_states)
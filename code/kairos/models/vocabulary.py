@@ -0,0 +1,123 @@
+"""
+This module deals with the reduced target vocabulary of the morph model, for a cheaper output projection when decoding.
+"""
+
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import torch
+from torch import nn
+
+
+class TargetVocabulary:
+    """
+    The token ids a model's targets are made of, and the mapping between them and the positions of a reduced vocabulary.
+
+    mT5 has a vocabulary of 250k tokens, but the targets of a single language only use a small fraction of it. With the
+    output projection (`lm_head`) and the decoder embeddings sliced to the target vocabulary (see
+    `TargetVocabularyMixin.trim_target_vocabulary`), every decoding step computes `len(vocabulary)` logits instead.
+
+    Example:
+        ```python
+        vocabulary = TargetVocabulary.from_labels(train_labels, special_token_ids=tokenizer.all_special_ids)
+        vocabulary.save("target_vocabulary.json")
+        model.trim_target_vocabulary(TargetVocabulary.load("target_vocabulary.json"))
+        ```
+
+    Args:
+        token_ids: Token ids (of the full vocabulary) the model can generate
+    """
+
+    def __init__(self, token_ids: Iterable[int]):
+        self.token_ids = torch.tensor(sorted(set(token_ids)), dtype=torch.long)
+
+    @classmethod
+    def from_labels(cls, labels: Iterable[Sequence[int]], special_token_ids: Iterable[int] = ()) -> "TargetVocabulary":
+        """
+        Collect the token ids of tokenized targets. Ignored positions (negative ids, e.g. `-100`) are skipped.
+
+        Args:
+            labels: Tokenized targets, e.g. the `labels` column of the training data
+            special_token_ids: Ids the model must be able to generate even if no target contains them, e.g. eos
+        """
+        token_ids = set(special_token_ids)
+        for sequence in labels:
+            token_ids.update(token_id for token_id in sequence if token_id >= 0)
+        return cls(token_ids)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "TargetVocabulary":
+        return cls(json.loads(Path(path).read_text()))
+
+    def save(self, path: Path | str) -> None:
+        Path(path).write_text(json.dumps(self.token_ids.tolist()))
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def to_reduced(self, token_ids: torch.Tensor) -> torch.Tensor:
+        """Map ids of the full vocabulary to ids of the reduced one. Raises a `ValueError` for ids it does not hold."""
+        vocabulary = self.token_ids.to(token_ids.device)
+        reduced = torch.searchsorted(vocabulary, token_ids).clamp(max=len(vocabulary) - 1)
+        if not torch.equal(vocabulary[reduced], token_ids):
+            raise ValueError("Some of the token ids are not in the target vocabulary")
+        return reduced
+
+    def to_full(self, token_ids: torch.Tensor) -> torch.Tensor:
+        """Map ids of the reduced vocabulary back to ids of the full one."""
+        return self.token_ids.to(token_ids.device)[token_ids]
+
+
+class TargetVocabularyMixin:
+    """
+    Lets the morph model decode over a reduced target vocabulary.
+
+    Once trimmed, the model generates ids of the reduced vocabulary internally, but `generate` takes and returns ids
+    of the full vocabulary, so the outputs decode with the tokenizer as before. Logits processors and stopping criteria
+    see the reduced ids - use `target_vocabulary.to_reduced` for the token ids they are built with, as
+    `get_block_count_generation_kwargs` does. Trimming is meant for inference: the forward pass with `labels` and
+    `save_pretrained` are not supported by a trimmed model, save the `TargetVocabulary` next to the full checkpoint.
+    """
+
+    target_vocabulary: TargetVocabulary | None = None
+
+    @torch.no_grad()
+    def trim_target_vocabulary(self, target_vocabulary: TargetVocabulary) -> None:
+        """
+        Slice the output projection and the decoder embeddings to the target vocabulary.
+
+        The encoder keeps the full token embeddings. The special token ids of the generation config are mapped to the
+        reduced vocabulary, which has to contain them.
+        """
+        if self.target_vocabulary is not None:
+            raise ValueError("The model's target vocabulary has already been trimmed")
+        token_ids = target_vocabulary.token_ids.to(self.lm_head.weight.device)
+        decoder = self.get_decoder()
+        decoder_embeddings = decoder.get_input_embeddings().weight[token_ids]
+        decoder.set_input_embeddings(nn.Embedding.from_pretrained(decoder_embeddings, freeze=False))
+        lm_head = nn.Linear(self.lm_head.in_features, len(target_vocabulary), bias=False)
+        lm_head.weight = nn.Parameter(self.lm_head.weight[token_ids])
+        self.lm_head = lm_head
+
+        for name in ("decoder_start_token_id", "pad_token_id", "eos_token_id", "bos_token_id"):
+            if (token_id := getattr(self.generation_config, name, None)) is not None:
+                reduced = target_vocabulary.to_reduced(torch.tensor(token_id))
+                setattr(self.generation_config, name, reduced.tolist())
+        self.target_vocabulary = target_vocabulary
+
+    def generate(self, *args, **kwargs):
+        if self.target_vocabulary is None:
+            return super().generate(*args, **kwargs)
+        if (decoder_input_ids := kwargs.get("decoder_input_ids")) is not None:
+            kwargs["decoder_input_ids"] = self.target_vocabulary.to_reduced(decoder_input_ids)
+        outputs = super().generate(*args, **kwargs)
+        if isinstance(outputs, torch.Tensor):
+            return self.target_vocabulary.to_full(outputs)
+        outputs.sequences = self.target_vocabulary.to_full(outputs.sequences)
+        return outputs
+
+    def save_pretrained(self, *args, **kwargs):
+        if self.target_vocabulary is not None:
+            raise ValueError("A model with a trimmed target vocabulary cannot be saved, save its TargetVocabulary")
+        return super().save_pretrained(*args, **kwargs)
@@ -2,6 +2,7 @@ import argparse
 import os
 from enum import Enum
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from loguru import logger
@@ -10,6 +11,8 @@ from kairos.config import (
     SINGLETON,
     Checkpoint,
     Config,
+    InferenceConf,
+    InferenceDevice,
     Language,
     LogConf,
     MorphArchitecture,
@@ -114,6 +117,11 @@ parser.add_argument(
     default=64,
 )
 parser.add_argument("--pos_embedding_dim", type=int, default=64)
+parser.add_argument(
+    "--sdpa_attention",
+    action="store_true",
+    help="If passed, the morph model computes attention with the fused torch scaled_dot_product_attention",
+)
 
 parser.add_argument(
     "--num_train_samples",
@@ -190,6 +198,180 @@ train_parser.add_argument(
     default=TrainConf.generation_max_length,
     help="The `max_length` to use on each evaluation loop when `predict_with_generate=True`",
 )
+train_parser.add_argument(
+    "--loss_chunk_size",
+    type=int,
+    default=TrainConf.loss_chunk_size,
+    help="morph model only: compute the loss this many label positions at a time, never materializing the full logits",
+)
+
+inference_parser = parser.add_argument_group("Inference")
+inference_parser.add_argument(
+    "--inference_device",
+    type=str,
+    choices=get_enum_values_for_parser(InferenceDevice),
+    default=InferenceConf.device.value,
+    help="device to run the benchmarks on",
+)
+inference_parser.add_argument(
+    "--inference_batch_size",
+    type=int,
+    default=InferenceConf.batch_size,
+    help="batch size used for the benchmarks, defaults to --eval_batch_size",
+)
+inference_parser.add_argument(
+    "--inference_num_threads",
+    type=int,
+    default=InferenceConf.num_threads,
+    help="number of intra-op threads used for CPU inference",
+)
+inference_parser.add_argument(
+    "--inference_num_interop_threads",
+    type=int,
+    default=InferenceConf.num_interop_threads,
+    help="number of inter-op threads used for CPU inference",
+)
+inference_parser.add_argument(
+    "--inference_bf16",
+    action="store_true",
+    help="If passed, the benchmarks will run under bf16 autocast",
+)
+inference_parser.add_argument(
+    "--inference_block_count_stopping",
+    action="store_true",
+    help="If passed, each generated sequence ends once it has as many target blocks as its source has words",
+)
+inference_parser.add_argument(
+    "--inference_performance",
+    action="store_true",
+    help="If passed, the benchmarks will also measure the throughput, latency and peak memory of the inference",
+)
+inference_parser.add_argument(
+    "--inference_performance_batch_sizes",
+    type=int,
+    default=[],
+    nargs="+",
+    help="batch sizes to measure the performance for, defaults to --inference_batch_size",
+)
+inference_parser.add_argument(
+    "--inference_warmup_batches",
+    type=int,
+    default=InferenceConf.warmup_batches,
+    help="number of batches run before each performance measurement",
+)
+inference_parser.add_argument(
+    "--inference_seed",
+    type=int,
+    default=InferenceConf.seed,
+    help="seed set before each performance measurement",
+)
+inference_parser.add_argument(
+    "--inference_prediction_cache_dir",
+    type=str,
+    default=None,
+    help="directory to cache the generated predictions in, defaults to $KAIROS_PREDICTION_CACHE_DIR (disabled if unset)",
+)
+inference_parser.add_argument(
+    "--inference_prediction_cache_max_size_gb",
+    type=float,
+    default=InferenceConf.prediction_cache_max_size_gb,
+    help="the least recently used predictions are evicted once the cache grows beyond this size",
+)
+inference_parser.add_argument(
+    "--inference_token_budget",
+    type=int,
+    default=None,
+    help="If passed, the benchmark batches are sized by this number of padded input + expected output tokens",
+)
+inference_parser.add_argument(
+    "--inference_auto_token_budget",
+    action="store_true",
+    help="If passed, the largest token budget that fits the memory limit is probed for (CUDA only)",
+)
+inference_parser.add_argument(
+    "--inference_memory_limit_fraction",
+    type=float,
+    default=InferenceConf.memory_limit_fraction,
+    help="fraction of the device memory the probed token budget may use",
+)
+inference_parser.add_argument(
+    "--inference_token_budget_cache_file",
+    type=str,
+    default=None,
+    help="json file to cache the probed token budgets in, defaults to $KAIROS_TOKEN_BUDGET_CACHE_FILE (disabled if unset)",
+)
+inference_parser.add_argument(
+    "--inference_num_workers",
+    type=int,
+    default=InferenceConf.num_workers,
+    help="number of worker processes to shard the CPU inference across",
+)
+inference_parser.add_argument(
+    "--inference_threads_per_worker",
+    type=int,
+    default=InferenceConf.threads_per_worker,
+    help="number of cores pinned to each worker process, defaults to an equal share of the available cores",
+)
+inference_parser.add_argument(
+    "--inference_attention_benchmark",
+    action="store_true",
+    help="If passed, the benchmarks will also compare the eager and the fused (SDPA) attention of the morph model",
+)
+inference_parser.add_argument(
+    "--inference_static_kv_cache",
+    action="store_true",
+    help="If passed, the morph model decodes with a key/value cache preallocated for the maximum generation length",
+)
+inference_parser.add_argument(
+    "--inference_beam_search_benchmark",
+    action="store_true",
+    help="If passed, the benchmarks will also measure the performance of beam search with each of the given beam counts",
+)
+inference_parser.add_argument(
+    "--inference_beam_search_num_beams",
+    type=int,
+    default=InferenceConf().beam_search_num_beams,
+    nargs="+",
+    help="beam counts to measure the performance of beam search for",
+)
+inference_parser.add_argument(
+    "--inference_fold_morph_embeddings",
+    action="store_true",
+    help="If passed, the morph layers of the encoder are folded into lookup tables before running the benchmarks",
+)
+inference_parser.add_argument(
+    "--inference_compile_benchmark",
+    action="store_true",
+    help="If passed, the benchmarks will also compare the eager and the compiled (torch.compile) morph model",
+)
+inference_parser.add_argument(
+    "--inference_draft_checkpoint",
+    type=str,
+    default=None,
+    help="path to a smaller fine-tuned model (same tokenizer and inputs) proposing tokens for speculative decoding",
+)
+inference_parser.add_argument(
+    "--inference_num_draft_tokens",
+    type=int,
+    default=InferenceConf.num_draft_tokens,
+    help="initial number of tokens the draft model proposes per step",
+)
+inference_parser.add_argument(
+    "--inference_speculative_benchmark",
+    action="store_true",
+    help="If passed, the benchmarks will also compare greedy decoding with and without the draft model",
+)
+inference_parser.add_argument(
+    "--inference_trim_target_vocabulary",
+    action="store_true",
+    help="If passed, the output vocabulary of the morph model is trimmed to the train targets before running the benchmarks",
+)
+inference_parser.add_argument(
+    "--inference_target_vocabulary_file",
+    type=str,
+    default=None,
+    help="file the trimmed target vocabulary is loaded from if it exists, and saved to otherwise",
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -226,6 +408,7 @@ def parse_args_into_config() -> Config:
         learning_rate=args.learning_rate,
         generation_max_length=args.generation_max_length,
         num_train_samples=args.num_train_samples,
+        loss_chunk_size=args.loss_chunk_size,
     )
     if source_config.source_type == SourceType.TEXT_WITH_POS_EMBEDDINGS:
         morph_config = MorphSpecificConf(
@@ -235,10 +418,47 @@ def parse_args_into_config() -> Config:
             morph_learning_rate=args.morph_learning_rate,
             compressed_embedding_size=args.compressed_embedding_size,
             pos_embedding_dim=args.pos_embedding_dim,
+            sdpa_attention=args.sdpa_attention,
         )
     else:
         morph_config = None
 
+    prediction_cache_dir = args.inference_prediction_cache_dir or os.getenv("KAIROS_PREDICTION_CACHE_DIR")
+    token_budget_cache_file = args.inference_token_budget_cache_file or os.getenv("KAIROS_TOKEN_BUDGET_CACHE_FILE")
+    draft_checkpoint = args.inference_draft_checkpoint
+    target_vocabulary_file = args.inference_target_vocabulary_file
+    inference_config = InferenceConf(
+        device=parse_values_into_enum(InferenceDevice, args.inference_device),
+        batch_size=args.inference_batch_size,
+        num_threads=args.inference_num_threads,
+        num_interop_threads=args.inference_num_interop_threads,
+        bf16_autocast=args.inference_bf16,
+        block_count_stopping=args.inference_block_count_stopping,
+        performance_benchmark=args.inference_performance,
+        performance_batch_sizes=args.inference_performance_batch_sizes,
+        warmup_batches=args.inference_warmup_batches,
+        seed=args.inference_seed,
+        prediction_cache_dir=Path(prediction_cache_dir) if prediction_cache_dir else None,
+        prediction_cache_max_size_gb=args.inference_prediction_cache_max_size_gb,
+        token_budget=args.inference_token_budget,
+        auto_token_budget=args.inference_auto_token_budget,
+        memory_limit_fraction=args.inference_memory_limit_fraction,
+        token_budget_cache_file=Path(token_budget_cache_file) if token_budget_cache_file else None,
+        num_workers=args.inference_num_workers,
+        threads_per_worker=args.inference_threads_per_worker,
+        attention_benchmark=args.inference_attention_benchmark,
+        static_kv_cache=args.inference_static_kv_cache,
+        beam_search_benchmark=args.inference_beam_search_benchmark,
+        beam_search_num_beams=args.inference_beam_search_num_beams,
+        fold_morph_embeddings=args.inference_fold_morph_embeddings,
+        compile_benchmark=args.inference_compile_benchmark,
+        draft_checkpoint=Path(draft_checkpoint) if draft_checkpoint else None,
+        num_draft_tokens=args.inference_num_draft_tokens,
+        speculative_benchmark=args.inference_speculative_benchmark,
+        trim_target_vocabulary=args.inference_trim_target_vocabulary,
+        target_vocabulary_file=Path(target_vocabulary_file) if target_vocabulary_file else None,
+    )
+
     SINGLETON.args = args
     SINGLETON.is_dry_run = args.dry_run
     if SINGLETON.is_dry_run:
@@ -250,6 +470,7 @@ def parse_args_into_config() -> Config:
         logconf=logging_config,
         train_conf=training_config,
         morph_conf=morph_config,
+        inference_conf=inference_config,
         tags=args.tags,
         neptune_run_id=neptune_run_id,
         is_dry_run=SINGLETON.is_dry_run,
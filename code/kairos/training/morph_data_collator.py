@@ -1,12 +1,17 @@
 import dataclasses
 
+import numpy as np
 import torch
 from transformers import BatchEncoding, DataCollatorForSeq2Seq
+from transformers.utils import PaddingStrategy
 
 from kairos.config import SourceType
+from kairos.data.collation import pad_sequences
 from kairos.data.morph_tokenizer import get_morph_tokenizer
-from kairos.data.tokenize import FINAL_INPUT_MORPHS
-from kairos.utils.common import pad_to_desired_length
+from kairos.data.tokenize import FINAL_INPUT_IDS, FINAL_INPUT_MASK, FINAL_INPUT_MORPHS, FINAL_LABELS
+
+# Columns padded without going through the tokenizer, features with any other column are padded by the tokenizer
+COLLATED_COLUMNS = {FINAL_INPUT_IDS, FINAL_INPUT_MASK, FINAL_INPUT_MORPHS, FINAL_LABELS}
 
 
 @dataclasses.dataclass
@@ -14,33 +19,87 @@ class PosEmbeddingAwareDataCollator(DataCollatorForSeq2Seq):
     """
     DataCollatorForSeq2Seq but aware of another kind of input - input_morphs.
 
-    This data collator is able to handle a parallel input to `input_ids`, namely `input_morphs`. The collator behaves as a regular
-    `DataCollatorForSeq2Seq` would do for the standard features of the BatchEncoding. Once the padded batch is received from the
-    call to the superclass, the MorphDataCollator forms an `input_morphs` tensor by padding the inputs received.
+    This data collator is able to handle a parallel input to `input_ids`, namely `input_morphs`. The collator pads the same
+    features a regular `DataCollatorForSeq2Seq` would do (the labels with `label_pad_token_id` to the longest labels,
+    followed by the `decoder_input_ids` if the model can prepare them) on the `padding_side` of the tokenizer and pads
+    `input_morphs` to the length of `input_ids`.
+
+    Instead of padding row by row, each column is concatenated once and scattered into a preallocated tensor, see
+    `pad_sequences`. The inputs are int32 and the labels int64, as required by the loss. Features with other columns are
+    padded by the tokenizer, as in `DataCollatorForSeq2Seq`.
     """
 
     source_type: SourceType | None = None
 
-    def __call__(self, features: BatchEncoding, return_tensors=None) -> BatchEncoding:
-        if self.source_type != SourceType.TEXT_WITH_POS_EMBEDDINGS:
+    def get_padded_length(self, lengths: list[int], pad_to_max_length: bool = False) -> int:
+        length = max(lengths)
+        if pad_to_max_length and self.max_length is not None:
+            length = max(length, self.max_length)
+        if self.pad_to_multiple_of is not None:
+            length = -(-length // self.pad_to_multiple_of) * self.pad_to_multiple_of
+        return length
+
+    def pad_morphs(self, morphs: list[torch.Tensor], length: int) -> torch.Tensor:
+        padded_morphs = pad_sequences(
+            morphs, pad_value=get_morph_tokenizer().pad_token_id, length=length, padding_side=self.tokenizer.padding_side
+        )
+        return torch.from_numpy(padded_morphs)
+
+    def __call__(self, features: list[dict[str, torch.Tensor]], return_tensors=None) -> BatchEncoding:
+        if (return_tensors or self.return_tensors) != "pt" or self.padding in (False, "do_not_pad", PaddingStrategy.DO_NOT_PAD):
             return super().__call__(features=features, return_tensors=return_tensors)
 
-        assert (
-            FINAL_INPUT_MORPHS in features[0].keys()
-        ), f"Expected {FINAL_INPUT_MORPHS = } to be one of the keys of the batch encoding"
+        if self.source_type == SourceType.TEXT_WITH_POS_EMBEDDINGS:
+            assert (
+                FINAL_INPUT_MORPHS in features[0].keys()
+            ), f"Expected {FINAL_INPUT_MORPHS = } to be one of the keys of the batch encoding"
 
-        morphs: list[torch.Tensor] = [ex.pop(FINAL_INPUT_MORPHS) for ex in features]
-        batch = super().__call__(features=features, return_tensors=return_tensors)
+        if not {FINAL_INPUT_IDS, FINAL_INPUT_MASK} <= features[0].keys() <= COLLATED_COLUMNS:
+            return self.collate_with_tokenizer(features, return_tensors=return_tensors)
 
-        # The tensor is of size (<batch_size>, <len inputs>)
-        # We want to our input morphs to have the same shape.
-        # The regular data collator does that for input_ids, but it won't do it for us in the case of pos tokens.
-        input_shape = batch.data["input_ids"].shape
-        padded_morphs = [
-            pad_to_desired_length(t, desired_length=input_shape[-1], value=get_morph_tokenizer().pad_token_id) for t in morphs
-        ]
-        morph_tensor = torch.vstack(padded_morphs).int()
-        assert morph_tensor.shape == input_shape, f"Shape mismatch {morph_tensor.shape = } {input_shape = }"
+        padding_side = self.tokenizer.padding_side
+        pad_to_max_length = self.padding == PaddingStrategy.MAX_LENGTH or self.padding == "max_length"
+        input_length = self.get_padded_length([len(feature[FINAL_INPUT_IDS]) for feature in features], pad_to_max_length)
+        pad_values = {FINAL_INPUT_IDS: self.tokenizer.pad_token_id, FINAL_INPUT_MASK: 0}
+        batch = {
+            column: torch.from_numpy(
+                pad_sequences(
+                    [feature[column] for feature in features], pad_value, length=input_length, padding_side=padding_side
+                )
+            )
+            for column, pad_value in pad_values.items()
+        }
+        if FINAL_INPUT_MORPHS in features[0]:
+            batch[FINAL_INPUT_MORPHS] = self.pad_morphs([feature[FINAL_INPUT_MORPHS] for feature in features], input_length)
 
-        batch.data["input_morphs"] = morph_tensor
+        if FINAL_LABELS in features[0]:
+            # As in `DataCollatorForSeq2Seq`, the labels are padded to the longest labels, whatever the padding strategy
+            labels = [feature[FINAL_LABELS] for feature in features]
+            labels_padded = pad_sequences(
+                labels,
+                pad_value=self.label_pad_token_id,
+                length=self.get_padded_length([len(label) for label in labels]),
+                dtype=np.int64,
+                padding_side=padding_side,
+            )
+            batch[FINAL_LABELS] = torch.from_numpy(labels_padded)
+            if self.model is not None and hasattr(self.model, "prepare_decoder_input_ids_from_labels"):
+                batch["decoder_input_ids"] = self.model.prepare_decoder_input_ids_from_labels(labels=batch[FINAL_LABELS])
+
+        if FINAL_INPUT_MORPHS in batch:
+            assert (
+                batch[FINAL_INPUT_MORPHS].shape == batch[FINAL_INPUT_IDS].shape
+            ), f"Shape mismatch {batch[FINAL_INPUT_MORPHS].shape = } {batch[FINAL_INPUT_IDS].shape = }"
+
+        return BatchEncoding(batch)
+
+    def collate_with_tokenizer(self, features: list[dict[str, torch.Tensor]], return_tensors=None) -> BatchEncoding:
+        """Let `DataCollatorForSeq2Seq` pad the features and pad `input_morphs` to the length of the padded `input_ids`."""
+        morphs = [feature[FINAL_INPUT_MORPHS] for feature in features] if FINAL_INPUT_MORPHS in features[0] else None
+        features = [
+            {column: value for column, value in feature.items() if column != FINAL_INPUT_MORPHS} for feature in features
+        ]
+        batch = super().__call__(features=features, return_tensors=return_tensors)
+        if morphs is not None:
+            batch.data[FINAL_INPUT_MORPHS] = self.pad_morphs(morphs, batch.data[FINAL_INPUT_IDS].shape[-1])
         return batch
@@ -0,0 +1,89 @@
+import copy
+
+import numpy as np
+import pytest
+import torch
+from datasets import Dataset
+from tokenizers import Tokenizer, models
+from transformers import MT5Config, T5TokenizerFast
+
+from kairos import benchmark
+from kairos.config import InferenceConf, InferenceDevice
+from kairos.models.main import MT5MorphsForConditionalGeneration
+
+
+def get_tokenizer() -> T5TokenizerFast:
+    tokens = ["<pad>", "</s>", "<unk>"] + [f"w{index}" for index in range(29)]
+    word_level = Tokenizer(models.WordLevel({token: index for index, token in enumerate(tokens)}, unk_token="<unk>"))
+    return T5TokenizerFast(tokenizer_object=word_level, pad_token="<pad>", eos_token="</s>", unk_token="<unk>")
+
+
+def get_dataset() -> Dataset:
+    input_ids = [[5, 6, 7, 1], [5, 1], [8, 6, 9, 10, 11, 1], [12, 1], [13, 14, 1]]
+    return Dataset.from_dict(
+        {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * len(ids) for ids in input_ids],
+            "input_morphs": [[(token_id % 7) + 3 for token_id in ids] for ids in input_ids],
+            "labels": [[9, 4, 1], [11, 1], [7, 7, 8, 1], [6, 1], [10, 5, 1]],
+        }
+    )
+
+
+def get_model() -> MT5MorphsForConditionalGeneration:
+    torch.manual_seed(0)
+    config = MT5Config(
+        vocab_size=32,
+        d_model=16,
+        d_kv=4,
+        d_ff=32,
+        num_layers=2,
+        num_heads=4,
+        decoder_start_token_id=0,
+        eos_token_id=1,
+        pad_token_id=0,
+        morph_arch="simple-sum",
+        morph_vocabulary_size=16,
+    )
+    return MT5MorphsForConditionalGeneration(config).eval()
+
+
+@pytest.mark.parametrize("static_kv_cache", [False, True])
+def test_generation_configs_match_separate_batch_inference_runs(monkeypatch, static_kv_cache):
+    monkeypatch.setattr(benchmark, "get_generation_max_length", lambda: 8)
+    model = get_model()
+    tokenizer, dset_split = get_tokenizer(), get_dataset()
+    inference_kwargs = dict(batch_size=2, device="cpu", static_kv_cache=static_kv_cache)
+
+    encoder_calls = []
+    hook = model.get_encoder().register_forward_hook(lambda *args: encoder_calls.append(args))
+    generation_configs = {"greedy": {}, "beam3": {"num_beams": 3}}
+    eval_preds = benchmark.batch_inference_with_generation_configs(
+        model, tokenizer, dset_split, generation_configs, **inference_kwargs
+    )
+    hook.remove()
+    # 5 examples in batches of 2, each encoded once for both configs
+    assert len(encoder_calls) == 3
+
+    default_generation_config = model.generation_config
+    for name, generation_config in generation_configs.items():
+        model.generation_config = copy.deepcopy(default_generation_config)
+        model.generation_config.update(**generation_config)
+        expected = benchmark.batch_inference(model, tokenizer, dset_split, **inference_kwargs)
+        np.testing.assert_array_equal(eval_preds[name].predictions, expected.predictions)
+        np.testing.assert_array_equal(eval_preds[name].label_ids, expected.label_ids)
+        assert eval_preds[name].decoded_predictions == expected.decoded_predictions
+    model.generation_config = default_generation_config
+
+
+def test_generation_settings_cover_the_number_of_sharded_workers(monkeypatch):
+    monkeypatch.setattr(benchmark, "get_generation_max_length", lambda: 8)
+    model = get_model()
+    settings = [
+        benchmark.get_generation_settings(
+            model, InferenceConf(device=InferenceDevice.CPU, num_workers=num_workers), batch_size=2, sort_by_length=True
+        )
+        for num_workers in (1, 2)
+    ]
+    # The shards are batched separately, e.g. 5 examples in batches of 2 are batched as 2+2+1 or as 2+1 and 2
+    assert settings[0] != settings[1]
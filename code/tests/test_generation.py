@@ -0,0 +1,25 @@
+import torch
+from transformers import T5Config, T5ForConditionalGeneration
+
+from kairos.models.generation import get_assisted_generation_kwargs
+
+
+def test_the_draft_length_reaches_generate():
+    torch.manual_seed(0)
+    # Without an eos token, the draft model always proposes all of its tokens
+    config_kwargs = dict(vocab_size=32, d_kv=4, num_heads=4, decoder_start_token_id=0, eos_token_id=None, pad_token_id=0)
+    model = T5ForConditionalGeneration(T5Config(d_model=32, d_ff=64, num_layers=2, **config_kwargs)).eval()
+    draft_model = T5ForConditionalGeneration(T5Config(d_model=16, d_ff=32, num_layers=1, **config_kwargs)).eval()
+    input_ids = torch.tensor([[5, 6, 3, 7, 3, 8]])
+    encoder_kwargs = {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+
+    calls = []
+    model.register_forward_hook(lambda *args: calls.append("model"))
+    draft_model.register_forward_hook(lambda *args: calls.append("draft"))
+    # The second call starts again from its own draft length, not from the one adjusted by the first call
+    for num_draft_tokens in (3, 2):
+        calls.clear()
+        assisted_kwargs = get_assisted_generation_kwargs(draft_model, encoder_kwargs, num_draft_tokens=num_draft_tokens)
+        with torch.inference_mode():
+            model.generate(**encoder_kwargs, max_new_tokens=12, **assisted_kwargs)
+        assert calls[: num_draft_tokens + 1] == ["draft"] * num_draft_tokens + ["model"]
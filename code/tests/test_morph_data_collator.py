@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+import torch
+from tokenizers import Tokenizer, models
+from transformers import DataCollatorForSeq2Seq, T5TokenizerFast
+
+from kairos.config import SourceType
+from kairos.training.morph_data_collator import PosEmbeddingAwareDataCollator
+
+FEATURES = [
+    {"input_ids": [5, 6, 7, 1], "attention_mask": [1, 1, 1, 1], "input_morphs": [2, 9, 4, 1], "labels": [8, 1]},
+    {"input_ids": [5, 1], "attention_mask": [1, 1], "input_morphs": [3, 1], "labels": [9, 6, 7, 6, 1]},
+    {"input_ids": [8, 6, 1], "attention_mask": [1, 1, 1], "input_morphs": [4, 4, 1], "labels": [7, 1]},
+]
+
+
+def get_tokenizer(padding_side: str) -> T5TokenizerFast:
+    word_level = Tokenizer(models.WordLevel({f"w{index}": index for index in range(16)}, unk_token="w2"))
+    return T5TokenizerFast(tokenizer_object=word_level, pad_token="w0", eos_token="w1", padding_side=padding_side)
+
+
+@pytest.mark.parametrize("padding_side", ["right", "left"])
+@pytest.mark.parametrize(
+    "padding, max_length, pad_to_multiple_of",
+    [(True, None, None), (True, None, 4), ("max_length", 6, None), ("max_length", 6, 4)],
+)
+@pytest.mark.parametrize("extra_column", [False, True])
+def test_collator_matches_data_collator_for_seq2seq(padding_side, padding, max_length, pad_to_multiple_of, extra_column):
+    features = [feature | ({"index": [index]} if extra_column else {}) for index, feature in enumerate(FEATURES)]
+    collator_kwargs = dict(
+        tokenizer=get_tokenizer(padding_side),
+        padding=padding,
+        max_length=max_length,
+        pad_to_multiple_of=pad_to_multiple_of,
+        return_tensors="pt",
+    )
+    text_features = [{column: value for column, value in feature.items() if column != "input_morphs"} for feature in features]
+    expected = DataCollatorForSeq2Seq(**collator_kwargs)(copy.deepcopy(text_features))
+
+    collator = PosEmbeddingAwareDataCollator(**collator_kwargs, source_type=SourceType.TEXT_WITH_POS_EMBEDDINGS)
+    batch = collator(copy.deepcopy(features))
+
+    assert batch.keys() == expected.keys() | {"input_morphs"}
+    for column, tensor in expected.items():
+        torch.testing.assert_close(batch[column].long(), tensor, rtol=0, atol=0, msg=column)
+    # The morphs are padded exactly like the input ids
+    attention_mask = batch["attention_mask"].bool()
+    assert batch["input_morphs"].shape == batch["input_ids"].shape
+    morphs = [morph for feature in features for morph in feature["input_morphs"]]
+    assert batch["input_morphs"][attention_mask].tolist() == morphs
+    assert not batch["input_morphs"][~attention_mask].any()
@@ -0,0 +1,11 @@
+import pytest
+
+from kairos.models.modeling_morph_mt5 import MT5MorphEmbeddings
+
+
+def test_morph_embeddings_without_forward_cannot_be_built():
+    class IncompleteMorphEmbeddings(MT5MorphEmbeddings):
+        pass
+
+    with pytest.raises(TypeError, match="forward"):
+        IncompleteMorphEmbeddings()
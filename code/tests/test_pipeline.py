@@ -0,0 +1,30 @@
+import threading
+import time
+
+import numpy as np
+import torch
+
+from kairos.inference.pipeline import InferenceBatch, run_pipelined_inference
+
+
+def test_results_are_decoded_in_the_background_and_yielded_in_order():
+    decoding_threads = set()
+
+    def decode(predictions: np.ndarray) -> list[str]:
+        decoding_threads.add(threading.current_thread().name)
+        return [" ".join(map(str, row)) for row in predictions.tolist()]
+
+    batches = (
+        InferenceBatch(indices=[2 * i, 2 * i + 1], inputs={"input_ids": torch.tensor([[i], [i + 1]])}) for i in range(20)
+    )
+    results = run_pipelined_inference(
+        batches, generate_fn=lambda inputs: inputs["input_ids"] * 10, decode_fn=decode, queue_size=1
+    )
+    decoded = []
+    for result in results:
+        # A slow caller lets the decoding stage fill its bounded output queue
+        time.sleep(0.01)
+        decoded += result.decoded
+
+    assert decoded == [str(10 * (i + offset)) for i in range(20) for offset in (0, 1)]
+    assert decoding_threads == {"inference-decode"}
@@ -1,21 +1,30 @@
+from typing import TYPE_CHECKING
+
+from . import models, tagsets
 from .constants import SentinelToken
-from .models import (
-    MorphT5AutoConfig,
-    MorphT5AutoForConditionalGeneration,
-    MorphT5AutoModel,
-    MorphT5AutoPreTrainedModel,
-    MorphT5ConcatConfig,
-    MorphT5ConcatForConditionalGeneration,
-    MorphT5ConcatModel,
-    MorphT5ConcatPreTrainedModel,
-    MorphT5SumConfig,
-    MorphT5SumForConditionalGeneration,
-    MorphT5SumModel,
-    MorphT5SumPreTrainedModel,
-)
-from .tagsets import BibleHubTag, OblubienicaTag
-from .tokenizer import MorphT5Tokenizer, MorphTokenizer
 from .utils.formatting import format_interlinear
+from .utils.lazy import get_lazy_attribute_loaders
+
+if TYPE_CHECKING:
+    from .cache import StaticKVCache
+    from .generation import BlockCountLogitsProcessor, BlockCountStoppingCriteria, get_block_count_generation_kwargs
+    from .models import (
+        MorphT5AutoConfig,
+        MorphT5AutoForConditionalGeneration,
+        MorphT5AutoModel,
+        MorphT5AutoPreTrainedModel,
+        MorphT5ConcatConfig,
+        MorphT5ConcatForConditionalGeneration,
+        MorphT5ConcatModel,
+        MorphT5ConcatPreTrainedModel,
+        MorphT5SumConfig,
+        MorphT5SumForConditionalGeneration,
+        MorphT5SumModel,
+        MorphT5SumPreTrainedModel,
+    )
+    from .tagsets import BIBLEHUB_TAGSET, OBLUBIENICA_TAGSET, BibleHubTag, OblubienicaTag, TagsetTable
+    from .tokenizer import MorphT5Tokenizer, MorphTokenizer
+    from .vocabulary import TargetVocabulary
 
 __version__ = "0.2.1"
 
@@ -23,6 +32,9 @@ __all__ = [
     # Tag sets
     "BibleHubTag",
     "OblubienicaTag",
+    "BIBLEHUB_TAGSET",
+    "OBLUBIENICA_TAGSET",
+    "TagsetTable",
     # Models
     "MorphT5AutoConfig",
     "MorphT5AutoModel",
@@ -36,6 +48,12 @@ __all__ = [
     "MorphT5SumModel",
     "MorphT5SumPreTrainedModel",
     "MorphT5SumForConditionalGeneration",
+    # Generation
+    "BlockCountLogitsProcessor",
+    "BlockCountStoppingCriteria",
+    "get_block_count_generation_kwargs",
+    "StaticKVCache",
+    "TargetVocabulary",
     # Formatting
     "format_interlinear",
     # Tokenizer
@@ -44,3 +62,18 @@ __all__ = [
     # Constants
     "SentinelToken",
 ]
+
+# Everything pulling in torch or transformers (the models, the tokenizer, generation) or big enough to matter (the
+# tagsets) is imported on first access, so that e.g. `format_interlinear` comes without the cost of the models - the
+# `models` and `tagsets` packages themselves are lazy, so importing them here is cheap
+_LAZY_MODULES = {
+    ".cache": ["StaticKVCache"],
+    ".generation": ["BlockCountLogitsProcessor", "BlockCountStoppingCriteria", "get_block_count_generation_kwargs"],
+    ".models": models.__all__,
+    ".tagsets": tagsets.__all__,
+    ".tokenizer": ["MorphT5Tokenizer", "MorphTokenizer"],
+    ".vocabulary": ["TargetVocabulary"],
+}
+__getattr__, __dir__ = get_lazy_attribute_loaders(
+    __name__, {name: (module, name) for module, names in _LAZY_MODULES.items() for name in names}
+)
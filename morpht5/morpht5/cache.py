@@ -0,0 +1,137 @@
+"""Preallocated key/value cache for MorphT5 decoding."""
+
+import torch
+
+
+class StaticKVCache:
+    """
+    Decoder key/value cache preallocated for a fixed number of positions and written in place.
+
+    The default (tuple) cache concatenates the new key/value states onto the past ones at every decoding step, which copies
+    the whole self-attention cache of every layer for every generated token. This cache allocates the self-attention
+    buffers once, on the first decoding step (when the batch size - already expanded for beam search - is known), and each
+    step only writes the new position. The cross-attention states are computed on the first step and kept as they are.
+
+    Example:
+        ```python
+        outputs = model.generate(**inputs, max_new_tokens=128, past_key_values=StaticKVCache(max_length=129))
+        ```
+
+    A cache holds the states of a single `generate` call - `reset` it before passing it to the next one, which reuses the
+    buffers if the batch has the same size. It supports greedy search, sampling and beam search.
+
+    Args:
+        max_length: Number of decoder positions to allocate, i.e. `max_new_tokens` plus the decoder start token
+    """
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.key_cache: list[torch.Tensor] = []
+        self.value_cache: list[torch.Tensor] = []
+        self.cross_attention_cache: list[tuple[torch.Tensor, ...]] = []
+        self.seq_lengths: list[int] = []
+        # Beam search gathers the reordered states into these and swaps them with the caches, see `reorder_cache`
+        self.spare_key_cache: list[torch.Tensor | None] = []
+        self.spare_value_cache: list[torch.Tensor | None] = []
+
+    def __len__(self) -> int:
+        return len(self.key_cache)
+
+    def __getitem__(self, layer_idx: int) -> tuple[torch.Tensor, ...]:
+        """Legacy (tuple) view of a layer: the written part of the self-attention states, then the cross-attention states."""
+        if layer_idx >= len(self):
+            # Nothing has been written yet, `generate` only looks at the length of the past.
+            empty = torch.empty(0, 0, 0, 0)
+            return empty, empty
+        seq_length = self.seq_lengths[layer_idx]
+        states = (self.key_cache[layer_idx][:, :, :seq_length], self.value_cache[layer_idx][:, :, :seq_length])
+        if layer_idx < len(self.cross_attention_cache):
+            states = states + self.cross_attention_cache[layer_idx]
+        return states
+
+    def get_seq_length(self) -> int:
+        """Number of decoder positions written so far."""
+        return self.seq_lengths[0] if self.seq_lengths else 0
+
+    def layers(self, num_layers: int) -> list["StaticKVCacheLayer"]:
+        return [StaticKVCacheLayer(self, layer_idx) for layer_idx in range(num_layers)]
+
+    def update(self, layer_idx: int, key_states: torch.Tensor, value_states: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Write the self-attention states of the new positions and return the states of all the positions written so far."""
+        start = self.seq_lengths[layer_idx] if layer_idx < len(self) else 0
+        if start == 0:
+            self._allocate(layer_idx, key_states)
+
+        end = start + key_states.shape[2]
+        if end > self.max_length:
+            raise ValueError(f"The static cache holds {self.max_length} positions, but position {end - 1} was requested")
+        self.key_cache[layer_idx][:, :, start:end] = key_states
+        self.value_cache[layer_idx][:, :, start:end] = value_states
+        self.seq_lengths[layer_idx] = end
+        return self.key_cache[layer_idx][:, :, :end], self.value_cache[layer_idx][:, :, :end]
+
+    def _allocate(self, layer_idx: int, key_states: torch.Tensor) -> None:
+        """Allocate the buffers of a layer, unless the ones left over from before a `reset` already fit."""
+        batch_size, n_heads, _, dim_per_head = key_states.shape
+        shape = (batch_size, n_heads, self.max_length, dim_per_head)
+        if layer_idx < len(self):
+            cache = self.key_cache[layer_idx]
+            if cache.shape == shape and cache.dtype == key_states.dtype and cache.device == key_states.device:
+                return
+            self.key_cache[layer_idx] = torch.zeros(shape, dtype=key_states.dtype, device=key_states.device)
+            self.value_cache[layer_idx] = torch.zeros_like(self.key_cache[layer_idx])
+            self.spare_key_cache[layer_idx] = self.spare_value_cache[layer_idx] = None
+        else:
+            self.key_cache.append(torch.zeros(shape, dtype=key_states.dtype, device=key_states.device))
+            self.value_cache.append(torch.zeros_like(self.key_cache[layer_idx]))
+            self.spare_key_cache.append(None)
+            self.spare_value_cache.append(None)
+            self.seq_lengths.append(0)
+
+    def set_cross_attention_states(self, layer_idx: int, states: tuple[torch.Tensor, ...]) -> None:
+        if layer_idx == len(self.cross_attention_cache):
+            self.cross_attention_cache.append(states)
+
+    def get_cross_attention_states(self, layer_idx: int) -> tuple[torch.Tensor, ...] | None:
+        return self.cross_attention_cache[layer_idx] if layer_idx < len(self.cross_attention_cache) else None
+
+    def reorder_cache(self, beam_idx: torch.LongTensor) -> None:
+        """
+        Reorder the self-attention states after a beam search step, without allocating any memory.
+
+        The written positions are gathered into a spare buffer of the same size (allocated on the first reorder), which then
+        swaps places with the cache - so every layer keeps exactly two buffers per state for the whole generation.
+        The cross-attention states are left as they are: all the beams of an example share the same encoder outputs, and beams
+        are only ever reordered within an example.
+        """
+        for layer_idx in range(len(self)):
+            seq_length = self.seq_lengths[layer_idx]
+            for caches, spare_caches in ((self.key_cache, self.spare_key_cache), (self.value_cache, self.spare_value_cache)):
+                cache, spare = caches[layer_idx], spare_caches[layer_idx]
+                if spare is None:
+                    spare = torch.empty_like(cache)
+                torch.index_select(cache[:, :, :seq_length], 0, beam_idx.to(cache.device), out=spare[:, :, :seq_length])
+                caches[layer_idx], spare_caches[layer_idx] = spare, cache
+
+    def reset(self) -> None:
+        """Forget all the states, so that the cache can be passed to another `generate` call. The buffers are kept for reuse."""
+        self.cross_attention_cache = []
+        self.seq_lengths = [0] * len(self)
+
+
+class StaticKVCacheLayer:
+    """The part of a `StaticKVCache` which belongs to a single decoder layer, passed down to its attention modules."""
+
+    def __init__(self, cache: StaticKVCache, layer_idx: int):
+        self.cache = cache
+        self.layer_idx = layer_idx
+
+    def get_seq_length(self) -> int:
+        return self.cache.seq_lengths[self.layer_idx] if self.layer_idx < len(self.cache) else 0
+
+    def update(self, key_states: torch.Tensor, value_states: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        return self.cache.update(self.layer_idx, key_states, value_states)
+
+    @property
+    def cross_attention_states(self) -> tuple[torch.Tensor, ...] | None:
+        return self.cache.get_cross_attention_states(self.layer_idx)
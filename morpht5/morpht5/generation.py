@@ -0,0 +1,114 @@
+"""Generation helpers which make use of the interlinear structure of the MorphT5 outputs."""
+
+import torch
+from transformers import LogitsProcessor, LogitsProcessorList, StoppingCriteria, StoppingCriteriaList
+
+from .constants import SentinelToken
+from .tokenizer import MorphT5Tokenizer
+from .vocabulary import TargetVocabulary
+
+
+def count_separators(input_ids: torch.Tensor, separator_token_id: int) -> torch.Tensor:
+    """Count the block separators in each row of a batch."""
+    return (input_ids == separator_token_id).sum(dim=-1)
+
+
+class _BlockCount:
+    """
+    Shared bookkeeping of the block-count-aware generation helpers.
+
+    An interlinear target has exactly one block per source word, so a source with `n` source block separators should produce
+    exactly `n` target block separators. The expected counts are computed once from the (unexpanded) encoder inputs and
+    repeated for beam search / sampling with `num_return_sequences > 1`, which expand the batch in place.
+    """
+
+    def __init__(
+        self,
+        source_input_ids: torch.Tensor,
+        source_block_sep_token_id: int,
+        target_block_sep_token_id: int,
+        eos_token_id: int,
+    ):
+        self.expected_separators = count_separators(source_input_ids, source_block_sep_token_id)
+        self.target_block_sep_token_id = target_block_sep_token_id
+        self.eos_token_id = eos_token_id
+
+    def get_expected_separators(self, input_ids: torch.Tensor) -> torch.Tensor:
+        expected = self.expected_separators.to(input_ids.device)
+        if (num_expanded := input_ids.shape[0] // expected.shape[0]) > 1:
+            expected = expected.repeat_interleave(num_expanded)
+        return expected
+
+    def has_all_blocks(self, input_ids: torch.Tensor) -> torch.Tensor:
+        return count_separators(input_ids, self.target_block_sep_token_id) >= self.get_expected_separators(input_ids)
+
+
+class BlockCountLogitsProcessor(_BlockCount, LogitsProcessor):
+    """
+    Ends a sequence once it has emitted as many target blocks as its source has words.
+
+    As soon as a sequence has emitted all of its target block separators, the separator can no longer be chosen - whatever
+    probability mass the model puts on opening yet another block is moved to the eos token instead.
+    """
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        done = self.has_all_blocks(input_ids)
+        if done.any():
+            sep_scores = scores[done, self.target_block_sep_token_id]
+            scores[done, self.eos_token_id] = torch.logaddexp(scores[done, self.eos_token_id], sep_scores)
+            scores[done, self.target_block_sep_token_id] = -float("inf")
+        return scores
+
+
+class BlockCountStoppingCriteria(_BlockCount, StoppingCriteria):
+    """
+    Stops the generation once every sequence has either finished or started a block its source does not have.
+
+    On its own it only cuts the runaway generation short (the surplus blocks still need to be trimmed); combined with
+    `BlockCountLogitsProcessor` every sequence ends with the eos token in place of the surplus block.
+    """
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> bool:
+        overflown = count_separators(input_ids, self.target_block_sep_token_id) > self.get_expected_separators(input_ids)
+        finished = (input_ids[:, 1:] == self.eos_token_id).any(dim=-1)
+        return bool((overflown | finished).all())
+
+
+def get_block_count_generation_kwargs(
+    tokenizer: MorphT5Tokenizer,
+    input_ids: torch.Tensor,
+    target_vocabulary: TargetVocabulary | None = None,
+) -> dict[str, LogitsProcessorList | StoppingCriteriaList]:
+    """Build `generate` kwargs which end each sequence once it has as many target blocks as its source has words.
+
+    Example:
+        ```python
+        inputs = tokenizer(text=text, morph_tags=tags, return_tensors="pt")
+        outputs = model.generate(**inputs, **get_block_count_generation_kwargs(tokenizer, inputs["input_ids"]))
+        ```
+
+    Args:
+        tokenizer: Tokenizer the inputs were encoded with
+        input_ids: Encoder input ids of the batch passed to `generate`
+        target_vocabulary: Target vocabulary the model was trimmed to, if any - the target token ids are mapped to it
+
+    Returns:
+        The `logits_processor` and `stopping_criteria` kwargs of `generate`
+    """
+    text_tokenizer = tokenizer.text_tokenizer
+    target_block_sep_token_id = text_tokenizer.convert_tokens_to_ids(SentinelToken.TARGET.value)
+    eos_token_id = text_tokenizer.eos_token_id
+    if target_vocabulary is not None:
+        target_block_sep_token_id, eos_token_id = target_vocabulary.to_reduced(
+            torch.tensor([target_block_sep_token_id, eos_token_id])
+        ).tolist()
+    block_count_kwargs = dict(
+        source_input_ids=input_ids,
+        source_block_sep_token_id=text_tokenizer.convert_tokens_to_ids(SentinelToken.SOURCE.value),
+        target_block_sep_token_id=target_block_sep_token_id,
+        eos_token_id=eos_token_id,
+    )
+    return {
+        "logits_processor": LogitsProcessorList([BlockCountLogitsProcessor(**block_count_kwargs)]),
+        "stopping_criteria": StoppingCriteriaList([BlockCountStoppingCriteria(**block_count_kwargs)]),
+    }
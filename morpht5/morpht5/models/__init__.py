@@ -1,16 +1,26 @@
-from .modeling_morph_t5_auto import (
-    MorphT5AutoConfig,
-    MorphT5AutoForConditionalGeneration,
-    MorphT5AutoModel,
-    MorphT5AutoPreTrainedModel,
-)
-from .modeling_morph_t5_concat import (
-    MorphT5ConcatConfig,
-    MorphT5ConcatForConditionalGeneration,
-    MorphT5ConcatModel,
-    MorphT5ConcatPreTrainedModel,
-)
-from .modeling_morph_t5_sum import MorphT5SumConfig, MorphT5SumForConditionalGeneration, MorphT5SumModel, MorphT5SumPreTrainedModel
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import get_lazy_attribute_loaders
+
+if TYPE_CHECKING:
+    from .modeling_morph_t5_auto import (
+        MorphT5AutoConfig,
+        MorphT5AutoForConditionalGeneration,
+        MorphT5AutoModel,
+        MorphT5AutoPreTrainedModel,
+    )
+    from .modeling_morph_t5_concat import (
+        MorphT5ConcatConfig,
+        MorphT5ConcatForConditionalGeneration,
+        MorphT5ConcatModel,
+        MorphT5ConcatPreTrainedModel,
+    )
+    from .modeling_morph_t5_sum import (
+        MorphT5SumConfig,
+        MorphT5SumForConditionalGeneration,
+        MorphT5SumModel,
+        MorphT5SumPreTrainedModel,
+    )
 
 __all__ = [
     "MorphT5AutoConfig",
@@ -26,3 +36,13 @@ __all__ = [
     "MorphT5SumPreTrainedModel",
     "MorphT5SumForConditionalGeneration",
 ]
+
+# Only the modeling module of the variant in use is imported, on the first access to one of its classes
+__getattr__, __dir__ = get_lazy_attribute_loaders(
+    __name__,
+    {
+        f"MorphT5{variant}{suffix}": (f".modeling_morph_t5_{variant.lower()}", f"MorphT5{variant}{suffix}")
+        for variant in ("Auto", "Concat", "Sum")
+        for suffix in ("Config", "Model", "PreTrainedModel", "ForConditionalGeneration")
+    },
+)
@@ -18,6 +18,7 @@ Copied from transformers.morph.mt5 and adapted for morphological analysis.
 """
 
 import copy
+import functools
 import math
 import os
 import warnings
@@ -45,11 +46,18 @@ from transformers.utils import (
 )
 from transformers.utils.model_parallel_utils import assert_device_map, get_device_map
 
+from ..cache import StaticKVCache, StaticKVCacheLayer
+from ..loss import chunked_cross_entropy
+from ..vocabulary import TargetVocabularyMixin
+
 logger = logging.get_logger(__name__)
 
 _CONFIG_FOR_DOC = "MorphT5AutoConfig"
 _CHECKPOINT_FOR_DOC = "mt5-small"
 
+# Number of key lengths whose relative position buckets of a single (incremental decoding) query are memoized
+RELATIVE_POSITION_BUCKETS_CACHE_SIZE = 1024
+
 
 PARALLELIZE_DOCSTRING = r"""
     This is an experimental feature and is a subject to change at a moment's notice.
@@ -111,11 +119,19 @@ class MorphT5AutoConfig(T5Config):
         self,
         morph_vocabulary_size: int = ...,
         morph_compressed_embedding_size: int = ...,
+        use_sdpa: bool = False,
+        morph_folded_embeddings: bool = False,
+        loss_chunk_size: int | None = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.morph_vocabulary_size = morph_vocabulary_size
         self.morph_compressed_embedding_size = morph_compressed_embedding_size
+        self.use_sdpa = use_sdpa
+        # The morph autoencoder is folded into a single lookup table, see `MorphT5AutoPreTrainedModel.fold_morph_embeddings`
+        self.morph_folded_embeddings = morph_folded_embeddings
+        # The loss is computed this many label positions at a time, see `morpht5.loss.chunked_cross_entropy`
+        self.loss_chunk_size = loss_chunk_size
         # Use the full import path
         self.tokenizer_class = "morpht5.tokenizer.morph_t5_tokenizer.MorphT5Tokenizer"
 
@@ -236,6 +252,8 @@ class MorphT5AutoAttention(nn.Module):
             self.relative_attention_bias = nn.Embedding(self.relative_attention_num_buckets, self.n_heads)
         self.pruned_heads: set[int] = set()
         self.gradient_checkpointing = False
+        # Use the fused torch.nn.functional.scaled_dot_product_attention instead of the eager attention
+        self.use_sdpa = config.use_sdpa
 
     def prune_heads(self, heads: list[int]) -> None:
         if len(heads) == 0:
@@ -298,19 +316,52 @@ class MorphT5AutoAttention(nn.Module):
         relative_buckets += torch.where(is_small, relative_position, relative_position_if_large)
         return relative_buckets
 
-    def compute_bias(self, query_length, key_length, device=None):
-        """Compute binned relative position bias."""
-        if device is None:
-            device = self.relative_attention_bias.weight.device
-        context_position = torch.arange(query_length, dtype=torch.long, device=device)[:, None]
+    @staticmethod
+    def _get_relative_position_buckets(query_length, key_length, bidirectional, num_buckets, max_distance, device):
+        """Relative position buckets of the last `query_length` query positions over `key_length` key positions."""
+        context_position = torch.arange(key_length - query_length, key_length, dtype=torch.long, device=device)[:, None]
         memory_position = torch.arange(key_length, dtype=torch.long, device=device)[None, :]
         relative_position = memory_position - context_position  # shape (query_length, key_length)
-        relative_position_bucket = self._relative_position_bucket(
+        return MorphT5AutoAttention._relative_position_bucket(
             relative_position,  # shape (query_length, key_length)
-            bidirectional=(not self.is_decoder),
-            num_buckets=self.relative_attention_num_buckets,
-            max_distance=self.relative_attention_max_distance,
+            bidirectional=bidirectional,
+            num_buckets=num_buckets,
+            max_distance=max_distance,
         )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=RELATIVE_POSITION_BUCKETS_CACHE_SIZE)
+    def _get_single_query_relative_position_buckets(key_length, bidirectional, num_buckets, max_distance, device):
+        """
+        Relative position buckets of the last query position over `key_length` key positions.
+
+        In incremental decoding, they are memoized instead of being recomputed at every generated token. Only the
+        buckets of a single query are, so that every cached tensor holds `key_length` integers. They are created outside
+        of inference mode, so that they can be used for training afterwards.
+        """
+        with torch.inference_mode(False):
+            return MorphT5AutoAttention._get_relative_position_buckets(
+                1, key_length, bidirectional, num_buckets, max_distance, device
+            )
+
+    def compute_bias(self, query_length, key_length, device=None):
+        """
+        Compute binned relative position bias.
+
+        Only the last `query_length` query positions are computed - in incremental decoding, the single new position.
+        """
+        if device is None:
+            device = self.relative_attention_bias.weight.device
+        bucket_kwargs = {
+            "bidirectional": not self.is_decoder,
+            "num_buckets": self.relative_attention_num_buckets,
+            "max_distance": self.relative_attention_max_distance,
+            "device": device,
+        }
+        if query_length == 1:
+            relative_position_bucket = self._get_single_query_relative_position_buckets(key_length, **bucket_kwargs)
+        else:
+            relative_position_bucket = self._get_relative_position_buckets(query_length, key_length, **bucket_kwargs)
         values = self.relative_attention_bias(relative_position_bucket)  # shape (query_length, key_length, num_heads)
         values = values.permute([2, 0, 1]).unsqueeze(0)  # shape (1, num_heads, query_length, key_length)
         return values
@@ -335,6 +386,13 @@ class MorphT5AutoAttention(nn.Module):
 
         real_seq_length = seq_length
 
+        if isinstance(past_key_value, StaticKVCacheLayer):
+            # The past self-attention states are written to / read from the preallocated buffers of the cache instead
+            static_cache, past_key_value = past_key_value, None
+            real_seq_length += static_cache.get_seq_length()
+        else:
+            static_cache = None
+
         if past_key_value is not None:
             assert (
                 len(past_key_value) == 2
@@ -384,26 +442,20 @@ class MorphT5AutoAttention(nn.Module):
         # get key/value states
         key_states = project(hidden_states, self.k, key_value_states, past_key_value[0] if past_key_value is not None else None)
         value_states = project(hidden_states, self.v, key_value_states, past_key_value[1] if past_key_value is not None else None)
-
-        # compute scores
-        scores = torch.matmul(
-            query_states, key_states.transpose(3, 2)
-        )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
+        if static_cache is not None:
+            key_states, value_states = static_cache.update(key_states, value_states)
 
         if position_bias is None:
+            # if key and values are already calculated
+            # we want only the last query position bias
             if not self.has_relative_attention_bias:
                 position_bias = torch.zeros(
-                    (1, self.n_heads, real_seq_length, key_length), device=scores.device, dtype=scores.dtype
+                    (1, self.n_heads, seq_length, key_length), device=query_states.device, dtype=query_states.dtype
                 )
                 if self.gradient_checkpointing and self.training:
                     position_bias.requires_grad = True
             else:
-                position_bias = self.compute_bias(real_seq_length, key_length, device=scores.device)
-
-            # if key and values are already calculated
-            # we want only the last query position bias
-            if past_key_value is not None:
-                position_bias = position_bias[:, :, -hidden_states.size(1) :, :]
+                position_bias = self.compute_bias(seq_length, key_length, device=query_states.device)
 
             if mask is not None:
                 position_bias = position_bias + mask  # (batch_size, n_heads, seq_length, key_length)
@@ -415,20 +467,38 @@ class MorphT5AutoAttention(nn.Module):
         else:
             position_bias_masked = position_bias
 
-        scores += position_bias_masked
-        attn_weights = nn.functional.softmax(scores.float(), dim=-1).type_as(
-            scores
-        )  # (batch_size, n_heads, seq_length, key_length)
-        attn_weights = nn.functional.dropout(
-            attn_weights, p=self.dropout, training=self.training
-        )  # (batch_size, n_heads, seq_length, key_length)
-
-        # Mask heads if we want to
-        if layer_head_mask is not None:
-            attn_weights = attn_weights * layer_head_mask
-
-        attn_output = unshape(torch.matmul(attn_weights, value_states))  # (batch_size, seq_length, dim)
-        attn_output = self.o(attn_output)
+        if self.use_sdpa and not output_attentions and layer_head_mask is None:
+            # The position bias (with the mask already added) is passed as the additive attention mask, so that the scores
+            # are never materialized. T5 does not scale the scores, hence scale=1.
+            attn_output = nn.functional.scaled_dot_product_attention(
+                query_states,
+                key_states,
+                value_states,
+                attn_mask=position_bias_masked.to(query_states.dtype),
+                dropout_p=self.dropout if self.training else 0.0,
+                scale=1.0,
+            )  # (batch_size, n_heads, seq_length, dim_per_head)
+            attn_weights = None
+        else:
+            # compute scores
+            scores = torch.matmul(
+                query_states, key_states.transpose(3, 2)
+            )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
+            scores += position_bias_masked
+            attn_weights = nn.functional.softmax(scores.float(), dim=-1).type_as(
+                scores
+            )  # (batch_size, n_heads, seq_length, key_length)
+            attn_weights = nn.functional.dropout(
+                attn_weights, p=self.dropout, training=self.training
+            )  # (batch_size, n_heads, seq_length, key_length)
+
+            # Mask heads if we want to
+            if layer_head_mask is not None:
+                attn_weights = attn_weights * layer_head_mask
+
+            attn_output = torch.matmul(attn_weights, value_states)
+
+        attn_output = self.o(unshape(attn_output))  # (batch_size, seq_length, dim)
 
         present_key_value_state = (key_states, value_states) if (self.is_decoder and use_cache) else None
         outputs = (attn_output,) + (present_key_value_state,) + (position_bias,)
@@ -535,7 +605,9 @@ class MorphT5AutoBlock(nn.Module):
         output_attentions=False,
         return_dict=True,
     ):
-        if past_key_value is not None:
+        if isinstance(past_key_value, StaticKVCacheLayer):
+            self_attn_past_key_value, cross_attn_past_key_value = past_key_value, past_key_value.cross_attention_states
+        elif past_key_value is not None:
             if not self.is_decoder:
                 logger.warning("`past_key_values` is passed to the encoder. Please make sure this is intended.")
             expected_num_past_key_values = 2 if encoder_hidden_states is None else 4
@@ -745,6 +817,18 @@ class MorphT5AutoPreTrainedModel(PreTrainedModel):
         }
         return dummy_inputs
 
+    def fold_morph_embeddings(self) -> None:
+        """
+        Fold the morph autoencoder of the encoder into a single `morph_vocabulary_size x d_model` lookup table.
+
+        `morph_compress_morphs` (an embedding) followed by `morph_decompress_morphs` (a linear layer) is a linear function of
+        the morph tag, so the decompressed embedding of every tag can be computed once and the encoder input becomes a single
+        gather. Meant for inference - the folded model no longer has the bottleneck of the autoencoder. The config is updated
+        as well, so that the folded model can be saved and loaded with `from_pretrained`.
+        """
+        self.get_encoder().fold_morph_embeddings()
+        self.config.morph_folded_embeddings = True
+
     def _init_weights(self, module):
         """Initialize the weights."""
         factor = self.config.initializer_factor  # Used for testing weights initialization
@@ -831,7 +915,10 @@ class MorphT5AutoStack(MorphT5AutoPreTrainedModel):
 
         self.embed_tokens = embed_tokens
         self.is_decoder = config.is_decoder
-        if not self.is_decoder:
+        if not self.is_decoder and config.morph_folded_embeddings:
+            # Morphs, folded into a single lookup table - see `fold_morph_embeddings`
+            self.morph_embed_morphs = nn.Embedding(num_embeddings=config.morph_vocabulary_size, embedding_dim=config.d_model)
+        elif not self.is_decoder:
             # Morphs
             self.morph_compress_morphs = nn.Embedding(
                 num_embeddings=config.morph_vocabulary_size,
@@ -909,6 +996,15 @@ class MorphT5AutoStack(MorphT5AutoPreTrainedModel):
     def set_input_embeddings(self, new_embeddings):
         self.embed_tokens = new_embeddings
 
+    @torch.no_grad()
+    def fold_morph_embeddings(self) -> None:
+        if self.is_decoder or self.config.morph_folded_embeddings:
+            return
+        morph_table = self.morph_decompress_morphs(self.morph_compress_morphs.weight)  # (morph_vocabulary_size, d_model)
+        self.morph_embed_morphs = nn.Embedding.from_pretrained(morph_table, freeze=False)
+        del self.morph_compress_morphs, self.morph_decompress_morphs
+        self.config.morph_folded_embeddings = True
+
     def forward(
         self,
         input_ids: torch.Tensor | None = None,
@@ -969,13 +1065,24 @@ class MorphT5AutoStack(MorphT5AutoPreTrainedModel):
             if not self.is_decoder:
                 assert input_morphs is not None
                 # Morph
-                compressed_morphs = self.morph_compress_morphs(input_morphs)
-                decompressed_morphs = self.morph_decompress_morphs(compressed_morphs)
-                inputs_embeds += decompressed_morphs
+                if self.config.morph_folded_embeddings:
+                    inputs_embeds += self.morph_embed_morphs(input_morphs)
+                else:
+                    compressed_morphs = self.morph_compress_morphs(input_morphs)
+                    decompressed_morphs = self.morph_decompress_morphs(compressed_morphs)
+                    inputs_embeds += decompressed_morphs
         batch_size, seq_length = input_shape
 
         # required mask seq length can be calculated via length of past
-        mask_seq_length = past_key_values[0][0].shape[2] + seq_length if past_key_values is not None else seq_length
+        if isinstance(past_key_values, StaticKVCache) and not self.is_decoder:
+            # `generate` passes the model kwargs on to the encoder as well, but the cache only holds the decoder states
+            past_key_values = None
+        if isinstance(past_key_values, StaticKVCache):
+            static_cache, past_key_values = past_key_values, past_key_values.layers(len(self.block))
+            mask_seq_length = static_cache.get_seq_length() + seq_length
+        else:
+            static_cache = None
+            mask_seq_length = past_key_values[0][0].shape[2] + seq_length if past_key_values is not None else seq_length
 
         if use_cache is True:
             assert self.is_decoder, f"`use_cache` can only be set to `True` if {self} is used as a decoder"
@@ -1095,6 +1202,8 @@ class MorphT5AutoStack(MorphT5AutoPreTrainedModel):
             # append next layer key value states
             if use_cache:
                 present_key_value_states = present_key_value_states + (present_key_value_state,)  # type: ignore
+                if static_cache is not None and encoder_hidden_states is not None:
+                    static_cache.set_cross_attention_states(i, present_key_value_state[2:])
 
             if output_attentions:
                 all_attentions = all_attentions + (layer_outputs[3],)  # type: ignore
@@ -1107,6 +1216,9 @@ class MorphT5AutoStack(MorphT5AutoPreTrainedModel):
                     if i == v[-1] and "cuda:" + str(k) != self.last_device:
                         hidden_states = hidden_states.to("cuda:" + str(k + 1))
 
+        if static_cache is not None and use_cache:
+            present_key_value_states = static_cache
+
         hidden_states = self.final_layer_norm(hidden_states)
         hidden_states = self.dropout(hidden_states)
 
@@ -1528,7 +1640,7 @@ class MorphT5AutoModel(MorphT5AutoPreTrainedModel):
 
 
 @add_start_docstrings("""MorphT5Auto Model with a `language modeling` head on top.""", MorphT5Auto_START_DOCSTRING)
-class MorphT5AutoForConditionalGeneration(MorphT5AutoPreTrainedModel):
+class MorphT5AutoForConditionalGeneration(TargetVocabularyMixin, MorphT5AutoPreTrainedModel):
     r"""
     Examples:
     ```python
@@ -1772,13 +1884,17 @@ class MorphT5AutoForConditionalGeneration(MorphT5AutoPreTrainedModel):
             # See https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/transformer/transformer.py#L586
             sequence_output = sequence_output * (self.model_dim**-0.5)
 
-        lm_logits = self.lm_head(sequence_output)
-
         loss = None
-        if labels is not None:
-            loss_fct = CrossEntropyLoss(ignore_index=-100)
-            loss = loss_fct(lm_logits.view(-1, lm_logits.size(-1)), labels.view(-1))
-            # TODO(thom): Add z_loss https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/layers.py#L666
+        if labels is not None and self.config.loss_chunk_size is not None:
+            # The logits of the whole label sequence are never materialized, so none are returned
+            lm_logits = None
+            loss = chunked_cross_entropy(sequence_output, self.lm_head, labels, chunk_size=self.config.loss_chunk_size)
+        else:
+            lm_logits = self.lm_head(sequence_output)
+            if labels is not None:
+                loss_fct = CrossEntropyLoss(ignore_index=-100)
+                loss = loss_fct(lm_logits.view(-1, lm_logits.size(-1)), labels.view(-1))
+                # TODO(thom): Add z_loss https://github.com/tensorflow/mesh/blob/fa19d69eafc9a482aff0b59ddd96b025c0cb207d/mesh_tensorflow/layers.py#L666
 
         if not return_dict:
             output = (lm_logits,) + decoder_outputs[1:] + encoder_outputs
@@ -1810,8 +1926,13 @@ class MorphT5AutoForConditionalGeneration(MorphT5AutoPreTrainedModel):
         **kwargs,
     ):
         # cut decoder_input_ids if past is used
-        if past_key_values is not None:
-            input_ids = input_ids[:, -1:]
+        if isinstance(past_key_values, StaticKVCache):
+            input_ids = input_ids[:, past_key_values.get_seq_length() :]
+        elif past_key_values is not None:
+            past_length = past_key_values[0][0].shape[2]
+            # Assisted (speculative) decoding passes all the tokens the draft model proposed, the other methods only the last one
+            remove_prefix_length = past_length if input_ids.shape[1] > past_length else input_ids.shape[1] - 1
+            input_ids = input_ids[:, remove_prefix_length:]
 
         return {
             "decoder_input_ids": input_ids,
@@ -1836,16 +1957,23 @@ class MorphT5AutoForConditionalGeneration(MorphT5AutoPreTrainedModel):
             logger.warning("You might want to consider setting `use_cache=True` to speed up decoding")
             return past
 
+        if isinstance(past, StaticKVCache):
+            past.reorder_cache(beam_idx)
+            return past
+
         reordered_decoder_past = ()
         for layer_past_states in past:
             # get the correct batch idx from layer past batch dim
             # batch dim of `past` is at 2nd position
             reordered_layer_past_states = ()
-            for layer_past_state in layer_past_states:
-                # need to set correct `past` for each of the four key / value states
+            for layer_past_state in layer_past_states[:2]:
+                # need to set correct `past` for the self-attention key / value states
                 reordered_layer_past_states = reordered_layer_past_states + (
                     layer_past_state.index_select(0, beam_idx.to(layer_past_state.device)),
                 )
+            # the cross-attention key / value states are the same for all the beams of an example, and beams are only ever
+            # reordered within an example, so they are kept as they are
+            reordered_layer_past_states = reordered_layer_past_states + tuple(layer_past_states[2:])
 
             assert reordered_layer_past_states[0].shape == layer_past_states[0].shape
             assert len(reordered_layer_past_states) == len(layer_past_states)
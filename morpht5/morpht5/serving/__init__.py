@@ -0,0 +1,23 @@
+from .batching import BatcherStats, MicroBatcher, RequestTooLarge, ServerOverloaded
+from .cache import CacheStats, TranslationCache, get_translation_cache_key
+from .corpus import CorpusCheckpoint, read_records, translate_corpus
+from .load_test import run_load_test
+from .server import TranslationServer
+from .translator import EncodedVerse, InterlinearTranslator
+
+__all__ = [
+    "BatcherStats",
+    "CacheStats",
+    "CorpusCheckpoint",
+    "EncodedVerse",
+    "InterlinearTranslator",
+    "MicroBatcher",
+    "RequestTooLarge",
+    "ServerOverloaded",
+    "TranslationCache",
+    "TranslationServer",
+    "get_translation_cache_key",
+    "read_records",
+    "run_load_test",
+    "translate_corpus",
+]
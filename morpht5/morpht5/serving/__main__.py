@@ -0,0 +1,131 @@
+"""
+Serve a MorphT5 model, translate a whole corpus with it, or measure the throughput and latency of a running server.
+
+    python -m morpht5.serving serve mrapacz/interlinear-en-philta-emb-auto-diacritics-bh --port 8000 --cache verses.sqlite
+    python -m morpht5.serving translate mrapacz/interlinear-en-philta-emb-auto-diacritics-bh nt.jsonl -o nt.translated.jsonl
+    python -m morpht5.serving load --port 8000 --concurrency 1 4 16 --num_requests 256 --verses verses.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from transformers import PretrainedConfig
+
+from ..models import MorphT5AutoForConditionalGeneration, MorphT5ConcatForConditionalGeneration, MorphT5SumForConditionalGeneration
+from ..tokenizer import MorphT5Tokenizer
+from .cache import TranslationCache
+from .corpus import read_records, translate_corpus
+from .load_test import EXAMPLE_VERSE, get_server_stats, run_load_test
+from .server import TranslationServer
+from .translator import InterlinearTranslator
+
+MODEL_CLASSES = {
+    "morph-t5-auto": MorphT5AutoForConditionalGeneration,
+    "morph-t5-concat": MorphT5ConcatForConditionalGeneration,
+    "morph-t5-sum": MorphT5SumForConditionalGeneration,
+}
+
+
+def load_translator(args: argparse.Namespace) -> InterlinearTranslator:
+    model_type = PretrainedConfig.get_config_dict(args.model)[0]["model_type"]
+    model = MODEL_CLASSES[model_type].from_pretrained(args.model).to(args.device)
+    cache = None
+    if args.cache is not None or args.cache_memory_entries > 0:
+        cache = TranslationCache(args.cache, max_memory_entries=args.cache_memory_entries)
+    return InterlinearTranslator(
+        model,
+        MorphT5Tokenizer.from_pretrained(args.model),
+        max_new_tokens=args.max_new_tokens,
+        num_beams=args.num_beams,
+        block_count_stopping=not args.no_block_count_stopping,
+        cache=cache,
+    )
+
+
+def serve(args: argparse.Namespace) -> None:
+    server = TranslationServer(
+        load_translator(args),
+        max_wait_ms=args.max_wait_ms,
+        max_batch_tokens=args.max_batch_tokens,
+        max_batch_size=args.max_batch_size,
+        max_pending=args.max_pending,
+    )
+    asyncio.run(server.serve_forever(host=args.host, port=args.port))
+
+
+def translate(args: argparse.Namespace) -> None:
+    translator = load_translator(args)
+    with sys.stdin if args.input == "-" else open(args.input, encoding="utf-8") as lines:
+        checkpoint = translate_corpus(
+            translator,
+            read_records(lines),
+            args.output,
+            checkpoint_path=args.checkpoint,
+            shard_size=args.shard_size,
+            max_batch_tokens=args.max_batch_tokens,
+            max_batch_size=args.max_batch_size,
+            overwrite=args.overwrite,
+        )
+    print(json.dumps({"num_records": checkpoint.num_records, "num_shards": checkpoint.num_shards}))
+
+
+async def load(args: argparse.Namespace) -> None:
+    verses = [json.loads(line) for line in args.verses.read_text().splitlines() if line] if args.verses else [EXAMPLE_VERSE]
+    for concurrency in args.concurrency:
+        report = await run_load_test(args.host, args.port, verses, num_requests=args.num_requests, concurrency=concurrency)
+        print(json.dumps(report))
+    print(json.dumps({"server": await get_server_stats(args.host, args.port)}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m morpht5.serving", description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # The options of the model and its translator, shared by the commands running it
+    translator_parser = argparse.ArgumentParser(add_help=False)
+    translator_parser.add_argument("model", help="path or hub id of a MorphT5 model and its tokenizer")
+    translator_parser.add_argument("--device", default="cpu")
+    translator_parser.add_argument("--max_new_tokens", type=int, default=256)
+    translator_parser.add_argument("--num_beams", type=int, default=1)
+    translator_parser.add_argument("--no_block_count_stopping", action="store_true")
+    translator_parser.add_argument("--max_batch_tokens", type=int, default=8192, help="padded tokens of a batch")
+    translator_parser.add_argument("--max_batch_size", type=int, default=64)
+    translator_parser.add_argument("--cache", type=Path, default=None, help="SQLite file caching translations across runs")
+    translator_parser.add_argument("--cache_memory_entries", type=int, default=10_000, help="verses cached in memory")
+
+    serve_parser = subparsers.add_parser("serve", parents=[translator_parser], help="serve a model over HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--max_wait_ms", type=float, default=10.0, help="how long a request may wait for a batch")
+    serve_parser.add_argument("--max_pending", type=int, default=256, help="waiting requests beyond which 503 is returned")
+
+    translate_parser = subparsers.add_parser(
+        "translate", parents=[translator_parser], help="translate a JSONL corpus, resuming an interrupted run"
+    )
+    translate_parser.add_argument("input", help='JSONL file of {"words": [...], "tags": [...], ...}, - for stdin')
+    translate_parser.add_argument("-o", "--output", type=Path, required=True, help="JSONL file of the translations")
+    translate_parser.add_argument("--checkpoint", type=Path, default=None, help="progress file, next to the output if unset")
+    translate_parser.add_argument("--shard_size", type=int, default=1024, help="records translated between checkpoints")
+    translate_parser.add_argument("--overwrite", action="store_true", help="start over, replacing an existing output")
+
+    load_parser = subparsers.add_parser("load", help="measure the throughput and latency of a running server")
+    load_parser.add_argument("--host", default="127.0.0.1")
+    load_parser.add_argument("--port", type=int, default=8000)
+    load_parser.add_argument("--verses", type=Path, default=None, help='JSONL file of {"words": [...], "tags": [...]}')
+    load_parser.add_argument("--num_requests", type=int, default=256)
+    load_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args)
+    elif args.command == "translate":
+        translate(args)
+    else:
+        asyncio.run(load(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Dynamic micro-batching of concurrent requests."""
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class ServerOverloaded(Exception):
+    """Raised when a request arrives while the batcher already holds `max_pending` requests."""
+
+
+class RequestTooLarge(Exception):
+    """Raised for a request which alone exceeds the `max_batch_tokens` of a batch."""
+
+
+@dataclass
+class _PendingRequest:
+    item: Any
+    num_tokens: int
+    future: asyncio.Future
+    arrival: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class BatcherStats:
+    num_requests: int = 0
+    num_rejected: int = 0
+    num_batches: int = 0
+    num_padded_tokens: int = 0
+    num_tokens: int = 0
+    busy_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "num_requests": self.num_requests,
+            "num_rejected": self.num_rejected,
+            "num_batches": self.num_batches,
+            "mean_batch_size": round(self.num_requests / self.num_batches, 3) if self.num_batches else 0.0,
+            "padding_efficiency": round(self.num_tokens / self.num_padded_tokens, 3) if self.num_padded_tokens else 1.0,
+            "busy_seconds": round(self.busy_seconds, 3),
+        }
+
+
+class MicroBatcher:
+    """
+    Groups concurrent requests into batches and runs each batch with a single call of `process_batch`.
+
+    A batch opens with the oldest waiting request and takes in the requests arriving within `max_wait_ms` of it, as long as
+    it stays within `max_batch_size` requests and `max_batch_tokens` padded tokens (the batch size times its longest
+    request). `process_batch` runs in a worker thread, one batch at a time, so the event loop keeps accepting requests in
+    the meantime - under load, the next batch is already waiting when the previous one finishes.
+
+    Backpressure: at most `max_pending` requests wait for a batch, `submit` raises `ServerOverloaded` beyond that - and
+    `RequestTooLarge` for a request which would not fit any batch.
+
+    Example:
+        ```python
+        batcher = MicroBatcher(translator.translate, max_wait_ms=10, max_batch_tokens=4096)
+        await batcher.start()
+        blocks = await batcher.submit(encoded, num_tokens=len(encoded.input_ids))
+        ```
+
+    Args:
+        process_batch: Maps a list of items to the list of their results, in the same order
+        max_wait_ms: How long the oldest request of a batch may wait for others to join it
+        max_batch_tokens: Largest number of padded tokens (batch size times the longest request) of a batch
+        max_batch_size: Largest number of requests of a batch
+        max_pending: Largest number of requests waiting for a batch
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[Any]], Sequence[Any]],
+        max_wait_ms: float = 10.0,
+        max_batch_tokens: int = 8192,
+        max_batch_size: int = 64,
+        max_pending: int = 256,
+    ):
+        self.process_batch = process_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.stats = BatcherStats()
+        self._queue: asyncio.Queue[_PendingRequest] = asyncio.Queue(maxsize=max_pending)
+        self._carried_over: _PendingRequest | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="morpht5-batch")
+        self._worker: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, item: Any, num_tokens: int) -> Any:
+        """Queue an item of `num_tokens` tokens and wait for its result."""
+        if num_tokens > self.max_batch_tokens:
+            raise RequestTooLarge(f"The request has {num_tokens} tokens, but a batch holds at most {self.max_batch_tokens}")
+        request = _PendingRequest(item=item, num_tokens=num_tokens, future=asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(request)
+        except asyncio.QueueFull:
+            self.stats.num_rejected += 1
+            raise ServerOverloaded(f"{self._queue.maxsize} requests are already waiting") from None
+        return await request.future
+
+    @property
+    def num_pending(self) -> int:
+        return self._queue.qsize() + (self._carried_over is not None)
+
+    async def _collect_batch(self) -> list[_PendingRequest]:
+        first = self._carried_over or await self._queue.get()
+        self._carried_over = None
+        batch, max_tokens = [first], first.num_tokens
+        deadline = first.arrival + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                if (timeout := deadline - time.perf_counter()) > 0:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                else:
+                    # The window is over, but the requests which queued up in the meantime still join the batch
+                    request = self._queue.get_nowait()
+            except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                break
+            if (len(batch) + 1) * max(max_tokens, request.num_tokens) > self.max_batch_tokens:
+                self._carried_over = request
+                break
+            batch.append(request)
+            max_tokens = max(max_tokens, request.num_tokens)
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [request for request in await self._collect_batch() if not request.future.cancelled()]
+            if not batch:
+                continue
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self._executor, self.process_batch, [request.item for request in batch])
+            except Exception as error:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(error)
+                continue
+            finally:
+                self.stats.busy_seconds += time.perf_counter() - start
+            self.stats.num_requests += len(batch)
+            self.stats.num_batches += 1
+            self.stats.num_tokens += sum(request.num_tokens for request in batch)
+            self.stats.num_padded_tokens += len(batch) * max(request.num_tokens for request in batch)
+            for request, result in zip(batch, results):
+                if not request.future.done():
+                    request.future.set_result(result)
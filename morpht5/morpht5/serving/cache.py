@@ -0,0 +1,122 @@
+"""Persistent cache of verse translations, in front of tokenization and generation."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+def get_translation_cache_key(model_id: str, generation: dict[str, Any], words: list[str], tags: list[str]) -> str:
+    """
+    Combine everything a verse translation depends on into a single cache key.
+
+    The words are normalized (NFC, surrounding whitespace stripped), so that differently composed diacritics of the same
+    text share their translation.
+
+    >>> key = get_translation_cache_key("model", {"num_beams": 1}, ["ὁ", "λόγος"], ["Art-NMS", "N-NMS"])
+    >>> key == get_translation_cache_key("model", {"num_beams": 1}, [" ὁ", "λόγος"], ["Art-NMS", "N-NMS"])
+    True
+    >>> key == get_translation_cache_key("model", {"num_beams": 4}, ["ὁ", "λόγος"], ["Art-NMS", "N-NMS"])
+    False
+    """
+    words = [unicodedata.normalize("NFC", word).strip() for word in words]
+    components = {"model": model_id, "generation": generation, "words": words, "tags": [tag.strip() for tag in tags]}
+    return hashlib.sha256(json.dumps(components, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    def to_dict(self) -> dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hit_rate = (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+        return asdict(self) | {"hit_rate": round(hit_rate, 3)}
+
+
+class TranslationCache:
+    """
+    Two-tier cache of verse translations: an in-memory LRU tier in front of an (optional) on-disk SQLite tier.
+
+    Entries are keyed by `get_translation_cache_key` and hold the target blocks of a verse. An entry found on disk is
+    promoted to the memory tier; the memory tier evicts its least recently used entries beyond `max_memory_entries`, the
+    disk tier keeps everything. The cache can be shared between threads (e.g. the event loop and the batch worker of a
+    `TranslationServer`), and the SQLite file between processes.
+
+    Example:
+        ```python
+        translator = InterlinearTranslator(model, tokenizer, cache=TranslationCache("translations.sqlite"))
+        blocks = translator.translate_verses([(words, tags)])  # tokenizes and generates only the verses not cached yet
+        ```
+
+    Args:
+        path: SQLite file of the disk tier, memory only if None
+        max_memory_entries: Number of verses kept in memory
+    """
+
+    def __init__(self, path: Path | str | None = None, max_memory_entries: int = 10_000):
+        self.path = Path(path) if path is not None else None
+        self.max_memory_entries = max_memory_entries
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # A crash may lose the last entries, but never corrupts the file - fine for a cache
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, blocks TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> list[str] | None:
+        with self._lock:
+            if (blocks := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return blocks
+            if self._connection is not None:
+                row = self._connection.execute("SELECT blocks FROM translations WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.stats.disk_hits += 1
+                    blocks = json.loads(row[0])
+                    self._remember(key, blocks)
+                    return blocks
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, blocks: list[str]) -> None:
+        with self._lock:
+            self._remember(key, blocks)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO translations (key, blocks) VALUES (?, ?)",
+                    (key, json.dumps(blocks, ensure_ascii=False)),
+                )
+
+    def _remember(self, key: str, blocks: list[str]) -> None:
+        self._memory[key] = blocks
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of cached verses, on disk if there is a disk tier."""
+        with self._lock:
+            if self._connection is not None:
+                return self._connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            return len(self._memory)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,182 @@
+"""Translation of whole corpora, streamed from JSONL in shards which are checkpointed as they are completed."""
+
+import hashlib
+import itertools
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from transformers.utils import logging
+
+from .translator import InterlinearTranslator
+
+logger = logging.get_logger(__name__)
+
+
+def _update_records_digest(digest: "hashlib._Hash", records: Iterable[dict]) -> int:
+    """Add the records to the digest, returning their number."""
+    num_records = 0
+    for num_records, record in enumerate(records, start=1):
+        digest.update((json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n").encode())
+    return num_records
+
+
+@dataclass
+class CorpusCheckpoint:
+    """
+    Progress of a corpus translation: the shards completed so far, and the records and output bytes they hold.
+
+    `records_digest` is the SHA-256 of the records completed so far, so that a run resumed with other records is refused
+    rather than skipping records it has never translated.
+    """
+
+    num_shards: int = 0
+    num_records: int = 0
+    output_bytes: int = 0
+    records_digest: str = hashlib.sha256().hexdigest()
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusCheckpoint":
+        return cls(**json.loads(Path(path).read_text()))
+
+    def save(self, path: Path) -> None:
+        # Written aside and renamed, so an interruption leaves either the previous or the new checkpoint behind
+        tmp_path = Path(path).with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(asdict(self)))
+        tmp_path.replace(path)
+
+
+def read_records(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse JSONL records of `{"words": [...], "tags": [...]}`, one at a time, skipping blank lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record["words"], list) or not isinstance(record["tags"], list):
+                raise TypeError("words and tags must be lists")
+        except (json.JSONDecodeError, KeyError, TypeError) as error:
+            raise ValueError(f"Line {line_number} is not a {{'words': [...], 'tags': [...]}} record: {error}") from None
+        yield record
+
+
+def get_length_batches(lengths: list[int], max_batch_tokens: int, max_batch_size: int) -> list[list[int]]:
+    """
+    Group indices into batches of similar lengths, of at most `max_batch_tokens` padded tokens and `max_batch_size` items.
+
+    The longest items come first, so that running out of memory shows early. An item exceeding the token budget on its
+    own still gets a batch of its own.
+
+    >>> get_length_batches([3, 10, 1, 7, 2], max_batch_tokens=15, max_batch_size=8)
+    [[1], [3, 0], [4, 2]]
+    >>> get_length_batches([3, 10, 1, 7, 2], max_batch_tokens=100, max_batch_size=2)
+    [[1, 3], [0, 4], [2]]
+    """
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    for index in sorted(range(len(lengths)), key=lambda index: -lengths[index]):
+        # Sorted longest-first, so the first item of a batch is its longest
+        if batch and (len(batch) == max_batch_size or (len(batch) + 1) * lengths[batch[0]] > max_batch_tokens):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def translate_shard(
+    translator: InterlinearTranslator, records: list[dict], max_batch_tokens: int, max_batch_size: int
+) -> list[list[str]]:
+    """Translate the records of a shard in length-sorted batches, skipping the verses found in the translator's cache."""
+    blocks = [translator.lookup(record["words"], record["tags"]) for record in records]
+    missing = [index for index, verse_blocks in enumerate(blocks) if verse_blocks is None]
+    verses = [translator.encode(records[index]["words"], records[index]["tags"]) for index in missing]
+    for batch in get_length_batches([len(verse) for verse in verses], max_batch_tokens, max_batch_size):
+        for position, verse_blocks in zip(batch, translator.translate([verses[position] for position in batch])):
+            blocks[missing[position]] = verse_blocks
+    return blocks
+
+
+def translate_corpus(
+    translator: InterlinearTranslator,
+    records: Iterable[dict],
+    output_path: Path,
+    checkpoint_path: Path | None = None,
+    shard_size: int = 1024,
+    max_batch_tokens: int = 8192,
+    max_batch_size: int = 64,
+    overwrite: bool = False,
+) -> CorpusCheckpoint:
+    """
+    Translate a stream of verse records shard by shard, appending them to a JSONL file with their target `blocks`.
+
+    Only a single shard is held in memory at a time. The records keep all their other fields (e.g. the siglum of the
+    verse), and are written in their original order. Once a shard is written, the progress is saved to the checkpoint -
+    a run given the same records and checkpoint again skips the completed shards, and drops whatever an interruption left
+    of the next one from the output. The skipped records are checked against the checkpoint, and an existing output
+    without a checkpoint is only replaced with `overwrite`.
+
+    Example:
+        ```python
+        with open("nt.jsonl") as lines:
+            translate_corpus(translator, read_records(lines), Path("nt.translated.jsonl"))
+        ```
+
+    Args:
+        translator: Translates the verses, see `InterlinearTranslator`
+        records: Records of `{"words": [...], "tags": [...], ...}`, see `read_records`
+        output_path: JSONL file the translated records are written to
+        checkpoint_path: File the progress is saved to, next to the output if None
+        shard_size: Number of records translated (and checkpointed) together
+        max_batch_tokens: Largest number of padded tokens of a batch
+        max_batch_size: Largest number of verses of a batch
+        overwrite: Start over, discarding an existing output and its checkpoint
+
+    Raises:
+        FileExistsError: If the output is not empty but has no checkpoint, and `overwrite` is not set
+        ValueError: If the output or the records do not match the checkpoint
+    """
+    output_path = Path(output_path)
+    checkpoint_path = Path(checkpoint_path or output_path.with_name(output_path.name + ".checkpoint.json"))
+    resuming = checkpoint_path.exists() and not overwrite
+    checkpoint = CorpusCheckpoint.load(checkpoint_path) if resuming else CorpusCheckpoint()
+    output_bytes = output_path.stat().st_size if output_path.exists() else 0
+    if output_bytes and not resuming and not overwrite:
+        raise FileExistsError(f"{output_path} is not empty and has no checkpoint to resume from, refusing to overwrite it")
+    if output_bytes < checkpoint.output_bytes:
+        raise ValueError(
+            f"{output_path} holds {output_bytes} bytes, but {checkpoint_path} has {checkpoint.output_bytes} bytes written"
+        )
+    records = iter(records)
+    records_digest = hashlib.sha256()
+    num_skipped = _update_records_digest(records_digest, itertools.islice(records, checkpoint.num_records))
+    if num_skipped < checkpoint.num_records or records_digest.hexdigest() != checkpoint.records_digest:
+        raise ValueError(f"The records do not start with the {checkpoint.num_records} records of {checkpoint_path}")
+    if checkpoint.num_records:
+        logger.info(f"Resuming after {checkpoint.num_shards} shards ({checkpoint.num_records} records)")
+    if overwrite:
+        checkpoint_path.unlink(missing_ok=True)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "r+b" if output_bytes else "wb") as output:
+        output.truncate(checkpoint.output_bytes)
+        output.seek(checkpoint.output_bytes)
+        while shard := list(itertools.islice(records, shard_size)):
+            blocks = translate_shard(translator, shard, max_batch_tokens, max_batch_size)
+            for record, verse_blocks in zip(shard, blocks):
+                output.write((json.dumps(record | {"blocks": verse_blocks}, ensure_ascii=False) + "\n").encode())
+            output.flush()
+            os.fsync(output.fileno())
+            _update_records_digest(records_digest, shard)
+            checkpoint = CorpusCheckpoint(
+                num_shards=checkpoint.num_shards + 1,
+                num_records=checkpoint.num_records + len(shard),
+                output_bytes=output.tell(),
+                records_digest=records_digest.hexdigest(),
+            )
+            checkpoint.save(checkpoint_path)
+            logger.info(f"Translated {checkpoint.num_shards} shards ({checkpoint.num_records} records)")
+    return checkpoint
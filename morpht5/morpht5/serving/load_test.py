@@ -0,0 +1,113 @@
+"""Local load generator measuring the throughput and latency of a `TranslationServer`."""
+
+import asyncio
+import itertools
+import json
+import statistics
+import time
+from typing import Any
+
+# John 5:8, used when no verses are given
+EXAMPLE_VERSE = {
+    "words": ["Λέγει", "αὐτῷ", "ὁ", "Ἰησοῦς", "Ἔγειρε", "ἆρον", "τὸν", "κράβαττόν", "σου", "καὶ", "περιπάτει"],
+    "tags": [
+        "V-PIA-3S",
+        "PPro-DM3S",
+        "Art-NMS",
+        "N-NMS",
+        "V-PMA-2S",
+        "V-AMA-2S",
+        "Art-AMS",
+        "N-AMS",
+        "PPro-G2S",
+        "Conj",
+        "V-PMA-2S",
+    ],
+}
+
+
+async def request_json(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    payload: dict[str, Any] | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Send a request over a kept-alive connection and return the status code and the JSON body of the response."""
+    body = json.dumps(payload, ensure_ascii=False).encode() if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    status_line, *header_lines = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").rstrip("\r\n").split("\r\n")
+    headers = {name.strip().lower(): value.strip() for name, _, value in (line.partition(":") for line in header_lines)}
+    response = await reader.readexactly(int(headers.get("content-length", 0)))
+    return int(status_line.split(" ")[1]), json.loads(response) if response else {}
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {"count": 0}
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "count": len(latencies),
+        "mean_ms": round(1000 * statistics.fmean(latencies), 3),
+        "p50_ms": round(1000 * quantiles[49], 3),
+        "p90_ms": round(1000 * quantiles[89], 3),
+        "p99_ms": round(1000 * quantiles[98], 3),
+        "max_ms": round(1000 * max(latencies), 3),
+    }
+
+
+async def run_load_test(
+    host: str,
+    port: int,
+    verses: list[dict[str, list[str]]],
+    num_requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """
+    Send `num_requests` translation requests over `concurrency` connections, each sending its next request as soon as the
+    previous one is answered (a closed loop), and report the throughput and the latency of the answered requests.
+
+    The verses are sent in turn. Rejected requests (`503`, see `TranslationServer`) are counted, not retried.
+    """
+    counter = itertools.count()
+    latencies, statuses, num_words = [], [], 0
+
+    async def client() -> None:
+        nonlocal num_words
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while (index := next(counter)) < num_requests:
+                verse = verses[index % len(verses)]
+                start = time.perf_counter()
+                status, _ = await request_json(reader, writer, "POST", "/translate", verse)
+                statuses.append(status)
+                if status == 200:
+                    latencies.append(time.perf_counter() - start)
+                    num_words += len(verse["words"])
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "num_requests": num_requests,
+        "num_ok": statuses.count(200),
+        "num_rejected": statuses.count(503),
+        "num_errors": len(statuses) - statuses.count(200) - statuses.count(503),
+        "seconds": round(duration, 3),
+        "requests_per_second": round(statuses.count(200) / duration, 3),
+        "words_per_second": round(num_words / duration, 3),
+        "latency": summarize_latencies(latencies),
+    }
+
+
+async def get_server_stats(host: str, port: int) -> dict[str, Any]:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        return (await request_json(reader, writer, "GET", "/stats"))[1]
+    finally:
+        writer.close()
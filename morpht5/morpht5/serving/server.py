@@ -0,0 +1,169 @@
+"""Minimal asyncio HTTP/1.1 service translating verses with dynamic micro-batching."""
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any
+
+from transformers.utils import logging
+
+from .batching import MicroBatcher, RequestTooLarge, ServerOverloaded
+from .translator import InterlinearTranslator
+
+logger = logging.get_logger(__name__)
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str, headers: dict[str, str] | None = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class TranslationServer:
+    """
+    Serves interlinear translations over HTTP, batching the concurrent requests together.
+
+    Endpoints:
+        - `POST /translate` with `{"words": [...], "tags": [...]}` returns `{"blocks": [...]}`, a target block per word
+        - `GET /stats` returns the batching (and caching) statistics, see `BatcherStats` and `CacheStats`
+        - `GET /health` returns `{"status": "ok"}`
+
+    A request which does not fit the batcher's queue (see `MicroBatcher.max_pending`) is answered right away with
+    `503 Service Unavailable` and a `Retry-After` header, so that a burst degrades into fast rejections instead of an
+    ever-growing latency. Connections are kept alive between requests.
+
+    Example:
+        ```python
+        server = TranslationServer(InterlinearTranslator(model, tokenizer), max_wait_ms=10, max_batch_tokens=4096)
+        asyncio.run(server.serve_forever(host="127.0.0.1", port=8000))
+        ```
+
+    Args:
+        translator: Encodes and translates the verses
+        **batcher_kwargs: Batching and backpressure limits, see `MicroBatcher`
+    """
+
+    def __init__(self, translator: InterlinearTranslator, **batcher_kwargs: Any):
+        self.translator = translator
+        self.batcher = MicroBatcher(translator.translate, **batcher_kwargs)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Start the batcher and the HTTP server, return the latter (`port=0` binds a free port)."""
+        await self.batcher.start()
+        return await asyncio.start_server(self.handle_connection, host=host, port=port)
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        server = await self.start(host=host, port=port)
+        logger.warning("Serving translations on %s", ", ".join(str(socket.getsockname()) for socket in server.sockets))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    method, path, headers, body = await read_request(reader)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                except HTTPError as error:
+                    write_response(writer, error.status, {"error": str(error)}, error.headers, keep_alive=False)
+                    await writer.drain()
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload, response_headers = HTTPStatus.OK, await self.route(method, path, body), {}
+                except HTTPError as error:
+                    status, payload, response_headers = error.status, {"error": str(error)}, error.headers
+                except Exception:
+                    logger.exception("Failed to serve %s %s", method, path)
+                    status, payload, response_headers = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal error"}, {}
+                write_response(writer, status, payload, response_headers, keep_alive=keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        match method, path:
+            case "POST", "/translate":
+                return await self.translate(body)
+            case "GET", "/stats":
+                stats = self.batcher.stats.to_dict() | {"num_pending": self.batcher.num_pending}
+                if self.translator.cache is not None:
+                    stats["cache"] = self.translator.cache.stats.to_dict()
+                return stats
+            case "GET", "/health":
+                return {"status": "ok"}
+            case _, "/translate" | "/stats" | "/health":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on {path}")
+            case _:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"{path} not found")
+
+    async def translate(self, body: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(body)
+            words, tags = list(request["words"]), list(request["tags"])
+            # A cached verse skips the tokenization and the batching altogether. The lookup may read the SQLite file, and
+            # wait for the batch worker writing to it, so it runs off the event loop
+            if (blocks := await asyncio.to_thread(self.translator.lookup, words, tags)) is not None:
+                return {"blocks": blocks}
+            verse = self.translator.encode(words, tags)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as error:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Expected {{'words': [...], 'tags': [...]}}: {error}") from None
+        try:
+            blocks = await self.batcher.submit(verse, num_tokens=len(verse))
+        except ServerOverloaded as error:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, str(error), headers={"Retry-After": "1"}) from None
+        except RequestTooLarge as error:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, str(error)) from None
+        return {"blocks": blocks}
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str], bytes]:
+    """Read a single HTTP/1.1 request: its method, path, (lowercased) headers and body."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+    try:
+        method, path, _ = request_line.split(" ", 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Malformed request line {request_line!r}") from None
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        content_length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed Content-Length") from None
+    if content_length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Negative Content-Length")
+    if content_length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"The body exceeds {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(content_length) if content_length else b""
+    return method, path.split("?", 1)[0], headers, body
+
+
+def write_response(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    keep_alive: bool = True,
+) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+    } | headers
+    head = f"HTTP/1.1 {status.value} {status.phrase}\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
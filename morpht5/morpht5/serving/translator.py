@@ -0,0 +1,158 @@
+"""Batched interlinear translation of verses with a MorphT5 model."""
+
+import hashlib
+from dataclasses import dataclass
+
+import torch
+from transformers import PreTrainedModel
+
+from ..constants import SentinelToken
+from ..generation import get_block_count_generation_kwargs
+from ..tokenizer import MorphT5Tokenizer
+from .cache import TranslationCache, get_translation_cache_key
+
+
+@dataclass
+class EncodedVerse:
+    """The encoder inputs of a single verse, before padding."""
+
+    input_ids: list[int]
+    input_morphs: list[int]
+    cache_key: str | None = None  # the translation is cached under this key once generated
+
+    def __len__(self) -> int:
+        return len(self.input_ids)
+
+
+def _get_model_fingerprint(model: PreTrainedModel) -> str:
+    """SHA-256 of the config and the weights of a model, which tells apart different weights loaded from the same path."""
+    digest = hashlib.sha256(model.config.to_json_string().encode())
+    for name, tensor in model.state_dict().items():
+        digest.update(f"{name}:{tensor.dtype}:{tuple(tensor.shape)}".encode())
+        digest.update(tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy())
+    return digest.hexdigest()
+
+
+class InterlinearTranslator:
+    """
+    Translates batches of verses - words with their morphological tags - into one target block per word.
+
+    Encoding and translating are separate steps, so that the requests can be encoded (and measured, for batching) as they
+    arrive and translated together later, see `MicroBatcher`. With a `cache`, the translations are cached per verse and a
+    verse found in it (see `lookup`) needs neither.
+
+    Example:
+        ```python
+        translator = InterlinearTranslator(model, tokenizer)
+        verses = [translator.encode(words, tags) for words, tags in requests]
+        blocks = translator.translate(verses)
+        # Or, in a single step which skips the cached verses
+        blocks = translator.translate_verses(requests)
+        ```
+
+    Args:
+        model: Any MorphT5 model for conditional generation
+        tokenizer: Tokenizer the model was trained with
+        max_new_tokens: Largest number of tokens generated for a verse
+        num_beams: Number of beams of beam search, greedy search if 1
+        block_count_stopping: End each verse once it has as many target blocks as words, see
+            `get_block_count_generation_kwargs`
+        cache: Cache of the translations, see `TranslationCache`
+        model_id: Identifies the model in the cache keys. Defaults to the path it was loaded from, along with a
+            fingerprint of its config and weights if the cache has a disk tier - which outlives the process, and may
+            meet other weights loaded from the same path. Setting it saves hashing the weights when starting
+    """
+
+    def __init__(
+        self,
+        model: PreTrainedModel,
+        tokenizer: MorphT5Tokenizer,
+        max_new_tokens: int = 256,
+        num_beams: int = 1,
+        block_count_stopping: bool = True,
+        cache: TranslationCache | None = None,
+        model_id: str | None = None,
+    ):
+        self.model = model.eval()
+        self.tokenizer = tokenizer
+        self.max_new_tokens = max_new_tokens
+        self.num_beams = num_beams
+        self.block_count_stopping = block_count_stopping
+        self.cache = cache
+        if model_id is None:
+            model_id = model.name_or_path
+            if cache is not None and cache.path is not None:
+                model_id += f"@{_get_model_fingerprint(model)}"
+        self.model_id = model_id
+
+    @property
+    def generation_settings(self) -> dict:
+        """Everything besides the model and the verse the translation depends on."""
+        return {
+            "max_new_tokens": self.max_new_tokens,
+            "num_beams": self.num_beams,
+            "block_count_stopping": self.block_count_stopping,
+            "generation_config": self.model.generation_config.to_diff_dict(),
+        }
+
+    def get_cache_key(self, words: list[str], tags: list[str]) -> str:
+        return get_translation_cache_key(self.model_id, self.generation_settings, words, tags)
+
+    def lookup(self, words: list[str], tags: list[str]) -> list[str] | None:
+        """The cached target blocks of a verse, None if it is not cached (or there is no cache)."""
+        return self.cache.get(self.get_cache_key(words, tags)) if self.cache is not None else None
+
+    def encode(self, words: list[str], tags: list[str]) -> EncodedVerse:
+        if len(words) != len(tags):
+            raise ValueError(f"Every word needs a morphological tag, got {len(words)} words and {len(tags)} tags")
+        if not words:
+            raise ValueError("The verse has no words")
+        encoding = self.tokenizer(text=words, morph_tags=tags)
+        return EncodedVerse(
+            input_ids=list(encoding["input_ids"][0]),
+            input_morphs=encoding["input_morphs"][0].tolist(),
+            cache_key=self.get_cache_key(words, tags) if self.cache is not None else None,
+        )
+
+    def translate_verses(self, verses: list[tuple[list[str], list[str]]]) -> list[list[str]]:
+        """Translate a batch of verses given as (words, tags), tokenizing and generating only those not cached yet."""
+        blocks = [self.lookup(words, tags) for words, tags in verses]
+        if missing := [index for index, verse_blocks in enumerate(blocks) if verse_blocks is None]:
+            for index, verse_blocks in zip(missing, self.translate([self.encode(*verses[index]) for index in missing])):
+                blocks[index] = verse_blocks
+        return blocks
+
+    def collate(self, verses: list[EncodedVerse]) -> dict[str, torch.Tensor]:
+        """Right-pad the verses into a batch of encoder inputs."""
+        max_length = max(len(verse) for verse in verses)
+        input_ids = torch.full((len(verses), max_length), self.tokenizer.text_tokenizer.pad_token_id)
+        input_morphs = torch.full((len(verses), max_length), self.tokenizer.morph_tokenizer.pad_token_id)
+        attention_mask = torch.zeros((len(verses), max_length), dtype=torch.long)
+        for row, verse in enumerate(verses):
+            input_ids[row, : len(verse)] = torch.tensor(verse.input_ids)
+            input_morphs[row, : len(verse)] = torch.tensor(verse.input_morphs)
+            attention_mask[row, : len(verse)] = 1
+        return {"input_ids": input_ids, "attention_mask": attention_mask, "input_morphs": input_morphs}
+
+    def translate(self, verses: list[EncodedVerse]) -> list[list[str]]:
+        """Translate a batch of verses, returning the target blocks of each."""
+        inputs = {name: tensor.to(self.model.device) for name, tensor in self.collate(verses).items()}
+        generate_kwargs = {}
+        if self.block_count_stopping:
+            generate_kwargs = get_block_count_generation_kwargs(
+                self.tokenizer, inputs["input_ids"], getattr(self.model, "target_vocabulary", None)
+            )
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs, max_new_tokens=self.max_new_tokens, num_beams=self.num_beams, **generate_kwargs
+            )
+        blocks = [self.split_blocks(output) for output in outputs.tolist()]
+        if self.cache is not None:
+            for verse, verse_blocks in zip(verses, blocks):
+                if verse.cache_key is not None:
+                    self.cache.put(verse.cache_key, verse_blocks)
+        return blocks
+
+    def split_blocks(self, output_ids: list[int]) -> list[str]:
+        decoded = self.tokenizer.decode(output_ids, skip_special_tokens=True, keep_block_separator=True)
+        return [block.strip() for block in decoded.split(SentinelToken.TARGET.value)]
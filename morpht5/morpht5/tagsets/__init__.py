@@ -1,4 +1,24 @@
-from .biblehub import Tag as BibleHubTag
-from .oblubienica import Tag as OblubienicaTag
+from typing import TYPE_CHECKING
 
-__all__ = ["BibleHubTag", "OblubienicaTag"]
+from ..utils.lazy import get_lazy_attribute_loaders
+
+if TYPE_CHECKING:
+    from .biblehub import TABLE as BIBLEHUB_TAGSET
+    from .biblehub import Tag as BibleHubTag
+    from .oblubienica import TABLE as OBLUBIENICA_TAGSET
+    from .oblubienica import Tag as OblubienicaTag
+    from .table import TagsetTable
+
+# Each tagset is only loaded once it is used
+__getattr__, __dir__ = get_lazy_attribute_loaders(
+    __name__,
+    {
+        "BIBLEHUB_TAGSET": (".biblehub", "TABLE"),
+        "BibleHubTag": (".biblehub", "Tag"),
+        "OBLUBIENICA_TAGSET": (".oblubienica", "TABLE"),
+        "OblubienicaTag": (".oblubienica", "Tag"),
+        "TagsetTable": (".table", "TagsetTable"),
+    },
+)
+
+__all__ = ["BIBLEHUB_TAGSET", "BibleHubTag", "OBLUBIENICA_TAGSET", "OblubienicaTag", "TagsetTable"]
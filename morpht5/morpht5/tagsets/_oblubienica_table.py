@@ -0,0 +1,1577 @@
+# Generated by `python -m morpht5.tagsets.generate` - edit the tags (only), and regenerate the features
+# fmt: off
+TAGS = (
+    "a_ Acc Pl f",
+    "a_ Acc Pl f Cmp",
+    "a_ Acc Pl m",
+    "a_ Acc Pl m Cmp",
+    "a_ Acc Pl n",
+    "a_ Acc Pl n Cmp",
+    "a_ Acc Sg f",
+    "a_ Acc Sg f Cmp",
+    "a_ Acc Sg f Sup",
+    "a_ Acc Sg m",
+    "a_ Acc Sg m Cmp",
+    "a_ Acc Sg n",
+    "a_ Acc Sg n Cmp",
+    "a_ Dat Pl f",
+    "a_ Dat Pl m",
+    "a_ Dat Pl m Cmp",
+    "a_ Dat Pl n",
+    "a_ Dat Sg f",
+    "a_ Dat Sg f Cmp",
+    "a_ Dat Sg f Sup",
+    "a_ Dat Sg m",
+    "a_ Dat Sg m Cmp",
+    "a_ Dat Sg m Sup",
+    "a_ Dat Sg n",
+    "a_ Dat Sg n Cmp",
+    "a_ Gen",
+    "a_ Gen Pl f",
+    "a_ Gen Pl m",
+    "a_ Gen Pl m Cmp",
+    "a_ Gen Pl n",
+    "a_ Gen Pl n Cmp",
+    "a_ Gen Sg f",
+    "a_ Gen Sg f Cmp",
+    "a_ Gen Sg m",
+    "a_ Gen Sg m Cmp",
+    "a_ Gen Sg n",
+    "a_ Gen Sg n Sup",
+    "a_ Nom",
+    "a_ Nom Pl f",
+    "a_ Nom Pl f Cmp",
+    "a_ Nom Pl m",
+    "a_ Nom Pl m Cmp",
+    "a_ Nom Pl n",
+    "a_ Nom Pl n Cmp",
+    "a_ Nom Pl n Sup",
+    "a_ Nom Sg",
+    "a_ Nom Sg f",
+    "a_ Nom Sg f Cmp",
+    "a_ Nom Sg m",
+    "a_ Nom Sg m Att",
+    "a_ Nom Sg m Cmp",
+    "a_ Nom Sg n",
+    "a_ Nom Sg n Cmp",
+    "a_ Voc Pl m",
+    "a_ Voc Sg f",
+    "a_ Voc Sg m",
+    "Adv",
+    "Adv Con",
+    "Adv Int",
+    "Adv Sup",
+    "Aramaic",
+    "Cond",
+    "Cond Con",
+    "Conj",
+    "Hebrew",
+    "Inj",
+    "n_ Acc Pl f",
+    "n_ Acc Pl f Con",
+    "n_ Acc Pl m",
+    "n_ Acc Pl n",
+    "n_ Acc Sg f",
+    "n_ Acc Sg f Con",
+    "n_ Acc Sg m",
+    "n_ Acc Sg n",
+    "n_ Dat Pl f",
+    "n_ Dat Pl m",
+    "n_ Dat Pl n",
+    "n_ Dat Sg f",
+    "n_ Dat Sg m",
+    "n_ Dat Sg n",
+    "n_ Gen",
+    "n_ Gen Pl f",
+    "n_ Gen Pl m",
+    "n_ Gen Pl n",
+    "n_ Gen Sg f",
+    "n_ Gen Sg m",
+    "n_ Gen Sg n",
+    "n_ Nom m",
+    "n_ Nom Pl f",
+    "n_ Nom Pl m",
+    "n_ Nom Pl n",
+    "n_ Nom Sg f",
+    "n_ Nom Sg m",
+    "n_ Nom Sg n",
+    "n_ Nom Sg n Con",
+    "n_ Voc Pl f",
+    "n_ Voc Pl m",
+    "n_ Voc Pl n",
+    "n_ Voc Sg f",
+    "n_ Voc Sg m",
+    "n_ Voc Sg n",
+    "ni letter",
+    "ni other",
+    "ni proper",
+    "Part",
+    "Part Int",
+    "Part Neg",
+    "pc Acc Pl m",
+    "pc Dat Pl m",
+    "pc Gen Pl m",
+    "pc Gen Pl n",
+    "pd Acc Pl f",
+    "pd Acc Pl m",
+    "pd Acc Pl n",
+    "pd Acc Sg f",
+    "pd Acc Sg m",
+    "pd Acc Sg m Con",
+    "pd Acc Sg n",
+    "pd Dat Pl f",
+    "pd Dat Pl m",
+    "pd Dat Pl n",
+    "pd Dat Sg f",
+    "pd Dat Sg m",
+    "pd Dat Sg n",
+    "pd Gen Pl f",
+    "pd Gen Pl m",
+    "pd Gen Pl n",
+    "pd Gen Sg f",
+    "pd Gen Sg m",
+    "pd Gen Sg n",
+    "pd Nom Pl f",
+    "pd Nom Pl m",
+    "pd Nom Pl m Con",
+    "pd Nom Pl n",
+    "pd Nom Pl n Con",
+    "pd Nom Sg f",
+    "pd Nom Sg m",
+    "pd Nom Sg m Con",
+    "pd Nom Sg n",
+    "pf 1 Acc Sg m",
+    "pf 1 Dat Sg m",
+    "pf 1 Gen Sg m",
+    "pf 2 Acc Sg m",
+    "pf 2 Dat Sg m",
+    "pf 2 Gen Sg m",
+    "pf 3 Acc Pl f",
+    "pf 3 Acc Pl m",
+    "pf 3 Acc Pl n",
+    "pf 3 Acc Sg f",
+    "pf 3 Acc Sg m",
+    "pf 3 Dat Pl f",
+    "pf 3 Dat Pl m",
+    "pf 3 Dat Sg f",
+    "pf 3 Dat Sg m",
+    "pf 3 Gen Pl m",
+    "pf 3 Gen Sg f",
+    "pf 3 Gen Sg m",
+    "pi Acc Pl f",
+    "pi Acc Sg f",
+    "pi Acc Sg m",
+    "pi Acc Sg n",
+    "pi Dat Pl m",
+    "pi Dat Sg f",
+    "pi Dat Sg m",
+    "pi Dat Sg n",
+    "pi Gen Pl m",
+    "pi Gen Pl n",
+    "pi Gen Sg f",
+    "pi Gen Sg m",
+    "pi Gen Sg n",
+    "pi Nom Pl m",
+    "pi Nom Pl n",
+    "pi Nom Sg f",
+    "pi Nom Sg m",
+    "pi Nom Sg n",
+    "pk Acc Pl m",
+    "pk Acc Pl n",
+    "pk Acc Sg m",
+    "pk Acc Sg n",
+    "pk Dat Sg n",
+    "pk Gen Pl m",
+    "pk Nom Pl f",
+    "pk Nom Pl m",
+    "pk Nom Pl n",
+    "pk Nom Sg m",
+    "pk Nom Sg n",
+    "pp 1 Acc Pl",
+    "pp 1 Acc Sg",
+    "pp 1 Acc Sg Con",
+    "pp 1 Dat Pl",
+    "pp 1 Dat Sg",
+    "pp 1 Dat Sg Con",
+    "pp 1 Gen Pl",
+    "pp 1 Gen Sg",
+    "pp 1 Nom Pl",
+    "pp 1 Nom Sg",
+    "pp 1 Nom Sg Con",
+    "pp 2 Acc Pl",
+    "pp 2 Acc Sg",
+    "pp 2 Dat Pl",
+    "pp 2 Dat Sg",
+    "pp 2 Gen Pl",
+    "pp 2 Gen Sg",
+    "pp 2 Nom Pl",
+    "pp 2 Nom Sg",
+    "pp Acc Pl f",
+    "pp Acc Pl m",
+    "pp Acc Pl n",
+    "pp Acc Sg f",
+    "pp Acc Sg m",
+    "pp Acc Sg n",
+    "pp Dat Pl f",
+    "pp Dat Pl m",
+    "pp Dat Pl n",
+    "pp Dat Sg f",
+    "pp Dat Sg m",
+    "pp Dat Sg n",
+    "pp Gen Pl f",
+    "pp Gen Pl m",
+    "pp Gen Pl n",
+    "pp Gen Sg f",
+    "pp Gen Sg m",
+    "pp Gen Sg n",
+    "pp Nom Pl m",
+    "pp Nom Pl n",
+    "pp Nom Sg f",
+    "pp Nom Sg m",
+    "pp Nom Sg n",
+    "pq Acc Pl f",
+    "pq Acc Pl m",
+    "pq Acc Pl n",
+    "pq Acc Sg f",
+    "pq Acc Sg n",
+    "pq Dat Sg n",
+    "pq Gen Pl n",
+    "pq Nom Pl f",
+    "pq Nom Pl m",
+    "pq Nom Sg m",
+    "pq Nom Sg n",
+    "pr Acc Pl f",
+    "pr Acc Pl m",
+    "pr Acc Pl n",
+    "pr Acc Sg f",
+    "pr Acc Sg m",
+    "pr Acc Sg n",
+    "pr Dat Pl f",
+    "pr Dat Pl m",
+    "pr Dat Pl n",
+    "pr Dat Sg f",
+    "pr Dat Sg m",
+    "pr Dat Sg n",
+    "pr Gen Pl f",
+    "pr Gen Pl m",
+    "pr Gen Pl n",
+    "pr Gen Sg f",
+    "pr Gen Sg m",
+    "pr Gen Sg n",
+    "pr Gen Sg n Att",
+    "pr Nom Pl f",
+    "pr Nom Pl m",
+    "pr Nom Pl n",
+    "pr Nom Sg f",
+    "pr Nom Sg m",
+    "pr Nom Sg n",
+    "Prep",
+    "ps 1 Acc Pl",
+    "ps 1 Acc Sg",
+    "ps 1 Dat Pl",
+    "ps 1 Dat Sg",
+    "ps 1 Gen Pl",
+    "ps 1 Gen Sg",
+    "ps 1 Nom Pl",
+    "ps 1 Nom Sg",
+    "ps 2 Acc Pl",
+    "ps 2 Acc Sg",
+    "ps 2 Dat Pl",
+    "ps 2 Dat Sg",
+    "ps 2 Gen Pl",
+    "ps 2 Gen Sg",
+    "ps 2 Nom Pl",
+    "ps 2 Nom Sg",
+    "px Acc Pl f",
+    "px Acc Pl m",
+    "px Acc Pl n",
+    "px Acc Sg f",
+    "px Acc Sg m",
+    "px Acc Sg n",
+    "px Dat Pl m",
+    "px Dat Sg f",
+    "px Dat Sg m",
+    "px Dat Sg n",
+    "px Gen Pl f",
+    "px Gen Pl m",
+    "px Gen Pl n",
+    "px Gen Sg m",
+    "px Gen Sg n",
+    "px Nom Pl f",
+    "px Nom Pl m",
+    "px Nom Pl n",
+    "px Nom Sg f",
+    "px Nom Sg j",
+    "px Nom Sg m",
+    "px Nom Sg n",
+    "t_ Acc Pl f",
+    "t_ Acc Pl m",
+    "t_ Acc Pl n",
+    "t_ Acc Sg f",
+    "t_ Acc Sg m",
+    "t_ Acc Sg n",
+    "t_ Dat Pl f",
+    "t_ Dat Pl m",
+    "t_ Dat Pl n",
+    "t_ Dat Sg f",
+    "t_ Dat Sg m",
+    "t_ Dat Sg n",
+    "t_ Gen Pl f",
+    "t_ Gen Pl m",
+    "t_ Gen Pl n",
+    "t_ Gen Sg f",
+    "t_ Gen Sg m",
+    "t_ Gen Sg n",
+    "t_ Nom Pl f",
+    "t_ Nom Pl m",
+    "t_ Nom Pl n",
+    "t_ Nom Sg f",
+    "t_ Nom Sg m",
+    "t_ Nom Sg n",
+    "vi 2Aor Act 1 Pl",
+    "vi 2Aor Act 1 Sg",
+    "vi 2Aor Act 2 Pl",
+    "vi 2Aor Act 2 Sg",
+    "vi 2Aor Act 3 Pl",
+    "vi 2Aor Act 3 Pl Att",
+    "vi 2Aor Act 3 Sg",
+    "vi 2Aor Mid 1 Pl",
+    "vi 2Aor Mid 1 Sg",
+    "vi 2Aor Mid 2 Pl",
+    "vi 2Aor Mid 2 Sg",
+    "vi 2Aor Mid 3 Pl",
+    "vi 2Aor Mid 3 Sg",
+    "vi 2Aor midD 1 Sg",
+    "vi 2Aor midD 2 Pl",
+    "vi 2Aor midD 2 Sg",
+    "vi 2Aor midD 3 Pl",
+    "vi 2Aor midD 3 Sg",
+    "vi 2Aor Pas 1 Pl",
+    "vi 2Aor Pas 1 Sg",
+    "vi 2Aor Pas 2 Pl",
+    "vi 2Aor Pas 2 Sg",
+    "vi 2Aor Pas 3 Pl",
+    "vi 2Aor Pas 3 Sg",
+    "vi 2Aor pasD 1 Pl",
+    "vi 2Aor pasD 1 Sg",
+    "vi 2Aor pasD 2 Pl",
+    "vi 2Aor pasD 3 Pl",
+    "vi 2Aor pasD 3 Sg",
+    "vi 2Fut Mid 3 Sg",
+    "vi 2Fut midD 3 Pl",
+    "vi 2Fut Pas 1 Pl",
+    "vi 2Fut Pas 2 Pl",
+    "vi 2Fut Pas 2 Sg",
+    "vi 2Fut Pas 3 Pl",
+    "vi 2Fut Pas 3 Sg",
+    "vi 2Fut pasD 3 Pl",
+    "vi 2Fut pasD 3 Sg",
+    "vi 2Perf Act 1 Pl",
+    "vi 2Perf Act 1 Pl Att",
+    "vi 2Perf Act 1 Sg",
+    "vi 2Perf Act 2 Pl",
+    "vi 2Perf Act 2 Pl Att",
+    "vi 2Perf Act 2 Sg",
+    "vi 2Perf Act 3 Pl",
+    "vi 2Perf Act 3 Pl Att",
+    "vi 2Perf Act 3 Sg",
+    "vi 2Perf Act 3 Sg Att",
+    "vi 2Plup Act 3 Sg",
+    "vi Aor Act 1 Pl",
+    "vi Aor Act 1 Sg",
+    "vi Aor Act 2 Pl",
+    "vi Aor Act 2 Sg",
+    "vi Aor Act 3 Pl",
+    "vi Aor Act 3 Sg",
+    "vi Aor Mid 1 Pl",
+    "vi Aor Mid 1 Sg",
+    "vi Aor Mid 2 Pl",
+    "vi Aor Mid 2 Sg",
+    "vi Aor Mid 3 Pl",
+    "vi Aor Mid 3 Sg",
+    "vi Aor midD 1 Pl",
+    "vi Aor midD 1 Sg",
+    "vi Aor midD 2 Pl",
+    "vi Aor midD 2 Sg",
+    "vi Aor midD 3 Pl",
+    "vi Aor midD 3 Sg",
+    "vi Aor midD/pasD 3 Pl",
+    "vi Aor midD/pasD 3 Sg",
+    "vi Aor Pas 1 Pl",
+    "vi Aor Pas 1 Sg",
+    "vi Aor Pas 2 Pl",
+    "vi Aor Pas 2 Sg",
+    "vi Aor Pas 3 Pl",
+    "vi Aor Pas 3 Sg",
+    "vi Aor Pas 3 Sg MidS",
+    "vi Aor pasD 1 Pl",
+    "vi Aor pasD 1 Pl Att",
+    "vi Aor pasD 1 Sg",
+    "vi Aor pasD 1 Sg Att",
+    "vi Aor pasD 2 Pl",
+    "vi Aor pasD 2 Pl Att",
+    "vi Aor pasD 3 Pl",
+    "vi Aor pasD 3 Pl Att",
+    "vi Aor pasD 3 Sg",
+    "vi Aor pasD 3 Sg Att",
+    "vi Fut Act 1 Pl",
+    "vi Fut Act 1 Sg",
+    "vi Fut Act 1 Sg Att",
+    "vi Fut Act 2 Pl",
+    "vi Fut Act 2 Sg",
+    "vi Fut Act 3 Pl",
+    "vi Fut Act 3 Pl Att",
+    "vi Fut Act 3 Sg",
+    "vi Fut Act 3 Sg Att",
+    "vi Fut Mid 1 Pl",
+    "vi Fut Mid 1 Sg",
+    "vi Fut Mid 2 Pl",
+    "vi Fut Mid 2 Sg",
+    "vi Fut Mid 3 Pl",
+    "vi Fut Mid 3 Sg",
+    "vi Fut midD 1 Pl",
+    "vi Fut midD 1 Sg",
+    "vi Fut midD 2 Pl",
+    "vi Fut midD 2 Pl Att",
+    "vi Fut midD 2 Sg",
+    "vi Fut midD 3 Pl",
+    "vi Fut midD 3 Sg",
+    "vi Fut midD/pasD 3 Pl",
+    "vi Fut midD/pasD 3 Sg",
+    "vi Fut Pas 1 Pl",
+    "vi Fut Pas 1 Sg",
+    "vi Fut Pas 2 Pl",
+    "vi Fut Pas 2 Sg",
+    "vi Fut Pas 3 Pl",
+    "vi Fut Pas 3 Sg",
+    "vi Fut pasD 1 Sg",
+    "vi Fut pasD 3 Pl",
+    "vi Fut pasD 3 Sg",
+    "vi Fut Pres 1 Sg",
+    "vi Fut vxx 1 Pl",
+    "vi Fut vxx 1 Sg",
+    "vi Fut vxx 2 Pl",
+    "vi Fut vxx 2 Sg",
+    "vi Fut vxx 3 Pl",
+    "vi Fut vxx 3 Sg",
+    "vi Impf Act 1 Pl",
+    "vi Impf Act 1 Sg",
+    "vi Impf Act 2 Pl",
+    "vi Impf Act 2 Sg",
+    "vi Impf Act 3 Pl",
+    "vi Impf Act 3 Sg",
+    "vi Impf Act 3 Sg Att",
+    "vi Impf im-Act 3 Sg",
+    "vi Impf Mid 1 Pl",
+    "vi Impf Mid 1 Sg",
+    "vi Impf Mid 3 Pl",
+    "vi Impf Mid 3 Sg",
+    "vi Impf Mid/Pas 3 Pl",
+    "vi Impf mid/pas 3 Sg",
+    "vi Impf midD 3 Pl",
+    "vi Impf midD/pasD 1 Pl",
+    "vi Impf midD/pasD 1 Sg",
+    "vi Impf midD/pasD 2 Pl",
+    "vi Impf midD/pasD 2 Sg",
+    "vi Impf midD/pasD 3 Pl",
+    "vi Impf midD/pasD 3 Pl Att",
+    "vi Impf midD/pasD 3 Sg",
+    "vi Impf midD/pasD 3 Sg Att",
+    "vi Impf Pas 1 Pl",
+    "vi Impf Pas 1 Sg",
+    "vi Impf Pas 2 Pl",
+    "vi Impf Pas 3 Pl",
+    "vi Impf Pas 3 Sg",
+    "vi Impf vxx 1 Pl",
+    "vi Impf vxx 1 Sg",
+    "vi Impf vxx 2 Pl",
+    "vi Impf vxx 2 Sg",
+    "vi Impf vxx 3 Pl",
+    "vi Impf vxx 3 Sg",
+    "vi Perf Act 1 Pl",
+    "vi Perf Act 1 Pl Att",
+    "vi Perf Act 1 Sg",
+    "vi Perf Act 1 Sg Att",
+    "vi Perf Act 2 Pl",
+    "vi Perf Act 2 Pl Att",
+    "vi Perf Act 2 Sg",
+    "vi Perf Act 2 Sg Att",
+    "vi Perf Act 3 Pl",
+    "vi Perf Act 3 Pl Att",
+    "vi Perf Act 3 Sg",
+    "vi Perf Act 3 Sg Att",
+    "vi Perf Mid 2 Sg",
+    "vi Perf Mid 3 Sg",
+    "vi Perf Mid/Pas 1 Sg",
+    "vi Perf Mid/Pas 3 Sg",
+    "vi Perf midD 3 Sg",
+    "vi Perf midD/pasD 1 Pl",
+    "vi Perf midD/pasD 1 Sg",
+    "vi Perf midD/pasD 3 Sg",
+    "vi Perf Pas 1 Pl",
+    "vi Perf Pas 1 Sg",
+    "vi Perf Pas 2 Pl",
+    "vi Perf Pas 2 Sg",
+    "vi Perf Pas 3 Pl",
+    "vi Perf Pas 3 Sg",
+    "vi Plup Act 1 Sg",
+    "vi Plup Act 2 Pl",
+    "vi Plup Act 2 Sg",
+    "vi Plup Act 3 Pl",
+    "vi Plup Act 3 Pl Att",
+    "vi Plup Act 3 Sg",
+    "vi Plup Act 3 Sg Att",
+    "vi Plup Mid 3 Pl",
+    "vi Plup midD 3 Sg",
+    "vi Plup Pas 3 Sg",
+    "vi Pres Act 1 Pl",
+    "vi Pres Act 1 Sg",
+    "vi Pres Act 1 Sg Con",
+    "vi Pres Act 2 Pl",
+    "vi Pres Act 2 Sg",
+    "vi Pres Act 3 Pl",
+    "vi Pres Act 3 Pl Att",
+    "vi Pres Act 3 Sg",
+    "vi Pres im-Act 3 Sg",
+    "vi Pres Mid 1 Pl",
+    "vi Pres Mid 1 Sg",
+    "vi Pres Mid 2 Pl",
+    "vi Pres Mid 3 Pl",
+    "vi Pres Mid 3 Sg",
+    "vi Pres mid/pas 1 Pl",
+    "vi Pres mid/pas 1 Sg",
+    "vi Pres mid/pas 2 Pl",
+    "vi Pres mid/pas 3 Pl",
+    "vi Pres mid/pas 3 Sg",
+    "vi Pres midD/pasD 1 Pl",
+    "vi Pres midD/pasD 1 Sg",
+    "vi Pres midD/pasD 1 Sg Con",
+    "vi Pres midD/pasD 2 Pl",
+    "vi Pres midD/pasD 2 Sg",
+    "vi Pres midD/pasD 2 Sg Att",
+    "vi Pres midD/pasD 2 Sg Con",
+    "vi Pres midD/pasD 3 Pl",
+    "vi Pres midD/pasD 3 Sg",
+    "vi Pres Pas 1 Pl",
+    "vi Pres Pas 1 Sg",
+    "vi Pres Pas 2 Pl",
+    "vi Pres Pas 2 Sg",
+    "vi Pres Pas 2 Sg Irr",
+    "vi Pres Pas 3 Pl",
+    "vi Pres Pas 3 Sg",
+    "vi Pres vxx 1 Pl",
+    "vi Pres vxx 1 Sg",
+    "vi Pres vxx 2 Pl",
+    "vi Pres vxx 2 Sg",
+    "vi Pres vxx 3 Pl",
+    "vi Pres vxx 3 Sg",
+    "vm 2Aor Act 2 Pl",
+    "vm 2Aor Act 2 Sg",
+    "vm 2Aor Act 3 Pl",
+    "vm 2Aor Act 3 Sg",
+    "vm 2Aor Mid 2 Pl",
+    "vm 2Aor Mid 2 Sg",
+    "vm 2Aor midD 2 Sg",
+    "vm 2Aor midD 3 Sg",
+    "vm 2Aor Pas 2 Pl",
+    "vm 2Aor Pas 2 Sg",
+    "vm 2Aor Pas 3 Sg",
+    "vm Aor Act 2 Pl",
+    "vm Aor Act 2 Sg",
+    "vm Aor Act 3 Pl",
+    "vm Aor Act 3 Sg",
+    "vm Aor Mid 2 Pl",
+    "vm Aor Mid 2 Sg",
+    "vm Aor Mid 3 Sg",
+    "vm Aor midD 2 Pl",
+    "vm Aor midD 2 Sg",
+    "vm Aor midD 3 Pl",
+    "vm Aor midD 3 Sg",
+    "vm Aor Pas 2 Pl",
+    "vm Aor Pas 2 Sg",
+    "vm Aor Pas 3 Pl",
+    "vm Aor Pas 3 Sg",
+    "vm Aor pasD 2 Pl",
+    "vm Aor pasD 2 Sg",
+    "vm Aor pasD 3 Sg",
+    "vm Perf Act 2 Pl",
+    "vm Perf Pas 2 Pl",
+    "vm Perf Pas 2 Sg",
+    "vm Pres Act 2 Pl",
+    "vm Pres Act 2 Sg",
+    "vm Pres Act 3 Pl",
+    "vm Pres Act 3 Sg",
+    "vm Pres Mid 2 Pl",
+    "vm Pres Mid 2 Sg",
+    "vm Pres Mid 3 Sg",
+    "vm Pres mid/pas 2 Pl",
+    "vm Pres Mid/Pas 3 Pl",
+    "vm Pres midD/pasD 2 Pl",
+    "vm Pres midD/pasD 2 Sg",
+    "vm Pres midD/pasD 3 Pl",
+    "vm Pres midD/pasD 3 Sg",
+    "vm Pres Pas 2 Pl",
+    "vm Pres Pas 2 Sg",
+    "vm Pres Pas 3 Pl",
+    "vm Pres Pas 3 Sg",
+    "vm Pres vxx 2 Sg",
+    "vm Pres vxx 3 Pl",
+    "vm Pres vxx 3 Sg",
+    "vm txx vxx 2 Pl",
+    "vm txx vxx 2 Sg",
+    "vn 2Aor Act",
+    "vn 2Aor Mid",
+    "vn 2Aor midD",
+    "vn 2Aor Pas",
+    "vn 2Aor pasD",
+    "vn 2Perf Act",
+    "vn Aor Act",
+    "vn Aor Mid",
+    "vn Aor midD",
+    "vn Aor Pas",
+    "vn Aor Pas MidS",
+    "vn Aor pasD",
+    "vn Fut midD",
+    "vn Fut vxx",
+    "vn Perf Act",
+    "vn Perf Act Acc Att",
+    "vn Perf Mid/Pas",
+    "vn Perf Pas",
+    "vn Pres Act",
+    "vn Pres im-Act",
+    "vn Pres Mid",
+    "vn Pres mid/pas",
+    "vn Pres midD",
+    "vn Pres midD/pasD",
+    "vn Pres Pas",
+    "vn Pres Pas 2 Pl",
+    "vn Pres vxx",
+    "vo 2Aor Act 3 Pl",
+    "vo 2Aor Act 3 Sg",
+    "vo 2Aor midD 1 Sg",
+    "vo 2Aor midD 3 Sg",
+    "vo Aor Act 3 Pl",
+    "vo Aor Act 3 Sg",
+    "vo Aor midD 1 Sg",
+    "vo Aor Pas 3 Sg",
+    "vo Aor pasD 3 Sg",
+    "vo Pres Act 2 Pl",
+    "vo Pres Act 3 Pl",
+    "vo Pres Act 3 Sg",
+    "vo Pres midD/pasD 1 Sg",
+    "vo Pres midD/pasD 3 Pl",
+    "vo Pres midD/pasD 3 Sg",
+    "vo Pres vxx 3 Sg",
+    "vp 2Aor Act Acc Pl f",
+    "vp 2Aor Act Acc Pl m",
+    "vp 2Aor Act Acc Sg f",
+    "vp 2Aor Act Acc Sg m",
+    "vp 2Aor Act Acc Sg n",
+    "vp 2Aor Act Dat Pl f",
+    "vp 2Aor Act Dat Pl m",
+    "vp 2Aor Act Dat Sg f",
+    "vp 2Aor Act Dat Sg m",
+    "vp 2Aor Act Gen Pl m",
+    "vp 2Aor Act Gen Sg f",
+    "vp 2Aor Act Gen Sg m",
+    "vp 2Aor Act Gen Sg n",
+    "vp 2Aor Act Nom Pl f",
+    "vp 2Aor Act Nom Pl m",
+    "vp 2Aor Act Nom Pl n",
+    "vp 2Aor Act Nom Sg f",
+    "vp 2Aor Act Nom Sg m",
+    "vp 2Aor Act Nom Sg n",
+    "vp 2Aor Mid Gen Sg m",
+    "vp 2Aor Mid Nom Pl m",
+    "vp 2Aor Mid Nom Sg m",
+    "vp 2Aor midD Acc Pl m",
+    "vp 2Aor midD Acc Pl n",
+    "vp 2Aor midD Acc Sg f",
+    "vp 2Aor midD Acc Sg m",
+    "vp 2Aor midD Acc Sg n",
+    "vp 2Aor midD Dat Pl m",
+    "vp 2Aor midD Gen Pl f",
+    "vp 2Aor midD Gen Pl m",
+    "vp 2Aor midD Gen Pl n",
+    "vp 2Aor midD Gen Sg f",
+    "vp 2Aor midD Gen Sg m",
+    "vp 2Aor midD Gen Sg n",
+    "vp 2Aor midD Nom Pl f",
+    "vp 2Aor midD Nom Pl m",
+    "vp 2Aor midD Nom Sg m",
+    "vp 2Aor Pas Acc Sg m",
+    "vp 2Aor Pas Dat Sg n",
+    "vp 2Aor Pas Gen Pl m",
+    "vp 2Aor Pas Nom Pl f",
+    "vp 2Aor Pas Nom Pl m",
+    "vp 2Aor Pas Nom Sg f",
+    "vp 2Aor Pas Nom Sg m",
+    "vp 2Aor Pas Nom Sg n",
+    "vp 2Aor vxx Gen Pl m",
+    "vp 2Perf Act Acc Pl m",
+    "vp 2Perf Act Acc Pl m Att",
+    "vp 2Perf Act Acc Pl n",
+    "vp 2Perf Act Acc Sg f",
+    "vp 2Perf Act Acc Sg m",
+    "vp 2Perf Act Acc Sg n",
+    "vp 2Perf Act Dat Sg n",
+    "vp 2Perf Act Nom Pl m",
+    "vp 2Perf Act Nom Sg f",
+    "vp 2Perf Act Nom Sg m",
+    "vp 2Perf Act Nom Sg n",
+    "vp 2Perf Pas Acc Sg m",
+    "vp Aor Act Acc Pl m",
+    "vp Aor Act Acc Pl n",
+    "vp Aor Act Acc Sg f",
+    "vp Aor Act Acc Sg m",
+    "vp Aor Act Acc Sg n",
+    "vp Aor Act Dat Pl m",
+    "vp Aor Act Dat Sg m",
+    "vp Aor Act Gen Pl m",
+    "vp Aor Act Gen Sg m",
+    "vp Aor Act Nom Pl",
+    "vp Aor Act Nom Pl f",
+    "vp Aor Act Nom Pl m",
+    "vp Aor Act Nom Sg",
+    "vp Aor Act Nom Sg f",
+    "vp Aor Act Nom Sg m",
+    "vp Aor Act Nom Sg n",
+    "vp Aor Mid Acc Pl m",
+    "vp Aor Mid Dat Pl m",
+    "vp Aor Mid Gen Pl m",
+    "vp Aor Mid Gen Sg m",
+    "vp Aor Mid Nom Pl m",
+    "vp Aor Mid Nom Sg f",
+    "vp Aor Mid Nom Sg m",
+    "vp Aor midD Acc Pl m",
+    "vp Aor midD Acc Sg m",
+    "vp Aor midD Dat Pl m",
+    "vp Aor midD Gen Sg f",
+    "vp Aor midD Nom Pl m",
+    "vp Aor midD Nom Sg f",
+    "vp Aor midD Nom Sg m",
+    "vp Aor midD/pasD Nom Sg m",
+    "vp Aor midD/pasD Nom Sg n",
+    "vp Aor Pas Acc Pl m",
+    "vp Aor Pas Acc Pl n",
+    "vp Aor Pas Acc Sg f",
+    "vp Aor Pas Acc Sg m",
+    "vp Aor Pas Acc Sg n",
+    "vp Aor Pas Dat Pl n",
+    "vp Aor Pas Dat Sg f",
+    "vp Aor Pas Dat Sg m",
+    "vp Aor Pas Gen Pl f",
+    "vp Aor Pas Gen Pl m",
+    "vp Aor Pas Gen Pl n",
+    "vp Aor Pas Gen Sg f",
+    "vp Aor Pas Gen Sg m",
+    "vp Aor Pas Gen Sg n",
+    "vp Aor Pas Nom Pl m",
+    "vp Aor Pas Nom Pl n",
+    "vp Aor Pas Nom Sg f",
+    "vp Aor Pas Nom Sg m",
+    "vp Aor Pas Nom Sg m MidS",
+    "vp Aor Pas Nom Sg n",
+    "vp Aor pasD Acc Pl m",
+    "vp Aor pasD Dat Sg m",
+    "vp Aor pasD Gen Pl m",
+    "vp Aor pasD Gen Pl n",
+    "vp Aor pasD Gen Sg m",
+    "vp Aor pasD Nom Pl f",
+    "vp Aor pasD Nom Pl m",
+    "vp Aor pasD Nom Sg f",
+    "vp Aor pasD Nom Sg m",
+    "vp Aor pasD Nom Sg n",
+    "vp Fut Act Acc Pl n",
+    "vp Fut Act Nom Pl m",
+    "vp Fut Act Nom Sg m",
+    "vp Fut midD Acc Sg n",
+    "vp Fut Pas Gen Pl n",
+    "vp Fut vxx Acc Sg n",
+    "vp Perf Act Acc Pl m",
+    "vp Perf Act Acc Pl n",
+    "vp Perf Act Acc Sg f",
+    "vp Perf Act Acc Sg m",
+    "vp Perf Act Acc Sg m Con",
+    "vp Perf Act Acc Sg n",
+    "vp Perf Act Dat Pl m",
+    "vp Perf Act Dat Sg m",
+    "vp Perf Act Dat Sg n",
+    "vp Perf Act Gen Pl m",
+    "vp Perf Act Gen Pl n",
+    "vp Perf Act Gen Sg",
+    "vp Perf Act Gen Sg f",
+    "vp Perf Act Gen Sg m",
+    "vp Perf Act Gen Sg n Att",
+    "vp Perf Act Nom Pl f",
+    "vp Perf Act Nom Pl m",
+    "vp Perf Act Nom Pl m Att",
+    "vp Perf Act Nom Pl m Con",
+    "vp Perf Act Nom Pl n",
+    "vp Perf Act Nom Sg f",
+    "vp Perf Act Nom Sg m",
+    "vp Perf Act Nom Sg m Att",
+    "vp Perf Act Nom Sg n",
+    "vp Perf Mid Acc Sg m",
+    "vp Perf Mid Nom Pl m",
+    "vp Perf Mid Nom Sg m",
+    "vp Perf Mid/Pas Acc Pl m",
+    "vp Perf Mid/Pas Acc Sg f",
+    "vp Perf Mid/Pas Acc Sg m",
+    "vp Perf Mid/Pas Dat Pl m",
+    "vp Perf Mid/Pas Gen Pl m",
+    "vp Perf Mid/Pas Gen Sg f",
+    "vp Perf Mid/Pas Nom Pl m",
+    "vp Perf Mid/Pas Nom Sg m",
+    "vp Perf Mid/Pas Nom Sg n",
+    "vp Perf midD/pasD Acc Pl m",
+    "vp Perf midD/pasD Dat Pl f",
+    "vp Perf midD/pasD Nom Pl m",
+    "vp Perf midD/pasD Nom Sg m",
+    "vp Perf Pas Acc Pl f",
+    "vp Perf Pas Acc Pl m",
+    "vp Perf Pas Acc Pl n",
+    "vp Perf Pas Acc Sg f",
+    "vp Perf Pas Acc Sg m",
+    "vp Perf Pas Acc Sg n",
+    "vp Perf Pas Acc Sg n Att",
+    "vp Perf Pas Dat Pl m",
+    "vp Perf Pas Dat Pl n",
+    "vp Perf Pas Dat Sg f",
+    "vp Perf Pas Dat Sg m",
+    "vp Perf Pas Dat Sg n",
+    "vp Perf Pas Gen Pl m",
+    "vp Perf Pas Gen Pl n",
+    "vp Perf Pas Gen Sg f",
+    "vp Perf Pas Gen Sg m",
+    "vp Perf Pas Gen Sg n",
+    "vp Perf Pas Nom Pl f",
+    "vp Perf Pas Nom Pl m",
+    "vp Perf Pas Nom Pl n",
+    "vp Perf Pas Nom Sg f",
+    "vp Perf Pas Nom Sg m",
+    "vp Perf Pas Nom Sg n",
+    "vp Perf Pas Nom Sg n Att",
+    "vp Perf Pas Voc Sg m",
+    "vp Pres Act Acc Pl f",
+    "vp Pres Act Acc Pl m",
+    "vp Pres Act Acc Pl n",
+    "vp Pres Act Acc Sg f",
+    "vp Pres Act Acc Sg m",
+    "vp Pres Act Acc Sg n",
+    "vp Pres Act Dat Pl f",
+    "vp Pres Act Dat Pl m",
+    "vp Pres Act Dat Pl n",
+    "vp Pres Act Dat Sg f",
+    "vp Pres Act Dat Sg m",
+    "vp Pres Act Dat Sg n",
+    "vp Pres Act Gen Pl f",
+    "vp Pres Act Gen Pl m",
+    "vp Pres Act Gen Pl n",
+    "vp Pres Act Gen Sg f",
+    "vp Pres Act Gen Sg m",
+    "vp Pres Act Gen Sg n",
+    "vp Pres Act Nom Pl",
+    "vp Pres Act Nom Pl f",
+    "vp Pres Act Nom Pl m",
+    "vp Pres Act Nom Pl n",
+    "vp Pres Act Nom Sg f",
+    "vp Pres Act Nom Sg m",
+    "vp Pres Act Nom Sg n",
+    "vp Pres im-Act Acc Pl n",
+    "vp Pres im-Act Nom Sg n",
+    "vp Pres Mid Acc Pl m",
+    "vp Pres Mid Acc Sg f",
+    "vp Pres Mid Acc Sg m",
+    "vp Pres Mid Acc Sg n",
+    "vp Pres Mid Dat Pl m",
+    "vp Pres Mid Dat Sg m",
+    "vp Pres Mid Gen Pl f",
+    "vp Pres Mid Gen Pl m",
+    "vp Pres Mid Gen Sg",
+    "vp Pres Mid Gen Sg f",
+    "vp Pres Mid Gen Sg m",
+    "vp Pres Mid Gen Sg m Tra",
+    "vp Pres Mid Gen Sg n",
+    "vp Pres Mid Nom Pl f",
+    "vp Pres Mid Nom Pl m",
+    "vp Pres Mid Nom Sg",
+    "vp Pres Mid Nom Sg f",
+    "vp Pres Mid Nom Sg m",
+    "vp Pres Mid Nom Sg n",
+    "vp Pres Mid/Pas Acc Pl m",
+    "vp Pres Mid/Pas Acc Sg n",
+    "vp Pres mid/pas Dat Pl m",
+    "vp Pres mid/pas Dat Sg m",
+    "vp Pres Mid/Pas Dat Sg n",
+    "vp Pres mid/pas Gen Pl n",
+    "vp Pres mid/pas Gen Sg f",
+    "vp Pres mid/pas Gen Sg m",
+    "vp Pres Mid/Pas Gen Sg n",
+    "vp Pres mid/pas Nom Pl f",
+    "vp Pres mid/pas Nom Pl m",
+    "vp Pres Mid/Pas Nom Pl n",
+    "vp Pres mid/pas Nom Sg f",
+    "vp Pres Mid/Pas Nom Sg m",
+    "vp Pres Mid/Pas Nom Sg n",
+    "vp Pres midD Nom Pl m",
+    "vp Pres midD/pasD Acc Pl f",
+    "vp Pres midD/pasD Acc Pl m",
+    "vp Pres midD/pasD Acc Pl n",
+    "vp Pres midD/pasD Acc Sg f",
+    "vp Pres midD/pasD Acc Sg m",
+    "vp Pres midD/pasD Acc Sg n",
+    "vp Pres midD/pasD Dat Pl f",
+    "vp Pres midD/pasD Dat Pl m",
+    "vp Pres midD/pasD Dat Pl n",
+    "vp Pres midD/pasD Dat Sg f",
+    "vp Pres midD/pasD Dat Sg m",
+    "vp Pres midD/pasD Dat Sg n",
+    "vp Pres midD/pasD Gen Pl f",
+    "vp Pres midD/pasD Gen Pl m",
+    "vp Pres midD/pasD Gen Pl n",
+    "vp Pres midD/pasD Gen Sg f",
+    "vp Pres midD/pasD Gen Sg m",
+    "vp Pres midD/pasD Gen Sg n",
+    "vp Pres midD/pasD Nom Pl f",
+    "vp Pres midD/pasD Nom Pl m",
+    "vp Pres midD/pasD Nom Pl n",
+    "vp Pres midD/pasD Nom Sg f",
+    "vp Pres midD/pasD Nom Sg m",
+    "vp Pres midD/pasD Nom Sg n",
+    "vp Pres Pas Acc Pl",
+    "vp Pres Pas Acc Pl f",
+    "vp Pres Pas Acc Pl m",
+    "vp Pres Pas Acc Pl n",
+    "vp Pres Pas Acc Sg f",
+    "vp Pres Pas Acc Sg m",
+    "vp Pres Pas Acc Sg n",
+    "vp Pres Pas Dat Pl m",
+    "vp Pres Pas Dat Pl n",
+    "vp Pres Pas Dat Sg f",
+    "vp Pres Pas Dat Sg m",
+    "vp Pres Pas Dat Sg n",
+    "vp Pres Pas Gen Pl m",
+    "vp Pres Pas Gen Pl n",
+    "vp Pres Pas Gen Sg f",
+    "vp Pres Pas Gen Sg m",
+    "vp Pres Pas Gen Sg n",
+    "vp Pres Pas Nom Pl f",
+    "vp Pres Pas Nom Pl m",
+    "vp Pres Pas Nom Pl n",
+    "vp Pres Pas Nom Sg f",
+    "vp Pres Pas Nom Sg m",
+    "vp Pres Pas Nom Sg n",
+    "vp Pres pasD Nom Pl m",
+    "vp Pres vxx Acc Pl m",
+    "vp Pres vxx Acc Pl n",
+    "vp Pres vxx Acc Sg f",
+    "vp Pres vxx Acc Sg m",
+    "vp Pres vxx Acc Sg n",
+    "vp Pres vxx Dat Pl m",
+    "vp Pres vxx Dat Pl n",
+    "vp Pres vxx Dat Sg f",
+    "vp Pres vxx Dat Sg m",
+    "vp Pres vxx Gen Pl f",
+    "vp Pres vxx Gen Pl m",
+    "vp Pres vxx Gen Pl n",
+    "vp Pres vxx Gen Sg f",
+    "vp Pres vxx Gen Sg m",
+    "vp Pres vxx Gen Sg n",
+    "vp Pres vxx Nom Pl f",
+    "vp Pres vxx Nom Pl m",
+    "vp Pres vxx Nom Pl n",
+    "vp Pres vxx Nom Sg f",
+    "vp Pres vxx Nom Sg m",
+    "vs 2Aor Act 1 Pl",
+    "vs 2Aor Act 1 Sg",
+    "vs 2Aor Act 2 Pl",
+    "vs 2Aor Act 2 Sg",
+    "vs 2Aor Act 3 Pl",
+    "vs 2Aor Act 3 Sg",
+    "vs 2Aor Mid 1 Pl",
+    "vs 2Aor Mid 1 Sg",
+    "vs 2Aor Mid 2 Sg",
+    "vs 2Aor Mid 3 Pl",
+    "vs 2Aor Mid 3 Sg",
+    "vs 2Aor midD 1 Pl",
+    "vs 2Aor midD 1 Sg",
+    "vs 2Aor midD 2 Pl",
+    "vs 2Aor midD 3 Pl",
+    "vs 2Aor midD 3 Sg",
+    "vs 2Aor Pas 1 Pl",
+    "vs 2Aor Pas 2 Pl",
+    "vs 2Aor Pas 2 Sg",
+    "vs 2Aor Pas 3 Pl",
+    "vs 2Aor Pas 3 Sg",
+    "vs 2Aor pasD 2 Pl",
+    "vs 2Aor vxx 2 Pl",
+    "vs Aor Act 1 Pl",
+    "vs Aor Act 1 Sg",
+    "vs Aor Act 2 Pl",
+    "vs Aor Act 2 Sg",
+    "vs Aor Act 3 Pl",
+    "vs Aor Act 3 Sg",
+    "vs Aor Mid 1 Pl",
+    "vs Aor Mid 1 Sg",
+    "vs Aor Mid 2 Pl",
+    "vs Aor Mid 2 Sg",
+    "vs Aor Mid 3 Pl",
+    "vs Aor Mid 3 Sg",
+    "vs Aor midD 1 Pl",
+    "vs Aor midD 1 Sg",
+    "vs Aor midD 2 Pl",
+    "vs Aor midD 2 Sg",
+    "vs Aor midD 3 Pl",
+    "vs Aor midD 3 Sg",
+    "vs Aor Pas 1 Pl",
+    "vs Aor Pas 1 Sg",
+    "vs Aor Pas 2 Pl",
+    "vs Aor Pas 2 Sg",
+    "vs Aor Pas 3 Pl",
+    "vs Aor Pas 3 Sg",
+    "vs Aor pasD 1 Pl",
+    "vs Aor pasD 1 Sg",
+    "vs Aor pasD 2 Pl",
+    "vs Aor pasD 2 Sg",
+    "vs Aor pasD 3 Pl",
+    "vs Aor pasD 3 Sg",
+    "vs Aor Pres 2 Pl",
+    "vs Perf Act 1 Pl",
+    "vs Perf Act 1 Sg",
+    "vs Perf Act 2 Pl",
+    "vs Perf Act 2 Sg",
+    "vs Pres Acc 1 Sg",
+    "vs Pres Act 1 Pl",
+    "vs Pres Act 1 Sg",
+    "vs Pres Act 2 Pl",
+    "vs Pres Act 2 Sg",
+    "vs Pres Act 3 Pl",
+    "vs Pres Act 3 Sg",
+    "vs Pres im-Act 3 Sg",
+    "vs Pres Mid 1 Pl",
+    "vs Pres Mid 1 Sg",
+    "vs Pres Mid 2 Sg",
+    "vs Pres Mid 3 Sg",
+    "vs Pres Mid/Pas 3 Sg",
+    "vs Pres midD/pasD 1 Pl",
+    "vs Pres midD/pasD 1 Sg",
+    "vs Pres midD/pasD 2 Pl",
+    "vs Pres midD/pasD 2 Sg",
+    "vs Pres midD/pasD 3 Pl",
+    "vs Pres midD/pasD 3 Sg",
+    "vs Pres Pas 1 Pl",
+    "vs Pres Pas 1 Sg",
+    "vs Pres Pas 2 Pl",
+    "vs Pres Pas 3 Pl",
+    "vs Pres Pas 3 Sg",
+    "vs Pres vxx 1 Pl",
+    "vs Pres vxx 1 Sg",
+    "vs Pres vxx 2 Pl",
+    "vs Pres vxx 2 Sg",
+    "vs Pres vxx 3 Pl",
+    "vs Pres vxx 3 Sg",
+)
+
+FEATURES = {
+    "pos": (
+        ("", "Adv", "Aramaic", "Cond", "Conj", "Hebrew", "Inj", "Part", "Prep", "a_", "n_", "ni", "pc", "pd", "pf", "pi", "pk", "pp", "pq", "pr", "ps", "px", "t_", "v"),
+        (
+            b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t'
+            b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t'
+            b'\t\t\t\t\t\t\t\t\x01\x01\x01\x01\x02\x03\x03\x04\x05\x06\n\n\n\n\n\n'
+            b'\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n'
+            b'\n\n\n\n\n\x0b\x0b\x0b\x07\x07\x07\x0c\x0c\x0c\x0c\r\r\r\r\r\r\r\r\r'
+            b'\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\x0e\x0e\x0e\x0e\x0e'
+            b'\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f'
+            b'\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x11\x11\x11\x11\x11\x11'
+            b'\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11'
+            b'\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x11\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x13'
+            b'\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13\x13'
+            b'\x08\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x15\x15\x15\x15\x15\x15\x15'
+            b'\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x15\x16\x16\x16\x16\x16\x16\x16\x16\x16'
+            b'\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+            b'\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17\x17'
+        ),
+    ),
+    "person": (
+        ("", "1", "2", "3"),
+        (
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x02\x02'
+            b'\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x02\x02\x03\x03\x03\x01\x01'
+            b'\x02\x02\x03\x03\x01\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01\x02\x03\x03\x03\x03\x01\x02'
+            b'\x02\x03\x03\x03\x03\x01\x01\x01\x02\x02\x02\x03\x03\x03\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01'
+            b'\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x03\x03\x01\x01\x02\x02\x03\x03\x03\x01\x01\x01\x01\x02'
+            b'\x02\x03\x03\x03\x03\x01\x01\x01\x02\x02\x03\x03\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01\x02\x02'
+            b'\x02\x03\x03\x03\x03\x01\x01\x02\x02\x03\x03\x01\x03\x03\x01\x01\x01\x02\x02\x03\x03\x01\x01\x02'
+            b'\x02\x03\x03\x03\x03\x01\x01\x03\x03\x03\x03\x03\x01\x01\x02\x02\x03\x03\x03\x03\x01\x01\x02\x03'
+            b'\x03\x01\x01\x02\x02\x03\x03\x01\x01\x01\x01\x02\x02\x02\x02\x03\x03\x03\x03\x02\x03\x01\x03\x03'
+            b'\x01\x01\x03\x01\x01\x02\x02\x03\x03\x01\x02\x02\x03\x03\x03\x03\x03\x03\x03\x01\x01\x01\x02\x02'
+            b'\x03\x03\x03\x03\x01\x01\x02\x03\x03\x01\x01\x02\x03\x03\x01\x01\x01\x02\x02\x02\x02\x03\x03\x01'
+            b'\x01\x02\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x02\x02\x03\x03\x02\x02\x02\x03\x02\x02\x03\x02'
+            b'\x02\x03\x03\x02\x02\x03\x02\x02\x03\x03\x02\x02\x03\x03\x02\x02\x03\x02\x02\x02\x02\x02\x03\x03'
+            b'\x02\x02\x03\x02\x03\x02\x02\x03\x03\x02\x02\x03\x03\x02\x03\x03\x02\x02\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x03\x03\x01'
+            b'\x03\x03\x03\x01\x03\x03\x02\x03\x03\x01\x03\x03\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01'
+            b'\x02\x02\x03\x03\x01\x01\x02\x03\x03\x01\x01\x02\x03\x03\x01\x02\x02\x03\x03\x02\x02\x01\x01\x02'
+            b'\x02\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x01\x01\x02'
+            b'\x02\x03\x03\x02\x01\x01\x02\x02\x01\x01\x01\x02\x02\x03\x03\x03\x01\x01\x02\x03\x03\x01\x01\x02'
+            b'\x02\x03\x03\x01\x01\x02\x03\x03\x01\x01\x02\x02\x03\x03'
+        ),
+    ),
+    "tense": (
+        ("", "aorist", "aorist/present", "future", "future/present", "imperfect", "perfect", "pluperfect", "present", "second aorist", "second future", "second perfect", "second pluperfect", "unspecified"),
+        (
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t\t\t\t\t\t\t\t\t'
+            b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\n\n\n\n'
+            b'\n\n\n\n\n\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0c\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03'
+            b'\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x04\x03\x03\x03\x03\x03\x03\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\t\t\t\t\t\t\t\t\t\t\t\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x06\x06\x06\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\r\r\t\t\t\t\t\x0b'
+            b'\x01\x01\x01\x01\x01\x01\x03\x03\x06\x06\x06\x06\x08\x08\x08\x08\x08\x08\x08\x08\x08\t\t\t'
+            b'\t\x01\x01\x01\x01\x01\x08\x08\x08\x08\x08\x08\x08\t\t\t\t\t\t\t\t\t\t\t'
+            b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t'
+            b'\t\t\t\t\t\t\t\t\t\t\t\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x03\x03\x03\x03\x03\x03\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\t\t'
+            b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x02\x06\x06\x06\x06\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+        ),
+    ),
+    "mood": (
+        ("", "imperative", "indicative", "infinitive", "optative", "participle", "subjunctive"),
+        (
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x03\x03\x03\x03\x03\x03'
+            b'\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x04\x04\x04'
+            b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+            b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+            b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+        ),
+    ),
+    "voice": (
+        ("", "Act", "Mid", "Mid/Pas", "Pas", "im-Act", "mid/pas", "midD", "midD/pasD", "pasD", "vxx"),
+        (
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x02\x02'
+            b'\x02\x02\x02\x02\x07\x07\x07\x07\x07\x04\x04\x04\x04\x04\x04\t\t\t\t\t\x02\x07\x04\x04'
+            b'\x04\x04\x04\t\t\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02'
+            b'\x02\x02\x02\x02\x07\x07\x07\x07\x07\x07\x08\x08\x04\x04\x04\x04\x04\x04\x04\t\t\t\t\t'
+            b'\t\t\t\t\t\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x07\x07\x07\x07'
+            b'\x07\x07\x07\x08\x08\x04\x04\x04\x04\x04\x04\t\t\t\x00\n\n\n\n\n\n\x01\x01\x01'
+            b'\x01\x01\x01\x01\x05\x02\x02\x02\x02\x03\x06\x07\x08\x08\x08\x08\x08\x08\x08\x08\x04\x04\x04\x04'
+            b'\x04\n\n\n\n\n\n\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x03\x03\x07'
+            b'\x08\x08\x08\x04\x04\x04\x04\x04\x04\x01\x01\x01\x01\x01\x01\x01\x02\x07\x04\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x05\x02\x02\x02\x02\x02\x06\x06\x06\x06\x06\x08\x08\x08\x08\x08\x08\x08\x08\x08\x04'
+            b'\x04\x04\x04\x04\x04\x04\n\n\n\n\n\n\x01\x01\x01\x01\x02\x02\x07\x07\x04\x04\x04\x01'
+            b'\x01\x01\x01\x02\x02\x02\x07\x07\x07\x07\x04\x04\x04\x04\t\t\t\x01\x04\x04\x01\x01\x01\x01'
+            b'\x02\x02\x02\x06\x03\x08\x08\x08\x08\x04\x04\x04\x04\n\n\n\n\n\x01\x02\x07\x04\t\x01'
+            b'\x01\x02\x07\x04\x04\t\x07\n\x01\x01\x03\x04\x01\x05\x02\x06\x07\x08\x04\x04\n\x01\x01\x07'
+            b'\x07\x01\x01\x07\x04\t\x01\x01\x01\x08\x08\x08\n\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07'
+            b'\x07\x07\x04\x04\x04\x04\x04\x04\x04\x04\n\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x04\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x07\x07'
+            b'\x07\x07\x07\x07\x07\x08\x08\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04'
+            b'\x04\x04\x04\t\t\t\t\t\t\t\t\t\t\x01\x01\x01\x07\x04\n\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x03\x03'
+            b'\x03\x03\x03\x03\x03\x03\x03\x08\x08\x08\x08\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04'
+            b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x05\x05\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x03\x03\x06\x06\x03\x06\x06\x06\x03\x06\x06\x03\x06\x03'
+            b'\x03\x07\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+            b'\x08\x08\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04'
+            b'\x04\t\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\x01\x01'
+            b'\x01\x01\x01\x01\x02\x02\x02\x02\x02\x07\x07\x07\x07\x07\x04\x04\x04\x04\x04\t\n\x01\x01\x01'
+            b'\x01\x01\x01\x02\x02\x02\x02\x02\x02\x07\x07\x07\x07\x07\x07\x04\x04\x04\x04\x04\x04\t\t\t'
+            b'\t\t\t\x00\x01\x01\x01\x01\x00\x01\x01\x01\x01\x01\x01\x05\x02\x02\x02\x02\x03\x08\x08\x08'
+            b'\x08\x08\x08\x04\x04\x04\x04\x04\n\n\n\n\n\n'
+        ),
+    ),
+    "case": (
+        ("", "accusative", "dative", "genitive", "nominative", "vocative"),
+        (
+            b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04'
+            b'\x04\x04\x04\x04\x04\x05\x05\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01'
+            b'\x01\x01\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x04\x05'
+            b'\x05\x05\x05\x05\x05\x00\x00\x00\x00\x00\x00\x01\x02\x03\x03\x01\x01\x01\x01\x01\x01\x01\x02\x02'
+            b'\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x01\x02\x03\x01\x02'
+            b'\x03\x01\x01\x01\x01\x01\x02\x02\x02\x02\x03\x03\x03\x01\x01\x01\x01\x02\x02\x02\x02\x03\x03\x03'
+            b'\x03\x03\x04\x04\x04\x04\x04\x01\x01\x01\x01\x02\x03\x04\x04\x04\x04\x04\x01\x01\x01\x02\x02\x02'
+            b'\x03\x03\x04\x04\x04\x01\x01\x02\x02\x03\x03\x04\x04\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02'
+            b'\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x01\x01\x01\x01\x01\x02\x03\x04\x04\x04\x04\x01'
+            b'\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04'
+            b'\x00\x01\x01\x02\x02\x03\x03\x04\x04\x01\x01\x02\x02\x03\x03\x04\x04\x01\x01\x01\x01\x01\x01\x02'
+            b'\x02\x02\x02\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x01\x01\x01\x01\x01\x01\x02\x02\x02'
+            b'\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x02\x02\x02\x02\x03\x03'
+            b'\x03\x03\x04\x04\x04\x04\x04\x04\x03\x04\x04\x01\x01\x01\x01\x01\x02\x03\x03\x03\x03\x03\x03\x04'
+            b'\x04\x04\x01\x02\x03\x04\x04\x04\x04\x04\x03\x01\x01\x01\x01\x01\x01\x02\x04\x04\x04\x04\x01\x01'
+            b'\x01\x01\x01\x01\x02\x02\x03\x03\x04\x04\x04\x04\x04\x04\x04\x01\x02\x03\x03\x04\x04\x04\x01\x01'
+            b'\x02\x03\x04\x04\x04\x04\x04\x01\x01\x01\x01\x01\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04'
+            b'\x04\x04\x04\x01\x02\x03\x03\x03\x04\x04\x04\x04\x04\x01\x04\x04\x01\x03\x01\x01\x01\x01\x01\x01'
+            b'\x01\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x01\x04\x04\x01\x01'
+            b'\x01\x02\x03\x03\x04\x04\x04\x01\x02\x04\x04\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x03'
+            b'\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x05\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02'
+            b'\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x01\x04\x01\x01\x01\x01\x02\x02\x03\x03\x03'
+            b'\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x01\x01\x02\x02\x02\x03\x03\x03\x03\x04\x04\x04\x04\x04'
+            b'\x04\x04\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04'
+            b'\x04\x04\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04'
+            b'\x04\x04\x01\x01\x01\x01\x01\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        ),
+    ),
+    "number": (
+        ("", "plural", "singular"),
+        (
+            b'\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x00\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x00\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02'
+            b'\x02\x02\x02\x02\x02\x01\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x02\x02'
+            b'\x02\x02\x01\x01\x01\x02\x02\x02\x00\x01\x01\x01\x02\x02\x02\x00\x01\x01\x01\x02\x02\x02\x02\x01'
+            b'\x01\x01\x02\x02\x02\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x01\x01'
+            b'\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+            b'\x02\x01\x01\x01\x02\x02\x01\x01\x02\x02\x01\x02\x02\x01\x02\x02\x02\x01\x02\x02\x02\x01\x01\x02'
+            b'\x02\x02\x01\x01\x02\x02\x02\x01\x01\x02\x02\x02\x01\x01\x01\x01\x02\x02\x01\x02\x02\x01\x02\x02'
+            b'\x01\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02'
+            b'\x02\x01\x01\x01\x02\x02\x02\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x01'
+            b'\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x02\x01\x01\x01\x02\x02\x02'
+            b'\x00\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x01\x01\x02\x02\x02\x01'
+            b'\x02\x02\x02\x01\x01\x01\x02\x02\x01\x01\x01\x02\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01'
+            b'\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x02\x01\x02\x01\x01\x02\x01\x02'
+            b'\x01\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x01\x02\x02\x01\x01\x01'
+            b'\x02\x01\x02\x01\x02\x01\x01\x02\x01\x01\x02\x01\x01\x02\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02'
+            b'\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x02\x01\x01\x02\x02\x01'
+            b'\x01\x01\x01\x02\x02\x01\x02\x02\x01\x02\x01\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x01'
+            b'\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01'
+            b'\x02\x01\x02\x02\x02\x01\x02\x01\x02\x01\x02\x01\x01\x02\x01\x02\x01\x01\x02\x02\x01\x02\x01\x01'
+            b'\x02\x01\x02\x01\x02\x01\x02\x01\x01\x02\x02\x01\x01\x02\x02\x01\x01\x02\x02\x02\x02\x02\x02\x02'
+            b'\x01\x02\x02\x01\x02\x01\x02\x01\x02\x02\x01\x02\x01\x01\x02\x02\x01\x02\x02\x01\x02\x02\x01\x02'
+            b'\x01\x01\x02\x02\x01\x02\x01\x01\x02\x01\x02\x01\x01\x02\x01\x02\x02\x01\x02\x02\x02\x01\x02\x01'
+            b'\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x02\x02\x01\x02\x02\x01'
+            b'\x02\x01\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x02\x01\x01\x02\x01\x02\x01\x02'
+            b'\x01\x02\x02\x01\x01\x01\x02\x01\x02\x01\x02\x01\x02\x02\x01\x02\x01\x02\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x02\x02'
+            b'\x02\x01\x02\x02\x02\x02\x01\x01\x02\x02\x01\x02\x02\x01\x01\x02\x02\x02\x01\x01\x02\x02\x01\x02'
+            b'\x02\x02\x01\x01\x01\x02\x02\x02\x02\x01\x02\x01\x01\x02\x02\x02\x01\x01\x01\x01\x02\x02\x02\x01'
+            b'\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x01\x02\x02\x02\x02\x01\x02\x02\x02\x02\x01'
+            b'\x01\x02\x02\x02\x01\x02\x01\x02\x01\x01\x01\x02\x02\x02\x02\x01\x01\x01\x02\x01\x02\x02\x01\x02'
+            b'\x01\x02\x01\x02\x02\x02\x02\x01\x01\x02\x02\x02\x01\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x02'
+            b'\x02\x02\x02\x01\x02\x01\x01\x02\x01\x01\x02\x02\x02\x01\x01\x02\x02\x01\x02\x01\x01\x02\x02\x02'
+            b'\x02\x01\x02\x02\x01\x01\x02\x02\x02\x02\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x01\x02\x01\x02'
+            b'\x02\x01\x01\x02\x01\x02\x02\x01\x01\x01\x02\x01\x01\x01\x02\x02\x02\x02\x01\x01\x02\x02\x02\x01'
+            b'\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02'
+            b'\x01\x01\x01\x02\x02\x02\x01\x01\x01\x01\x02\x02\x02\x01\x02\x01\x02\x02\x02\x01\x02\x01\x01\x02'
+            b'\x02\x02\x02\x02\x01\x01\x02\x02\x02\x02\x01\x02\x01\x02\x02\x01\x02\x02\x02\x01\x01\x01\x02\x02'
+            b'\x02\x01\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02'
+            b'\x02\x02\x01\x01\x01\x01\x02\x02\x02\x01\x01\x02\x02\x02\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02'
+            b'\x02\x01\x01\x01\x02\x02\x02\x01\x01\x02\x02\x01\x01\x01\x02\x02\x02\x01\x01\x01\x02\x02\x01\x02'
+            b'\x01\x02\x01\x02\x01\x02\x02\x01\x02\x01\x02\x01\x01\x02\x01\x01\x02\x01\x02\x01\x01\x01\x02\x01'
+            b'\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01\x02\x01'
+            b'\x02\x01\x02\x01\x01\x02\x01\x02\x02\x01\x02\x01\x02\x01\x02\x02\x01\x02\x02\x02\x02\x01\x02\x01'
+            b'\x02\x01\x02\x01\x02\x01\x01\x02\x01\x02\x01\x02\x01\x02'
+        ),
+    ),
+    "gender": (
+        ("", "feminine", "masculine", "neuter"),
+        (
+            b'\x01\x01\x02\x02\x03\x03\x01\x01\x01\x02\x02\x03\x03\x01\x02\x02\x03\x01\x01\x01\x02\x02\x02\x03'
+            b'\x03\x00\x01\x02\x02\x03\x03\x01\x01\x02\x02\x03\x03\x00\x01\x01\x02\x02\x03\x03\x03\x00\x01\x01'
+            b'\x02\x02\x02\x03\x03\x02\x01\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x02\x03\x01\x01'
+            b'\x02\x03\x01\x02\x03\x01\x02\x03\x00\x01\x02\x03\x01\x02\x03\x02\x01\x02\x03\x01\x02\x03\x03\x01'
+            b'\x02\x03\x01\x02\x03\x00\x00\x00\x00\x00\x00\x02\x02\x02\x03\x01\x02\x03\x01\x02\x02\x03\x01\x02'
+            b'\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x02\x03\x03\x01\x02\x02\x03\x02\x02\x02\x02\x02'
+            b'\x02\x01\x02\x03\x01\x02\x01\x02\x01\x02\x02\x01\x02\x01\x01\x02\x03\x02\x01\x02\x03\x02\x03\x01'
+            b'\x02\x03\x02\x03\x01\x02\x03\x02\x03\x02\x03\x03\x02\x01\x02\x03\x02\x03\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02'
+            b'\x03\x01\x02\x03\x01\x02\x03\x02\x03\x01\x02\x03\x01\x02\x03\x01\x03\x03\x03\x01\x02\x02\x03\x01'
+            b'\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x03\x01\x02\x03\x01\x02\x03'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x01\x02\x03\x02'
+            b'\x01\x02\x03\x01\x02\x03\x02\x03\x01\x02\x03\x01\x00\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03'
+            b'\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x01\x02\x03\x01\x02\x01\x02\x02\x01'
+            b'\x02\x03\x01\x02\x03\x01\x02\x03\x02\x02\x02\x02\x03\x01\x02\x03\x02\x01\x02\x03\x01\x02\x03\x01'
+            b'\x02\x02\x02\x03\x02\x01\x02\x01\x02\x03\x02\x02\x02\x03\x01\x02\x03\x03\x02\x01\x02\x03\x02\x02'
+            b'\x03\x01\x02\x03\x02\x02\x02\x02\x00\x01\x02\x00\x01\x02\x03\x02\x02\x02\x02\x02\x01\x02\x02\x02'
+            b'\x02\x01\x02\x01\x02\x02\x03\x02\x03\x01\x02\x03\x03\x01\x02\x01\x02\x03\x01\x02\x03\x02\x03\x01'
+            b'\x02\x02\x03\x02\x02\x02\x03\x02\x01\x02\x01\x02\x03\x03\x02\x02\x03\x03\x03\x02\x03\x01\x02\x02'
+            b'\x03\x02\x02\x03\x02\x03\x00\x01\x02\x03\x01\x02\x02\x02\x03\x01\x02\x02\x03\x02\x02\x02\x02\x01'
+            b'\x02\x02\x02\x01\x02\x02\x03\x02\x01\x02\x02\x01\x02\x03\x01\x02\x03\x03\x02\x03\x01\x02\x03\x02'
+            b'\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x03\x02\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03'
+            b'\x01\x02\x03\x01\x02\x03\x00\x01\x02\x03\x01\x02\x03\x03\x03\x02\x01\x02\x03\x02\x02\x01\x02\x00'
+            b'\x01\x02\x02\x03\x01\x02\x00\x01\x02\x03\x02\x03\x02\x02\x03\x03\x01\x02\x03\x01\x02\x03\x01\x02'
+            b'\x03\x02\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01'
+            b'\x02\x03\x00\x01\x02\x03\x01\x02\x03\x02\x03\x01\x02\x03\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02'
+            b'\x03\x02\x02\x03\x01\x02\x03\x02\x03\x01\x02\x01\x02\x03\x01\x02\x03\x01\x02\x03\x01\x02\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        ),
+    ),
+    "degree": (
+        ("", "comparative", "superlative"),
+        (
+            b'\x00\x01\x00\x01\x00\x01\x00\x01\x02\x00\x01\x00\x01\x00\x00\x01\x00\x00\x01\x02\x00\x01\x02\x00'
+            b'\x01\x00\x00\x00\x01\x00\x01\x00\x01\x00\x01\x00\x02\x00\x00\x01\x00\x01\x00\x01\x02\x00\x00\x01'
+            b'\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        ),
+    ),
+    "qualifier": (
+        ("", "Att", "Con", "Int", "Irr", "MidS", "Neg", "Tra", "j", "letter", "other", "proper"),
+        (
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x01\x00\x00\x00\x00\x00\x00\x00\x02\x03\x00\x00\x00\x02\x00\x00\x00\x00\x02\x00\x00\x00\x02'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00'
+            b'\x00\x00\x00\x00\x00\t\n\x0b\x00\x03\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x02\x00\x00\x02\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x02'
+            b'\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x01\x00\x01\x00'
+            b'\x01\x00\x01\x00\x01\x00\x00\x01\x00\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00'
+            b'\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x01\x02\x00\x00\x00'
+            b'\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x05\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        ),
+    ),
+}
@@ -0,0 +1,55 @@
+"""
+Measure the tagset tables against the Enum views built from them: the cost of loading them, their memory and lookups.
+
+    python -m morpht5.tagsets.benchmark
+"""
+
+import json
+import statistics
+import timeit
+from importlib import import_module
+from typing import Callable
+
+from ..utils.import_benchmark import measure
+
+
+def get_call_nanoseconds(call: Callable[[], object], number: int = 100_000) -> float:
+    return round(min(timeit.repeat(call, number=number, repeat=3)) / number * 1e9, 1)
+
+
+def benchmark_tagset(module_name: str, repeats: int = 3) -> dict:
+    """Load time and memory (each in a fresh interpreter) and lookup times of a tagset table and its Enum view."""
+    module = import_module(f".{module_name}", __package__)
+    table, enum = module.TABLE, module.Tag
+    tag = table.tags[len(table) // 2]
+    member_name = enum(tag).name
+    labels, label_ids = table.features["case"]
+    tag_id = table.ids[tag]
+
+    report = {"tagset": table.name, "num_tags": len(table)}
+    # The Enum view is built from the table, so it is measured on top of it
+    statements = {
+        "table": f"from morpht5.tagsets.{module_name} import TABLE",
+        "enum": f"from morpht5.tagsets.{module_name} import Tag",
+    }
+    for view, statement in statements.items():
+        load_seconds = statistics.median(measure(statement)["access_seconds"] for _ in range(repeats))
+        report[f"{view}_load_ms"] = round(load_seconds * 1e3, 2)
+        report[f"{view}_allocated_kib"] = round(measure(statement, trace_memory=True)["access_allocated_kib"], 1)
+    report |= {
+        "table_id_lookup_ns": get_call_nanoseconds(lambda: table.ids[tag]),
+        "enum_value_lookup_ns": get_call_nanoseconds(lambda: enum(tag)),
+        "enum_name_lookup_ns": get_call_nanoseconds(lambda: enum[member_name]),
+        "table_feature_lookup_ns": get_call_nanoseconds(lambda: labels[label_ids[tag_id]]),
+        "table_decompose_ns": get_call_nanoseconds(lambda: table.decompose(tag)),
+    }
+    return report
+
+
+def main() -> None:
+    for module_name in ("biblehub", "oblubienica"):
+        print(json.dumps(benchmark_tagset(module_name)))
+
+
+if __name__ == "__main__":
+    main()
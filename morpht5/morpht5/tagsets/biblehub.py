@@ -1,692 +1,14 @@
 from enum import Enum
 
+from ._biblehub_table import FEATURES, TAGS
+from .table import TagsetTable
 
-class Tag(Enum):
-    """
-    Tagset for the BibleHub dataset.
-    """
+TABLE = TagsetTable(TAGS, FEATURES, name="BibleHub")
 
-    ADJ = "Adj"
-    ADJ_AFP = "Adj-AFP"
-    ADJ_AFP_C = "Adj-AFP-C"
-    ADJ_AFS = "Adj-AFS"
-    ADJ_AFS_C = "Adj-AFS-C"
-    ADJ_AFS_S = "Adj-AFS-S"
-    ADJ_AMP = "Adj-AMP"
-    ADJ_AMP_C = "Adj-AMP-C"
-    ADJ_AMS = "Adj-AMS"
-    ADJ_AMS_C = "Adj-AMS-C"
-    ADJ_ANP = "Adj-ANP"
-    ADJ_ANP_C = "Adj-ANP-C"
-    ADJ_ANP_S = "Adj-ANP-S"
-    ADJ_ANS = "Adj-ANS"
-    ADJ_ANS_C = "Adj-ANS-C"
-    ADJ_ANS_S = "Adj-ANS-S"
-    ADJ_DFP = "Adj-DFP"
-    ADJ_DFP_C = "Adj-DFP-C"
-    ADJ_DFS = "Adj-DFS"
-    ADJ_DFS_C = "Adj-DFS-C"
-    ADJ_DFS_S = "Adj-DFS-S"
-    ADJ_DMP = "Adj-DMP"
-    ADJ_DMP_C = "Adj-DMP-C"
-    ADJ_DMS = "Adj-DMS"
-    ADJ_DMS_C = "Adj-DMS-C"
-    ADJ_DMS_S = "Adj-DMS-S"
-    ADJ_DNP = "Adj-DNP"
-    ADJ_DNP_S = "Adj-DNP-S"
-    ADJ_DNS = "Adj-DNS"
-    ADJ_DNS_C = "Adj-DNS-C"
-    ADJ_DNS_S = "Adj-DNS-S"
-    ADJ_GFP = "Adj-GFP"
-    ADJ_GFP_S = "Adj-GFP-S"
-    ADJ_GFS = "Adj-GFS"
-    ADJ_GFS_C = "Adj-GFS-C"
-    ADJ_GMP = "Adj-GMP"
-    ADJ_GMP_C = "Adj-GMP-C"
-    ADJ_GMP_S = "Adj-GMP-S"
-    ADJ_GMS = "Adj-GMS"
-    ADJ_GMS_C = "Adj-GMS-C"
-    ADJ_GMS_S = "Adj-GMS-S"
-    ADJ_GNP = "Adj-GNP"
-    ADJ_GNP_C = "Adj-GNP-C"
-    ADJ_GNP_S = "Adj-GNP-S"
-    ADJ_GNS = "Adj-GNS"
-    ADJ_GNS_S = "Adj-GNS-S"
-    ADJ_NFP = "Adj-NFP"
-    ADJ_NFP_C = "Adj-NFP-C"
-    ADJ_NFP_S = "Adj-NFP-S"
-    ADJ_NFS = "Adj-NFS"
-    ADJ_NFS_C = "Adj-NFS-C"
-    ADJ_NFS_S = "Adj-NFS-S"
-    ADJ_NMP = "Adj-NMP"
-    ADJ_NMP_C = "Adj-NMP-C"
-    ADJ_NMS = "Adj-NMS"
-    ADJ_NMS_C = "Adj-NMS-C"
-    ADJ_NMS_S = "Adj-NMS-S"
-    ADJ_NNP = "Adj-NNP"
-    ADJ_NNP_C = "Adj-NNP-C"
-    ADJ_NNS = "Adj-NNS"
-    ADJ_NNS_C = "Adj-NNS-C"
-    ADJ_VFS = "Adj-VFS"
-    ADJ_VMP = "Adj-VMP"
-    ADJ_VMP_C = "Adj-VMP-C"
-    ADJ_VMS = "Adj-VMS"
-    ADJ_VMS_S = "Adj-VMS-S"
-    ADJ_VNP = "Adj-VNP"
-    ADJ_VNS = "Adj-VNS"
-    ADV = "Adv"
-    ADV_C = "Adv-C"
-    ADV_S = "Adv-S"
-    ART_AFP = "Art-AFP"
-    ART_AFS = "Art-AFS"
-    ART_AMP = "Art-AMP"
-    ART_AMS = "Art-AMS"
-    ART_ANP = "Art-ANP"
-    ART_ANS = "Art-ANS"
-    ART_DFP = "Art-DFP"
-    ART_DFS = "Art-DFS"
-    ART_DMP = "Art-DMP"
-    ART_DMS = "Art-DMS"
-    ART_DNP = "Art-DNP"
-    ART_DNS = "Art-DNS"
-    ART_GFP = "Art-GFP"
-    ART_GFS = "Art-GFS"
-    ART_GMP = "Art-GMP"
-    ART_GMS = "Art-GMS"
-    ART_GNP = "Art-GNP"
-    ART_GNS = "Art-GNS"
-    ART_NFP = "Art-NFP"
-    ART_NFS = "Art-NFS"
-    ART_NMP = "Art-NMP"
-    ART_NMS = "Art-NMS"
-    ART_NNP = "Art-NNP"
-    ART_NNS = "Art-NNS"
-    ART_VFP = "Art-VFP"
-    ART_VFS = "Art-VFS"
-    ART_VMP = "Art-VMP"
-    ART_VMS = "Art-VMS"
-    ART_VNP = "Art-VNP"
-    ART_VNS = "Art-VNS"
-    CONJ = "Conj"
-    DPRO_AFP = "DPro-AFP"
-    DPRO_AFS = "DPro-AFS"
-    DPRO_AMP = "DPro-AMP"
-    DPRO_AMS = "DPro-AMS"
-    DPRO_ANP = "DPro-ANP"
-    DPRO_ANS = "DPro-ANS"
-    DPRO_DFP = "DPro-DFP"
-    DPRO_DFS = "DPro-DFS"
-    DPRO_DMP = "DPro-DMP"
-    DPRO_DMS = "DPro-DMS"
-    DPRO_DNP = "DPro-DNP"
-    DPRO_DNS = "DPro-DNS"
-    DPRO_GFP = "DPro-GFP"
-    DPRO_GFS = "DPro-GFS"
-    DPRO_GMP = "DPro-GMP"
-    DPRO_GMS = "DPro-GMS"
-    DPRO_GNP = "DPro-GNP"
-    DPRO_GNS = "DPro-GNS"
-    DPRO_NFP = "DPro-NFP"
-    DPRO_NFS = "DPro-NFS"
-    DPRO_NMP = "DPro-NMP"
-    DPRO_NMS = "DPro-NMS"
-    DPRO_NNP = "DPro-NNP"
-    DPRO_NNS = "DPro-NNS"
-    HEB = "Heb"
-    I = "I"
-    INDEC = "Indec"
-    INTPRTCL = "IntPrtcl"
-    IPRO_AFP = "IPro-AFP"
-    IPRO_AFS = "IPro-AFS"
-    IPRO_AMP = "IPro-AMP"
-    IPRO_AMS = "IPro-AMS"
-    IPRO_ANP = "IPro-ANP"
-    IPRO_ANS = "IPro-ANS"
-    IPRO_DFS = "IPro-DFS"
-    IPRO_DMP = "IPro-DMP"
-    IPRO_DMS = "IPro-DMS"
-    IPRO_DNS = "IPro-DNS"
-    IPRO_GFP = "IPro-GFP"
-    IPRO_GFS = "IPro-GFS"
-    IPRO_GMP = "IPro-GMP"
-    IPRO_GMS = "IPro-GMS"
-    IPRO_GNP = "IPro-GNP"
-    IPRO_GNS = "IPro-GNS"
-    IPRO_NFP = "IPro-NFP"
-    IPRO_NFS = "IPro-NFS"
-    IPRO_NMP = "IPro-NMP"
-    IPRO_NMS = "IPro-NMS"
-    IPRO_NNP = "IPro-NNP"
-    IPRO_NNS = "IPro-NNS"
-    N = "N"
-    N_AFP = "N-AFP"
-    N_AFS = "N-AFS"
-    N_AMP = "N-AMP"
-    N_AMS = "N-AMS"
-    N_ANP = "N-ANP"
-    N_ANS = "N-ANS"
-    N_DFP = "N-DFP"
-    N_DFS = "N-DFS"
-    N_DMP = "N-DMP"
-    N_DMS = "N-DMS"
-    N_DNP = "N-DNP"
-    N_DNS = "N-DNS"
-    N_GFP = "N-GFP"
-    N_GFS = "N-GFS"
-    N_GMP = "N-GMP"
-    N_GMS = "N-GMS"
-    N_GNP = "N-GNP"
-    N_GNS = "N-GNS"
-    N_NFP = "N-NFP"
-    N_NFS = "N-NFS"
-    N_NMP = "N-NMP"
-    N_NMS = "N-NMS"
-    N_NNP = "N-NNP"
-    N_NNS = "N-NNS"
-    N_VFP = "N-VFP"
-    N_VFS = "N-VFS"
-    N_VMP = "N-VMP"
-    N_VMS = "N-VMS"
-    N_VNP = "N-VNP"
-    N_VNS = "N-VNS"
-    PPRO_A1P = "PPro-A1P"
-    PPRO_A1S = "PPro-A1S"
-    PPRO_A2P = "PPro-A2P"
-    PPRO_A2S = "PPro-A2S"
-    PPRO_AF1P = "PPro-AF1P"
-    PPRO_AF1S = "PPro-AF1S"
-    PPRO_AF2P = "PPro-AF2P"
-    PPRO_AF2S = "PPro-AF2S"
-    PPRO_AF3P = "PPro-AF3P"
-    PPRO_AF3S = "PPro-AF3S"
-    PPRO_AM1P = "PPro-AM1P"
-    PPRO_AM1S = "PPro-AM1S"
-    PPRO_AM2P = "PPro-AM2P"
-    PPRO_AM2S = "PPro-AM2S"
-    PPRO_AM3P = "PPro-AM3P"
-    PPRO_AM3S = "PPro-AM3S"
-    PPRO_AN1P = "PPro-AN1P"
-    PPRO_AN1S = "PPro-AN1S"
-    PPRO_AN2P = "PPro-AN2P"
-    PPRO_AN2S = "PPro-AN2S"
-    PPRO_AN3P = "PPro-AN3P"
-    PPRO_AN3S = "PPro-AN3S"
-    PPRO_D1P = "PPro-D1P"
-    PPRO_D1S = "PPro-D1S"
-    PPRO_D2P = "PPro-D2P"
-    PPRO_D2S = "PPro-D2S"
-    PPRO_DF1P = "PPro-DF1P"
-    PPRO_DF1S = "PPro-DF1S"
-    PPRO_DF2P = "PPro-DF2P"
-    PPRO_DF2S = "PPro-DF2S"
-    PPRO_DF3P = "PPro-DF3P"
-    PPRO_DF3S = "PPro-DF3S"
-    PPRO_DM1P = "PPro-DM1P"
-    PPRO_DM1S = "PPro-DM1S"
-    PPRO_DM2P = "PPro-DM2P"
-    PPRO_DM2S = "PPro-DM2S"
-    PPRO_DM3P = "PPro-DM3P"
-    PPRO_DM3S = "PPro-DM3S"
-    PPRO_DN1P = "PPro-DN1P"
-    PPRO_DN1S = "PPro-DN1S"
-    PPRO_DN3P = "PPro-DN3P"
-    PPRO_DN3S = "PPro-DN3S"
-    PPRO_G1P = "PPro-G1P"
-    PPRO_G1S = "PPro-G1S"
-    PPRO_G2P = "PPro-G2P"
-    PPRO_G2S = "PPro-G2S"
-    PPRO_GF1P = "PPro-GF1P"
-    PPRO_GF1S = "PPro-GF1S"
-    PPRO_GF2P = "PPro-GF2P"
-    PPRO_GF2S = "PPro-GF2S"
-    PPRO_GF3P = "PPro-GF3P"
-    PPRO_GF3S = "PPro-GF3S"
-    PPRO_GM1S = "PPro-GM1S"
-    PPRO_GM2S = "PPro-GM2S"
-    PPRO_GM3P = "PPro-GM3P"
-    PPRO_GM3S = "PPro-GM3S"
-    PPRO_GN1P = "PPro-GN1P"
-    PPRO_GN3P = "PPro-GN3P"
-    PPRO_GN3S = "PPro-GN3S"
-    PPRO_N1P = "PPro-N1P"
-    PPRO_N1S = "PPro-N1S"
-    PPRO_N2P = "PPro-N2P"
-    PPRO_N2S = "PPro-N2S"
-    PPRO_NF1P = "PPro-NF1P"
-    PPRO_NF1S = "PPro-NF1S"
-    PPRO_NF2P = "PPro-NF2P"
-    PPRO_NF3S = "PPro-NF3S"
-    PPRO_NFS = "PPro-NFS"
-    PPRO_NM1P = "PPro-NM1P"
-    PPRO_NM1S = "PPro-NM1S"
-    PPRO_NM2P = "PPro-NM2P"
-    PPRO_NM2S = "PPro-NM2S"
-    PPRO_NM3P = "PPro-NM3P"
-    PPRO_NM3S = "PPro-NM3S"
-    PPRO_NN1P = "PPro-NN1P"
-    PPRO_NN1S = "PPro-NN1S"
-    PPRO_NN2P = "PPro-NN2P"
-    PPRO_NN2S = "PPro-NN2S"
-    PPRO_NN3P = "PPro-NN3P"
-    PPRO_NN3S = "PPro-NN3S"
-    PREP = "Prep"
-    PRTCL = "Prtcl"
-    RECPRO_AMP = "RecPro-AMP"
-    RECPRO_DMP = "RecPro-DMP"
-    RECPRO_DNP = "RecPro-DNP"
-    RECPRO_GMP = "RecPro-GMP"
-    REFPRO_AF3P = "RefPro-AF3P"
-    REFPRO_AF3S = "RefPro-AF3S"
-    REFPRO_AM3P = "RefPro-AM3P"
-    REFPRO_AM3S = "RefPro-AM3S"
-    REFPRO_AN3P = "RefPro-AN3P"
-    REFPRO_DF3P = "RefPro-DF3P"
-    REFPRO_DF3S = "RefPro-DF3S"
-    REFPRO_DM3P = "RefPro-DM3P"
-    REFPRO_DM3S = "RefPro-DM3S"
-    REFPRO_GF3P = "RefPro-GF3P"
-    REFPRO_GF3S = "RefPro-GF3S"
-    REFPRO_GM3P = "RefPro-GM3P"
-    REFPRO_GM3S = "RefPro-GM3S"
-    REFPRO_GN3P = "RefPro-GN3P"
-    REFPRO_GN3S = "RefPro-GN3S"
-    RELPRO_AFP = "RelPro-AFP"
-    RELPRO_AFS = "RelPro-AFS"
-    RELPRO_AMP = "RelPro-AMP"
-    RELPRO_AMS = "RelPro-AMS"
-    RELPRO_ANP = "RelPro-ANP"
-    RELPRO_ANS = "RelPro-ANS"
-    RELPRO_DFP = "RelPro-DFP"
-    RELPRO_DFS = "RelPro-DFS"
-    RELPRO_DMP = "RelPro-DMP"
-    RELPRO_DMS = "RelPro-DMS"
-    RELPRO_DNP = "RelPro-DNP"
-    RELPRO_DNS = "RelPro-DNS"
-    RELPRO_GFP = "RelPro-GFP"
-    RELPRO_GFS = "RelPro-GFS"
-    RELPRO_GMP = "RelPro-GMP"
-    RELPRO_GMS = "RelPro-GMS"
-    RELPRO_GNP = "RelPro-GNP"
-    RELPRO_GNS = "RelPro-GNS"
-    RELPRO_NFP = "RelPro-NFP"
-    RELPRO_NFS = "RelPro-NFS"
-    RELPRO_NMP = "RelPro-NMP"
-    RELPRO_NMS = "RelPro-NMS"
-    RELPRO_NNP = "RelPro-NNP"
-    RELPRO_NNS = "RelPro-NNS"
-    V_AIA_1P = "V-AIA-1P"
-    V_AIA_1S = "V-AIA-1S"
-    V_AIA_2P = "V-AIA-2P"
-    V_AIA_2S = "V-AIA-2S"
-    V_AIA_3P = "V-AIA-3P"
-    V_AIA_3S = "V-AIA-3S"
-    V_AIM_1P = "V-AIM-1P"
-    V_AIM_1S = "V-AIM-1S"
-    V_AIM_2P = "V-AIM-2P"
-    V_AIM_2S = "V-AIM-2S"
-    V_AIM_3P = "V-AIM-3P"
-    V_AIM_3S = "V-AIM-3S"
-    V_AIP_1P = "V-AIP-1P"
-    V_AIP_1S = "V-AIP-1S"
-    V_AIP_2P = "V-AIP-2P"
-    V_AIP_2S = "V-AIP-2S"
-    V_AIP_3P = "V-AIP-3P"
-    V_AIP_3S = "V-AIP-3S"
-    V_AMA_2P = "V-AMA-2P"
-    V_AMA_2S = "V-AMA-2S"
-    V_AMA_3P = "V-AMA-3P"
-    V_AMA_3S = "V-AMA-3S"
-    V_AMM_2P = "V-AMM-2P"
-    V_AMM_2S = "V-AMM-2S"
-    V_AMM_3P = "V-AMM-3P"
-    V_AMM_3S = "V-AMM-3S"
-    V_AMP_2P = "V-AMP-2P"
-    V_AMP_2S = "V-AMP-2S"
-    V_AMP_3P = "V-AMP-3P"
-    V_AMP_3S = "V-AMP-3S"
-    V_ANA = "V-ANA"
-    V_ANM = "V-ANM"
-    V_ANM_P = "V-ANM/P"
-    V_ANP = "V-ANP"
-    V_AOA_3P = "V-AOA-3P"
-    V_AOA_3S = "V-AOA-3S"
-    V_AOM_1S = "V-AOM-1S"
-    V_AOM_3S = "V-AOM-3S"
-    V_AOP_3S = "V-AOP-3S"
-    V_APA_AFP = "V-APA-AFP"
-    V_APA_AFS = "V-APA-AFS"
-    V_APA_AMP = "V-APA-AMP"
-    V_APA_AMS = "V-APA-AMS"
-    V_APA_ANP = "V-APA-ANP"
-    V_APA_ANS = "V-APA-ANS"
-    V_APA_DFP = "V-APA-DFP"
-    V_APA_DFS = "V-APA-DFS"
-    V_APA_DMP = "V-APA-DMP"
-    V_APA_DMS = "V-APA-DMS"
-    V_APA_GFS = "V-APA-GFS"
-    V_APA_GMP = "V-APA-GMP"
-    V_APA_GMS = "V-APA-GMS"
-    V_APA_GNS = "V-APA-GNS"
-    V_APA_NFP = "V-APA-NFP"
-    V_APA_NFS = "V-APA-NFS"
-    V_APA_NMP = "V-APA-NMP"
-    V_APA_NMS = "V-APA-NMS"
-    V_APA_NNP = "V-APA-NNP"
-    V_APA_NNS = "V-APA-NNS"
-    V_APM_AFS = "V-APM-AFS"
-    V_APM_AMP = "V-APM-AMP"
-    V_APM_AMS = "V-APM-AMS"
-    V_APM_ANP = "V-APM-ANP"
-    V_APM_ANS = "V-APM-ANS"
-    V_APM_DMP = "V-APM-DMP"
-    V_APM_DNP = "V-APM-DNP"
-    V_APM_GFP = "V-APM-GFP"
-    V_APM_GFS = "V-APM-GFS"
-    V_APM_GMP = "V-APM-GMP"
-    V_APM_GMS = "V-APM-GMS"
-    V_APM_GNP = "V-APM-GNP"
-    V_APM_GNS = "V-APM-GNS"
-    V_APM_NFP = "V-APM-NFP"
-    V_APM_NFS = "V-APM-NFS"
-    V_APM_NMP = "V-APM-NMP"
-    V_APM_NMS = "V-APM-NMS"
-    V_APM_NNS = "V-APM-NNS"
-    V_APM_P_ANP = "V-APM/P-ANP"
-    V_APM_P_GFS = "V-APM/P-GFS"
-    V_APM_P_NMS = "V-APM/P-NMS"
-    V_APP_AFS = "V-APP-AFS"
-    V_APP_AMP = "V-APP-AMP"
-    V_APP_AMS = "V-APP-AMS"
-    V_APP_ANP = "V-APP-ANP"
-    V_APP_ANS = "V-APP-ANS"
-    V_APP_DFS = "V-APP-DFS"
-    V_APP_DMS = "V-APP-DMS"
-    V_APP_DNP = "V-APP-DNP"
-    V_APP_DNS = "V-APP-DNS"
-    V_APP_GFP = "V-APP-GFP"
-    V_APP_GFS = "V-APP-GFS"
-    V_APP_GMP = "V-APP-GMP"
-    V_APP_GMS = "V-APP-GMS"
-    V_APP_GNP = "V-APP-GNP"
-    V_APP_GNS = "V-APP-GNS"
-    V_APP_NFP = "V-APP-NFP"
-    V_APP_NFS = "V-APP-NFS"
-    V_APP_NMP = "V-APP-NMP"
-    V_APP_NMS = "V-APP-NMS"
-    V_APP_NNP = "V-APP-NNP"
-    V_APP_NNS = "V-APP-NNS"
-    V_ASA_1P = "V-ASA-1P"
-    V_ASA_1S = "V-ASA-1S"
-    V_ASA_2P = "V-ASA-2P"
-    V_ASA_2S = "V-ASA-2S"
-    V_ASA_3P = "V-ASA-3P"
-    V_ASA_3S = "V-ASA-3S"
-    V_ASM_1P = "V-ASM-1P"
-    V_ASM_1S = "V-ASM-1S"
-    V_ASM_2P = "V-ASM-2P"
-    V_ASM_2S = "V-ASM-2S"
-    V_ASM_3P = "V-ASM-3P"
-    V_ASM_3S = "V-ASM-3S"
-    V_ASP_1P = "V-ASP-1P"
-    V_ASP_1S = "V-ASP-1S"
-    V_ASP_2P = "V-ASP-2P"
-    V_ASP_2S = "V-ASP-2S"
-    V_ASP_3P = "V-ASP-3P"
-    V_ASP_3S = "V-ASP-3S"
-    V_FIA_1P = "V-FIA-1P"
-    V_FIA_1S = "V-FIA-1S"
-    V_FIA_2P = "V-FIA-2P"
-    V_FIA_2S = "V-FIA-2S"
-    V_FIA_3P = "V-FIA-3P"
-    V_FIA_3S = "V-FIA-3S"
-    V_FIM_1P = "V-FIM-1P"
-    V_FIM_1S = "V-FIM-1S"
-    V_FIM_2P = "V-FIM-2P"
-    V_FIM_2S = "V-FIM-2S"
-    V_FIM_3P = "V-FIM-3P"
-    V_FIM_3S = "V-FIM-3S"
-    V_FIM_P_2P = "V-FIM/P-2P"
-    V_FIP_1P = "V-FIP-1P"
-    V_FIP_1S = "V-FIP-1S"
-    V_FIP_2P = "V-FIP-2P"
-    V_FIP_2S = "V-FIP-2S"
-    V_FIP_3P = "V-FIP-3P"
-    V_FIP_3S = "V-FIP-3S"
-    V_FNM = "V-FNM"
-    V_FPA_ANP = "V-FPA-ANP"
-    V_FPA_NMP = "V-FPA-NMP"
-    V_FPA_NMS = "V-FPA-NMS"
-    V_FPM_ANS = "V-FPM-ANS"
-    V_FPP_GNP = "V-FPP-GNP"
-    V_IIA_1P = "V-IIA-1P"
-    V_IIA_1S = "V-IIA-1S"
-    V_IIA_2P = "V-IIA-2P"
-    V_IIA_2S = "V-IIA-2S"
-    V_IIA_3P = "V-IIA-3P"
-    V_IIA_3S = "V-IIA-3S"
-    V_IIM_1P = "V-IIM-1P"
-    V_IIM_1S = "V-IIM-1S"
-    V_IIM_2S = "V-IIM-2S"
-    V_IIM_3P = "V-IIM-3P"
-    V_IIM_3S = "V-IIM-3S"
-    V_IIM_P_1P = "V-IIM/P-1P"
-    V_IIM_P_1S = "V-IIM/P-1S"
-    V_IIM_P_2P = "V-IIM/P-2P"
-    V_IIM_P_2S = "V-IIM/P-2S"
-    V_IIM_P_3P = "V-IIM/P-3P"
-    V_IIM_P_3S = "V-IIM/P-3S"
-    V_IIP_1P = "V-IIP-1P"
-    V_IIP_3P = "V-IIP-3P"
-    V_LIA_1S = "V-LIA-1S"
-    V_LIA_2P = "V-LIA-2P"
-    V_LIA_2S = "V-LIA-2S"
-    V_LIA_3P = "V-LIA-3P"
-    V_LIA_3S = "V-LIA-3S"
-    V_LIM_3P = "V-LIM-3P"
-    V_LIM_3S = "V-LIM-3S"
-    V_LIM_P_3S = "V-LIM/P-3S"
-    V_M_2P = "V-M-2P"
-    V_M_2S = "V-M-2S"
-    V_PIA_1P = "V-PIA-1P"
-    V_PIA_1S = "V-PIA-1S"
-    V_PIA_2P = "V-PIA-2P"
-    V_PIA_2S = "V-PIA-2S"
-    V_PIA_3P = "V-PIA-3P"
-    V_PIA_3S = "V-PIA-3S"
-    V_PIM_1P = "V-PIM-1P"
-    V_PIM_1S = "V-PIM-1S"
-    V_PIM_2P = "V-PIM-2P"
-    V_PIM_3P = "V-PIM-3P"
-    V_PIM_3S = "V-PIM-3S"
-    V_PIM_P_1P = "V-PIM/P-1P"
-    V_PIM_P_1S = "V-PIM/P-1S"
-    V_PIM_P_2P = "V-PIM/P-2P"
-    V_PIM_P_2S = "V-PIM/P-2S"
-    V_PIM_P_3P = "V-PIM/P-3P"
-    V_PIM_P_3S = "V-PIM/P-3S"
-    V_PIP_1S = "V-PIP-1S"
-    V_PIP_3S = "V-PIP-3S"
-    V_PMA_2P = "V-PMA-2P"
-    V_PMA_2S = "V-PMA-2S"
-    V_PMA_3P = "V-PMA-3P"
-    V_PMA_3S = "V-PMA-3S"
-    V_PMM_2P = "V-PMM-2P"
-    V_PMM_2S = "V-PMM-2S"
-    V_PMM_P_2P = "V-PMM/P-2P"
-    V_PMM_P_2S = "V-PMM/P-2S"
-    V_PMM_P_3P = "V-PMM/P-3P"
-    V_PMM_P_3S = "V-PMM/P-3S"
-    V_PMP_2P = "V-PMP-2P"
-    V_PMP_3S = "V-PMP-3S"
-    V_PNA = "V-PNA"
-    V_PNM = "V-PNM"
-    V_PNM_P = "V-PNM/P"
-    V_PNP = "V-PNP"
-    V_POA_2P = "V-POA-2P"
-    V_POA_3P = "V-POA-3P"
-    V_POA_3S = "V-POA-3S"
-    V_POM_P_1S = "V-POM/P-1S"
-    V_POM_P_3P = "V-POM/P-3P"
-    V_POM_P_3S = "V-POM/P-3S"
-    V_PPA_AFP = "V-PPA-AFP"
-    V_PPA_AFS = "V-PPA-AFS"
-    V_PPA_AMP = "V-PPA-AMP"
-    V_PPA_AMS = "V-PPA-AMS"
-    V_PPA_ANP = "V-PPA-ANP"
-    V_PPA_ANS = "V-PPA-ANS"
-    V_PPA_DFP = "V-PPA-DFP"
-    V_PPA_DFS = "V-PPA-DFS"
-    V_PPA_DMP = "V-PPA-DMP"
-    V_PPA_DMS = "V-PPA-DMS"
-    V_PPA_DNP = "V-PPA-DNP"
-    V_PPA_DNS = "V-PPA-DNS"
-    V_PPA_GFP = "V-PPA-GFP"
-    V_PPA_GFS = "V-PPA-GFS"
-    V_PPA_GMP = "V-PPA-GMP"
-    V_PPA_GMS = "V-PPA-GMS"
-    V_PPA_GNP = "V-PPA-GNP"
-    V_PPA_GNS = "V-PPA-GNS"
-    V_PPA_NFP = "V-PPA-NFP"
-    V_PPA_NFS = "V-PPA-NFS"
-    V_PPA_NMP = "V-PPA-NMP"
-    V_PPA_NMS = "V-PPA-NMS"
-    V_PPA_NNP = "V-PPA-NNP"
-    V_PPA_NNS = "V-PPA-NNS"
-    V_PPA_VFS = "V-PPA-VFS"
-    V_PPA_VMP = "V-PPA-VMP"
-    V_PPA_VMS = "V-PPA-VMS"
-    V_PPM_AFS = "V-PPM-AFS"
-    V_PPM_AMP = "V-PPM-AMP"
-    V_PPM_AMS = "V-PPM-AMS"
-    V_PPM_ANS = "V-PPM-ANS"
-    V_PPM_DMP = "V-PPM-DMP"
-    V_PPM_DMS = "V-PPM-DMS"
-    V_PPM_GFP = "V-PPM-GFP"
-    V_PPM_GFS = "V-PPM-GFS"
-    V_PPM_GMP = "V-PPM-GMP"
-    V_PPM_GMS = "V-PPM-GMS"
-    V_PPM_GNP = "V-PPM-GNP"
-    V_PPM_GNS = "V-PPM-GNS"
-    V_PPM_NFP = "V-PPM-NFP"
-    V_PPM_NFS = "V-PPM-NFS"
-    V_PPM_NMP = "V-PPM-NMP"
-    V_PPM_NMS = "V-PPM-NMS"
-    V_PPM_NNS = "V-PPM-NNS"
-    V_PPM_P_AFP = "V-PPM/P-AFP"
-    V_PPM_P_AFS = "V-PPM/P-AFS"
-    V_PPM_P_AMP = "V-PPM/P-AMP"
-    V_PPM_P_AMS = "V-PPM/P-AMS"
-    V_PPM_P_ANP = "V-PPM/P-ANP"
-    V_PPM_P_ANS = "V-PPM/P-ANS"
-    V_PPM_P_DFP = "V-PPM/P-DFP"
-    V_PPM_P_DFS = "V-PPM/P-DFS"
-    V_PPM_P_DMP = "V-PPM/P-DMP"
-    V_PPM_P_DMS = "V-PPM/P-DMS"
-    V_PPM_P_DNP = "V-PPM/P-DNP"
-    V_PPM_P_DNS = "V-PPM/P-DNS"
-    V_PPM_P_GFP = "V-PPM/P-GFP"
-    V_PPM_P_GFS = "V-PPM/P-GFS"
-    V_PPM_P_GMP = "V-PPM/P-GMP"
-    V_PPM_P_GMS = "V-PPM/P-GMS"
-    V_PPM_P_GNP = "V-PPM/P-GNP"
-    V_PPM_P_GNS = "V-PPM/P-GNS"
-    V_PPM_P_NFP = "V-PPM/P-NFP"
-    V_PPM_P_NFS = "V-PPM/P-NFS"
-    V_PPM_P_NMP = "V-PPM/P-NMP"
-    V_PPM_P_NMS = "V-PPM/P-NMS"
-    V_PPM_P_NNP = "V-PPM/P-NNP"
-    V_PPM_P_NNS = "V-PPM/P-NNS"
-    V_PPM_P_VMP = "V-PPM/P-VMP"
-    V_PPM_P_VMS = "V-PPM/P-VMS"
-    V_PPP_DMP = "V-PPP-DMP"
-    V_PPP_GMP = "V-PPP-GMP"
-    V_PPP_GMS = "V-PPP-GMS"
-    V_PPP_NMP = "V-PPP-NMP"
-    V_PSA_1P = "V-PSA-1P"
-    V_PSA_1S = "V-PSA-1S"
-    V_PSA_2P = "V-PSA-2P"
-    V_PSA_2S = "V-PSA-2S"
-    V_PSA_3P = "V-PSA-3P"
-    V_PSA_3S = "V-PSA-3S"
-    V_PSM_1P = "V-PSM-1P"
-    V_PSM_1S = "V-PSM-1S"
-    V_PSM_2S = "V-PSM-2S"
-    V_PSM_3S = "V-PSM-3S"
-    V_PSM_P_1P = "V-PSM/P-1P"
-    V_PSM_P_1S = "V-PSM/P-1S"
-    V_PSM_P_2P = "V-PSM/P-2P"
-    V_PSM_P_2S = "V-PSM/P-2S"
-    V_PSM_P_3P = "V-PSM/P-3P"
-    V_PSM_P_3S = "V-PSM/P-3S"
-    V_RIA_1P = "V-RIA-1P"
-    V_RIA_1S = "V-RIA-1S"
-    V_RIA_2P = "V-RIA-2P"
-    V_RIA_2S = "V-RIA-2S"
-    V_RIA_3P = "V-RIA-3P"
-    V_RIA_3S = "V-RIA-3S"
-    V_RIM_2S = "V-RIM-2S"
-    V_RIM_3S = "V-RIM-3S"
-    V_RIM_P_1P = "V-RIM/P-1P"
-    V_RIM_P_1S = "V-RIM/P-1S"
-    V_RIM_P_2P = "V-RIM/P-2P"
-    V_RIM_P_2S = "V-RIM/P-2S"
-    V_RIM_P_3P = "V-RIM/P-3P"
-    V_RIM_P_3S = "V-RIM/P-3S"
-    V_RIP_1P = "V-RIP-1P"
-    V_RMA_2P = "V-RMA-2P"
-    V_RMM_P_2P = "V-RMM/P-2P"
-    V_RMM_P_2S = "V-RMM/P-2S"
-    V_RNA = "V-RNA"
-    V_RNM_P = "V-RNM/P"
-    V_RPA_AFS = "V-RPA-AFS"
-    V_RPA_AMP = "V-RPA-AMP"
-    V_RPA_AMS = "V-RPA-AMS"
-    V_RPA_ANP = "V-RPA-ANP"
-    V_RPA_ANS = "V-RPA-ANS"
-    V_RPA_DMP = "V-RPA-DMP"
-    V_RPA_DMS = "V-RPA-DMS"
-    V_RPA_DNS = "V-RPA-DNS"
-    V_RPA_GFS = "V-RPA-GFS"
-    V_RPA_GMP = "V-RPA-GMP"
-    V_RPA_GMS = "V-RPA-GMS"
-    V_RPA_GNP = "V-RPA-GNP"
-    V_RPA_NFP = "V-RPA-NFP"
-    V_RPA_NFS = "V-RPA-NFS"
-    V_RPA_NMP = "V-RPA-NMP"
-    V_RPA_NMS = "V-RPA-NMS"
-    V_RPA_NNP = "V-RPA-NNP"
-    V_RPA_NNS = "V-RPA-NNS"
-    V_RPM_AMS = "V-RPM-AMS"
-    V_RPM_NMP = "V-RPM-NMP"
-    V_RPM_NMS = "V-RPM-NMS"
-    V_RPM_P_AFP = "V-RPM/P-AFP"
-    V_RPM_P_AFS = "V-RPM/P-AFS"
-    V_RPM_P_AMP = "V-RPM/P-AMP"
-    V_RPM_P_AMS = "V-RPM/P-AMS"
-    V_RPM_P_ANP = "V-RPM/P-ANP"
-    V_RPM_P_ANS = "V-RPM/P-ANS"
-    V_RPM_P_DFP = "V-RPM/P-DFP"
-    V_RPM_P_DFS = "V-RPM/P-DFS"
-    V_RPM_P_DMP = "V-RPM/P-DMP"
-    V_RPM_P_DMS = "V-RPM/P-DMS"
-    V_RPM_P_DNP = "V-RPM/P-DNP"
-    V_RPM_P_DNS = "V-RPM/P-DNS"
-    V_RPM_P_GFP = "V-RPM/P-GFP"
-    V_RPM_P_GFS = "V-RPM/P-GFS"
-    V_RPM_P_GMP = "V-RPM/P-GMP"
-    V_RPM_P_GMS = "V-RPM/P-GMS"
-    V_RPM_P_GNP = "V-RPM/P-GNP"
-    V_RPM_P_GNS = "V-RPM/P-GNS"
-    V_RPM_P_NFP = "V-RPM/P-NFP"
-    V_RPM_P_NFS = "V-RPM/P-NFS"
-    V_RPM_P_NMP = "V-RPM/P-NMP"
-    V_RPM_P_NMS = "V-RPM/P-NMS"
-    V_RPM_P_NNP = "V-RPM/P-NNP"
-    V_RPM_P_NNS = "V-RPM/P-NNS"
-    V_RPM_P_VFS = "V-RPM/P-VFS"
-    V_RPM_P_VMP = "V-RPM/P-VMP"
-    V_RPM_P_VMS = "V-RPM/P-VMS"
-    V_RSA_1P = "V-RSA-1P"
-    V_RSA_1S = "V-RSA-1S"
-    V_RSA_2P = "V-RSA-2P"
-    V_RSA_2S = "V-RSA-2S"
+
+def __getattr__(name: str) -> type[Enum]:
+    # The Enum view is only built once it is used, the table covers the lookups on its own
+    if name == "Tag":
+        globals()["Tag"] = TABLE.to_enum(module=__name__, doc="Tagset for the BibleHub dataset.")
+        return globals()["Tag"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,171 @@
+"""
+Generate the tagset tables: the tags of each tagset and their decomposition into features.
+
+The tags of a table are read from its own `TAGS` - to add a tag, append it there and regenerate:
+
+    python -m morpht5.tagsets.generate
+"""
+
+import json
+import re
+from importlib import import_module
+from pathlib import Path
+from typing import Callable
+
+from .table import FeatureTable
+
+FEATURES = ("pos", "person", "tense", "mood", "voice", "case", "number", "gender", "degree")
+
+# Features with a common meaning are labelled alike in both tagsets, the part of speech and the voice keep the notation
+# of each tagset
+TENSES = {"P": "present", "I": "imperfect", "F": "future", "A": "aorist", "R": "perfect", "L": "pluperfect"}
+MOODS = {"I": "indicative", "M": "imperative", "S": "subjunctive", "O": "optative", "N": "infinitive", "P": "participle"}
+CASES = {"N": "nominative", "V": "vocative", "A": "accusative", "G": "genitive", "D": "dative"}
+GENDERS = {"M": "masculine", "F": "feminine", "N": "neuter"}
+NUMBERS = {"S": "singular", "P": "plural"}
+DEGREES = {"C": "comparative", "S": "superlative"}
+
+_BIBLEHUB_VERB = re.compile(r"(?P<tense>[PIFARL])?(?P<mood>[IMSONP])(?P<voice>M/P|[AMP])?")
+_BIBLEHUB_NOMINAL = re.compile(r"(?P<case>[NVAGD])(?P<gender>[MFN])?(?P<person>[123])?(?P<number>[SP])")
+
+
+def parse_biblehub_tag(tag: str) -> dict[str, str]:
+    """
+    Decompose a BibleHub tag, e.g. `V-PIA-3S` or `Adj-GMS-C`, into its features.
+
+    >>> parse_biblehub_tag("V-AMA-2S")
+    {'pos': 'V', 'tense': 'aorist', 'mood': 'imperative', 'voice': 'A', 'person': '2', 'number': 'singular'}
+    >>> parse_biblehub_tag("PPro-AF3S")
+    {'pos': 'PPro', 'case': 'accusative', 'gender': 'feminine', 'person': '3', 'number': 'singular'}
+    """
+    pos, *parts = tag.split("-")
+    features = {"pos": pos}
+    if pos == "V" and parts:
+        verb = _BIBLEHUB_VERB.fullmatch(parts.pop(0))
+        if verb is None:
+            raise ValueError(f"Cannot parse the BibleHub tag {tag!r}")
+        features |= {
+            "tense": TENSES.get(verb["tense"]),
+            "mood": MOODS[verb["mood"]],
+            "voice": verb["voice"],
+        }
+    for part in parts:
+        if part in DEGREES:
+            features["degree"] = DEGREES[part]
+        elif nominal := _BIBLEHUB_NOMINAL.fullmatch(part):
+            features |= {
+                "case": CASES[nominal["case"]],
+                "gender": GENDERS.get(nominal["gender"]),
+                "person": nominal["person"],
+                "number": NUMBERS[nominal["number"]],
+            }
+        elif len(part) == 2 and part[0] in "123" and part[1] in NUMBERS:
+            features |= {"person": part[0], "number": NUMBERS[part[1]]}
+        else:
+            raise ValueError(f"Cannot parse the BibleHub tag {tag!r}")
+    return {feature: label for feature, label in features.items() if label is not None}
+
+
+OBLUBIENICA_TOKENS = {
+    "tense": {
+        "Pres": "present",
+        "Impf": "imperfect",
+        "Fut": "future",
+        "Aor": "aorist",
+        "Perf": "perfect",
+        "Plup": "pluperfect",
+        "2Fut": "second future",
+        "2Aor": "second aorist",
+        "2Perf": "second perfect",
+        "2Plup": "second pluperfect",
+        "txx": "unspecified",
+    },
+    "voice": {voice: voice for voice in ("Act", "Mid", "Pas", "Mid/Pas", "mid/pas", "midD", "pasD", "midD/pasD", "im-Act", "vxx")},
+    "case": {"Nom": "nominative", "Voc": "vocative", "Acc": "accusative", "Gen": "genitive", "Dat": "dative"},
+    "number": {"Sg": "singular", "Pl": "plural"},
+    "gender": {"m": "masculine", "f": "feminine", "n": "neuter"},
+    "person": {person: person for person in "123"},
+    "degree": {"Cmp": "comparative", "Sup": "superlative"},
+}
+# Further qualifiers of a tag (e.g. `Att` for Attic forms), kept as they are
+OBLUBIENICA_QUALIFIERS = {"Att", "Con", "Int", "Irr", "Neg", "Tra", "MidS", "j", "letter", "other", "proper"}
+OBLUBIENICA_MOODS = {"i": "indicative", "m": "imperative", "s": "subjunctive", "o": "optative", "n": "infinitive", "p": "participle"}
+
+
+def parse_oblubienica_tag(tag: str) -> dict[str, str]:
+    """
+    Decompose an Oblubienica tag, e.g. `vi Pres Act 3 Sg` or `a_ Nom Sg m Cmp`, into its features.
+
+    >>> parse_oblubienica_tag("vi 2Aor midD 3 Pl")
+    {'pos': 'v', 'mood': 'indicative', 'tense': 'second aorist', 'voice': 'midD', 'person': '3', 'number': 'plural'}
+    >>> parse_oblubienica_tag("n_ Acc Sg f Con")
+    {'pos': 'n_', 'case': 'accusative', 'number': 'singular', 'gender': 'feminine', 'qualifier': 'Con'}
+    """
+    pos, *tokens = tag.split(" ")
+    features = {"pos": pos}
+    # The mood of a verb is part of its part of speech: `vi` is an indicative, `vp` a participle
+    if len(pos) == 2 and pos[0] == "v" and pos[1] in OBLUBIENICA_MOODS:
+        features = {"pos": "v", "mood": OBLUBIENICA_MOODS[pos[1]]}
+    for token in tokens:
+        if token in OBLUBIENICA_QUALIFIERS:
+            feature, label = "qualifier", token
+        elif feature := next((feature for feature, labels in OBLUBIENICA_TOKENS.items() if token in labels), None):
+            label = OBLUBIENICA_TOKENS[feature][token]
+        else:
+            raise ValueError(f"Cannot parse the Oblubienica tag {tag!r}")
+        # A few tags give two values of a feature, e.g. the tenses of `vi Fut Pres 1 Sg`
+        features[feature] = f"{features[feature]}/{label}" if feature in features else label
+    return features
+
+
+def build_features(tags: tuple[str, ...], parse: Callable[[str], dict[str, str]]) -> dict[str, FeatureTable]:
+    """Decompose every tag, and gather the labels of each feature with the label id of every tag."""
+    decompositions = [parse(tag) for tag in tags]
+    names = [feature for feature in FEATURES if any(feature in features for features in decompositions)]
+    names += sorted({feature for features in decompositions for feature in features} - set(names))
+    tables = {}
+    for feature in names:
+        labels = ("", *sorted({features[feature] for features in decompositions if feature in features}))
+        if len(labels) > 256:
+            raise ValueError(f"The {feature} feature has too many labels to be stored in bytes")
+        label_ids = bytes(labels.index(features.get(feature, "")) for features in decompositions)
+        tables[feature] = (labels, label_ids)
+    return tables
+
+
+def render_table(tags: tuple[str, ...], features: dict[str, FeatureTable]) -> str:
+    lines = [
+        "# Generated by `python -m morpht5.tagsets.generate` - edit the tags (only), and regenerate the features",
+        "# fmt: off",
+        "TAGS = (",
+        *(f"    {json.dumps(tag)}," for tag in tags),
+        ")",
+        "",
+        "FEATURES = {",
+    ]
+    for feature, (labels, label_ids) in features.items():
+        chunks = [label_ids[start : start + 24] for start in range(0, len(label_ids), 24)]
+        lines += [f'    "{feature}": (', f"        ({', '.join(json.dumps(label) for label in labels)}),", "        ("]
+        lines += [f"            {chunk!r}" for chunk in chunks]
+        lines += ["        ),", "    ),"]
+    return "\n".join(lines + ["}", ""])
+
+
+TABLES = {"_biblehub_table": parse_biblehub_tag, "_oblubienica_table": parse_oblubienica_tag}
+
+
+def generate_table(module_name: str) -> str:
+    """Render the table module `module_name` anew, from its tags."""
+    tags = tuple(import_module(f".{module_name}", __package__).TAGS)
+    return render_table(tags, build_features(tags, TABLES[module_name]))
+
+
+def main() -> None:
+    for module_name in TABLES:
+        path = Path(__file__).with_name(f"{module_name}.py")
+        path.write_text(generate_table(module_name))
+        print(f"Generated {path}")
+
+
+if __name__ == "__main__":
+    main()
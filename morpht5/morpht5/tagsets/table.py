@@ -0,0 +1,90 @@
+import re
+import sys
+import textwrap
+from enum import Enum
+from typing import Iterator
+
+# Labels of a feature and the label id of every tag, see `TagsetTable.features`
+FeatureTable = tuple[tuple[str, ...], bytes]
+
+
+def get_member_name(tag: str) -> str:
+    """
+    Name of the `Enum` member holding a tag.
+
+    >>> get_member_name("V-PIA-3S")
+    'V_PIA_3S'
+    >>> get_member_name("vp Pres midD/pasD Nom Sg f")
+    'VP_PRES_MIDD_PASD_NOM_SG_F'
+    """
+    return re.sub(r"[^0-9A-Za-z]+", "_", tag).upper().strip("_")
+
+
+class TagsetTable:
+    """
+    Compact, precomputed table of a morphological tagset: its tags, their ids and their decomposition into features.
+
+    The tags are a tuple, in the order of their ids. Every feature (e.g. `case` or `number`) is a tuple of labels - the
+    first one empty, for the tags the feature does not apply to - and a `bytes` array holding the label id of each tag,
+    so a feature of a batch of tag ids is a plain indexing away. The tables are generated, see `generate.py`.
+
+    Example:
+        ```python
+        >>> from morpht5.tagsets import BIBLEHUB_TAGSET
+        >>> tag_id = BIBLEHUB_TAGSET.ids["N-GMS"]
+        >>> BIBLEHUB_TAGSET.tags[tag_id]
+        'N-GMS'
+        >>> BIBLEHUB_TAGSET.decompose("N-GMS")
+        {'pos': 'N', 'case': 'genitive', 'number': 'singular', 'gender': 'masculine'}
+        >>> labels, label_ids = BIBLEHUB_TAGSET.features["case"]
+        >>> labels[label_ids[tag_id]]
+        'genitive'
+
+        ```
+
+    Args:
+        tags: The tags, in the order of their ids
+        features: The labels of each feature, and the label id of every tag
+        name: Name of the tagset
+    """
+
+    def __init__(self, tags: tuple[str, ...], features: dict[str, FeatureTable], name: str):
+        self.tags = tags
+        self.ids = {tag: tag_id for tag_id, tag in enumerate(tags)}
+        self.features = features
+        self.name = name
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tags)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.ids
+
+    def __repr__(self) -> str:
+        return f"TagsetTable(name={self.name!r}, num_tags={len(self)}, features={list(self.features)})"
+
+    def decompose(self, tag: str) -> dict[str, str]:
+        """The features which apply to a tag, and their labels."""
+        tag_id = self.ids[tag]
+        return {
+            feature: labels[label_ids[tag_id]] for feature, (labels, label_ids) in self.features.items() if label_ids[tag_id]
+        }
+
+    def to_enum(self, name: str = "Tag", module: str | None = None, doc: str | None = None) -> type[Enum]:
+        """
+        Build an `Enum` of the tags - a member per tag, named after it (see `get_member_name`) and valued with it.
+
+        The `doc` line becomes the docstring of the `Enum` exactly as if it was written on its own line in the body of a
+        module-level class statement, as the tagset Enums used to be.
+        """
+        enum = Enum(name, [(get_member_name(tag), tag) for tag in self.tags], module=module)
+        if doc is not None:
+            doc = f"\n    {doc}\n    "
+            if sys.version_info >= (3, 13):
+                # The compiler strips the indentation of docstrings since Python 3.13
+                doc = textwrap.dedent(doc)
+        enum.__doc__ = doc
+        return enum
@@ -1,12 +1,16 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from datasets import Dataset
 from transformers import PreTrainedTokenizer, T5TokenizerFast
 from transformers.tokenization_utils import PaddingStrategy
 
 from .morph_tokenizer import MorphTokenizer
 
+if TYPE_CHECKING:
+    # Only needed for building the vocabulary while training, and not a dependency of the package otherwise
+    from datasets import Dataset
+
 
 class MorphT5Tokenizer(PreTrainedTokenizer):
     """
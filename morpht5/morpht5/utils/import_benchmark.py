@@ -0,0 +1,95 @@
+"""
+Measure the time and memory it takes to import morpht5, and to access each of its lazily imported parts.
+
+Every measurement runs in a fresh interpreter, so that nothing is imported already:
+
+    python -m morpht5.utils.import_benchmark --repeats 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Statements run after `import morpht5`, each measured on its own
+LAZY_PATHS = {
+    "format_interlinear": "morpht5.format_interlinear",
+    "SentinelToken": "morpht5.SentinelToken",
+    "BibleHubTag": "morpht5.BibleHubTag",
+    "OblubienicaTag": "morpht5.OblubienicaTag",
+    "BIBLEHUB_TAGSET": "morpht5.BIBLEHUB_TAGSET",
+    "OBLUBIENICA_TAGSET": "morpht5.OBLUBIENICA_TAGSET",
+    "MorphT5Tokenizer": "morpht5.MorphT5Tokenizer",
+    "MorphT5AutoForConditionalGeneration": "morpht5.MorphT5AutoForConditionalGeneration",
+    "MorphT5ConcatForConditionalGeneration": "morpht5.MorphT5ConcatForConditionalGeneration",
+    "MorphT5SumForConditionalGeneration": "morpht5.MorphT5SumForConditionalGeneration",
+    "everything": "from morpht5 import *",
+}
+
+HEAVY_MODULES = ["torch", "transformers", "datasets"]
+
+_MEASUREMENT = """
+import json, resource, sys, time, tracemalloc
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+num_modules_before = len(sys.modules)
+start = time.perf_counter()
+import morpht5
+import_seconds = time.perf_counter() - start
+rss_after_import = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+num_modules = len(sys.modules)
+if {trace_memory!r}:
+    tracemalloc.start()
+start = time.perf_counter()
+exec({statement!r})
+access_seconds = time.perf_counter() - start
+print(json.dumps({{
+    "import_seconds": import_seconds,
+    "import_rss_kib": rss_after_import - rss_before,
+    "import_modules": num_modules - num_modules_before,
+    "access_seconds": access_seconds,
+    "access_allocated_kib": tracemalloc.get_traced_memory()[0] / 1024 if tracemalloc.is_tracing() else None,
+    "access_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_after_import,
+    "access_modules": len(sys.modules) - num_modules,
+    "heavy_modules": [name for name in {heavy_modules!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(statement: str, trace_memory: bool = False) -> dict:
+    """
+    Import morpht5 and run `statement` in a fresh interpreter, returning the time and peak memory of both steps.
+
+    With `trace_memory`, the memory allocated by the statement (and still held) is traced as well - precise where the peak
+    memory is too coarse, but slowing the statement down.
+    """
+    code = _MEASUREMENT.format(statement=statement, heavy_modules=HEAVY_MODULES, trace_memory=trace_memory)
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_import_benchmark(repeats: int = 3) -> dict[str, dict]:
+    """Median time and memory of `import morpht5` and of each of the `LAZY_PATHS` after it, over `repeats` runs."""
+    report = {}
+    for name, statement in {"import morpht5": "pass", **LAZY_PATHS}.items():
+        runs = [measure(statement) for _ in range(repeats)]
+        step = "import" if name == "import morpht5" else "access"
+        report[name] = {
+            "seconds": round(statistics.median(run[f"{step}_seconds"] for run in runs), 4),
+            "peak_rss_mib": round(statistics.median(run[f"{step}_rss_kib"] for run in runs) / 1024, 1),
+            "num_new_modules": runs[0][f"{step}_modules"],
+            "heavy_modules": runs[0]["heavy_modules"],
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    for name, result in run_import_benchmark(args.repeats).items():
+        print(json.dumps({"path": name} | result))
+
+
+if __name__ == "__main__":
+    main()
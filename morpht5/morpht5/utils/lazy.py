@@ -0,0 +1,35 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def get_lazy_attribute_loaders(
+    module_name: str, lazy_attributes: dict[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the `__getattr__` and `__dir__` of a module whose attributes are only imported on their first access (PEP 562).
+
+    Once imported, an attribute is stored in the module, so later accesses no longer go through `__getattr__`.
+
+    Example:
+        ```python
+        __getattr__, __dir__ = get_lazy_attribute_loaders(__name__, {"BibleHubTag": (".biblehub", "Tag")})
+        ```
+
+    Args:
+        module_name: Name of the module the attributes belong to, `__name__`
+        lazy_attributes: The (relative) module of each attribute, and the name it has there
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        submodule_name, attribute_name = lazy_attributes[name]
+        value = getattr(import_module(submodule_name, module_name), attribute_name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(lazy_attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,88 @@
+import pytest
+import torch
+
+from morpht5 import (
+    MorphT5AutoConfig,
+    MorphT5AutoForConditionalGeneration,
+    MorphT5ConcatConfig,
+    MorphT5ConcatForConditionalGeneration,
+    MorphT5SumConfig,
+    MorphT5SumForConditionalGeneration,
+)
+from morpht5.serving import EncodedVerse
+
+
+@pytest.fixture
+def tiny_config_kwargs() -> dict:
+    """Keyword arguments of a morph model config small enough to be trained and run in the tests."""
+    return dict(
+        morph_vocabulary_size=16,
+        vocab_size=64,
+        d_model=16,
+        d_kv=4,
+        d_ff=32,
+        num_layers=2,
+        num_heads=4,
+        decoder_start_token_id=0,
+        eos_token_id=1,
+        pad_token_id=0,
+    )
+
+
+@pytest.fixture(
+    params=[
+        (MorphT5SumConfig, MorphT5SumForConditionalGeneration, {}),
+        (MorphT5AutoConfig, MorphT5AutoForConditionalGeneration, {"morph_compressed_embedding_size": 8}),
+        (MorphT5ConcatConfig, MorphT5ConcatForConditionalGeneration, {"morph_embedding_size": 4}),
+    ],
+    ids=["sum", "auto", "concat"],
+)
+def morph_model_classes(request) -> tuple[type, type, dict]:
+    """The config class, the model class and the config keyword arguments specific to each morph architecture."""
+    return request.param
+
+
+@pytest.fixture
+def example_inputs() -> dict[str, torch.Tensor]:
+    """A batch of two interlinear verses, the second one padded, with source blocks separated by 3."""
+    input_ids = torch.tensor([[5, 6, 3, 7, 3, 8, 1], [5, 6, 3, 7, 1, 0, 0]])
+    return dict(
+        input_ids=input_ids,
+        attention_mask=(input_ids != 0).long(),
+        input_morphs=torch.tensor([[2, 9, 4, 15, 4, 11, 1]] * 2),
+    )
+
+
+@pytest.fixture
+def example_labels() -> torch.Tensor:
+    """Target labels of `example_inputs`, the second one padded with -100."""
+    return torch.tensor([[9, 4, 10, 1], [11, 1, -100, -100]])
+
+
+class UppercaseTranslator:
+    """Stands in for `InterlinearTranslator`, "translating" each word into its uppercase form."""
+
+    def __init__(self, fail_after_batches: int | None = None):
+        self.batches = []
+        self.fail_after_batches = fail_after_batches
+        self.cache = None
+
+    def lookup(self, words: list[str], tags: list[str]) -> list[str] | None:
+        return None
+
+    def encode(self, words: list[str], tags: list[str]) -> EncodedVerse:
+        if len(words) != len(tags):
+            raise ValueError("Every word needs a morphological tag")
+        return EncodedVerse(input_ids=[ord(word[0]) for word in words], input_morphs=[0] * len(words))
+
+    def translate(self, verses: list[EncodedVerse]) -> list[list[str]]:
+        if self.fail_after_batches is not None and len(self.batches) == self.fail_after_batches:
+            raise KeyboardInterrupt
+        self.batches.append(verses)
+        return [[chr(token_id).upper() for token_id in verse.input_ids] for verse in verses]
+
+
+@pytest.fixture
+def make_uppercase_translator() -> type[UppercaseTranslator]:
+    """Builds fake translators, which raise `KeyboardInterrupt` instead of translating batch `fail_after_batches`."""
+    return UppercaseTranslator
@@ -0,0 +1,37 @@
+import torch
+
+from morpht5 import MorphT5SumConfig, MorphT5SumForConditionalGeneration
+
+
+def test_sdpa_attention_matches_eager_attention(morph_model_classes, tiny_config_kwargs, example_inputs, example_labels):
+    config_class, model_class, morph_kwargs = morph_model_classes
+    outputs = {}
+    for use_sdpa in (False, True):
+        torch.manual_seed(0)
+        model = model_class(config_class(use_sdpa=use_sdpa, **tiny_config_kwargs, **morph_kwargs)).eval()
+        with torch.inference_mode():
+            logits = model(**example_inputs, labels=example_labels).logits
+            generated = model.generate(**example_inputs, max_new_tokens=8, num_beams=2)
+        outputs[use_sdpa] = logits, generated
+
+    (eager_logits, eager_generated), (sdpa_logits, sdpa_generated) = outputs[False], outputs[True]
+    torch.testing.assert_close(sdpa_logits, eager_logits, rtol=1e-4, atol=1e-4)
+    assert torch.equal(sdpa_generated, eager_generated)
+
+
+def test_incremental_position_bias_matches_the_last_rows_of_the_full_bias():
+    config = MorphT5SumConfig(morph_vocabulary_size=16, d_model=16, d_kv=4, num_heads=4, is_decoder=True)
+    attention = MorphT5SumForConditionalGeneration(config).decoder.block[0].layer[0].SelfAttention
+
+    full_bias = attention.compute_bias(200, 200)
+    for query_length, key_length in [(1, 1), (1, 50), (3, 200)]:
+        expected = full_bias[:, :, key_length - query_length : key_length, :key_length]
+        torch.testing.assert_close(attention.compute_bias(query_length, key_length), expected)
+
+    # Only the buckets of single queries are memoized
+    cache_info = attention._get_single_query_relative_position_buckets.cache_info
+    num_cached = cache_info().currsize
+    attention.compute_bias(150, 150)
+    assert cache_info().currsize == num_cached
+    attention.compute_bias(1, 150)
+    assert cache_info().currsize == num_cached + 1
@@ -0,0 +1,18 @@
+import torch
+
+from morpht5 import StaticKVCache
+
+
+def test_static_cache_matches_dynamic_cache(morph_model_classes, tiny_config_kwargs, example_inputs):
+    config_class, model_class, morph_kwargs = morph_model_classes
+    torch.manual_seed(0)
+    model = model_class(config_class(**tiny_config_kwargs, **morph_kwargs)).eval()
+
+    cache = StaticKVCache(max_length=13)
+    for num_beams in (1, 3):
+        cache.reset()
+        with torch.inference_mode():
+            dynamic = model.generate(**example_inputs, max_new_tokens=12, num_beams=num_beams)
+            static = model.generate(**example_inputs, max_new_tokens=12, num_beams=num_beams, past_key_values=cache)
+        assert torch.equal(static, dynamic)
+        assert cache.get_seq_length() == dynamic.shape[1] - 1
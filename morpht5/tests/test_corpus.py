@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from morpht5.serving import read_records, translate_corpus
+
+
+def test_interrupted_corpus_translation_resumes_at_the_last_completed_shard(tmp_path, make_uppercase_translator):
+    lines = [
+        json.dumps({"siglum": f"v{index}", "words": ["a", "b", "c"][: index % 3 + 1], "tags": ["N"] * (index % 3 + 1)})
+        for index in range(7)
+    ]
+    output_path = tmp_path / "translations.jsonl"
+
+    # A shard of 3 records is translated in 2 batches of at most 4 padded tokens, so the second shard fails halfway
+    translator = make_uppercase_translator(fail_after_batches=3)
+    with pytest.raises(KeyboardInterrupt):
+        translate_corpus(translator, read_records(lines), output_path, shard_size=3, max_batch_tokens=4)
+    assert len(output_path.read_text().splitlines()) == 3
+    # As if the process was killed while writing the next shard
+    with open(output_path, "a") as output:
+        output.write('{"siglum": "v3", "wor')
+
+    translator = make_uppercase_translator()
+    checkpoint = translate_corpus(translator, read_records(lines), output_path, shard_size=3, max_batch_tokens=4)
+    assert (checkpoint.num_shards, checkpoint.num_records) == (3, 7)
+    assert sum(len(batch) for batch in translator.batches) == 4
+
+    records = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [record["siglum"] for record in records] == [f"v{index}" for index in range(7)]
+    assert records[2]["blocks"] == ["A", "B", "C"]
+
+    # Resuming a completed run translates nothing
+    assert translate_corpus(make_uppercase_translator(fail_after_batches=0), read_records(lines), output_path) == checkpoint
+
+
+def test_corpus_translation_refuses_other_records_or_an_output_without_checkpoint(tmp_path, make_uppercase_translator):
+    lines = [json.dumps({"siglum": f"v{index}", "words": ["a"], "tags": ["N"]}) for index in range(4)]
+    output_path = tmp_path / "translations.jsonl"
+    translate_corpus(make_uppercase_translator(), read_records(lines[:2]), output_path, shard_size=1)
+    translated = output_path.read_text()
+
+    # Resuming with records other than the ones already translated, or with fewer of them
+    other_lines = [lines[0].replace("v0", "w0")] + lines[1:]
+    for records in (read_records(other_lines), read_records(lines[:1])):
+        with pytest.raises(ValueError, match="do not start with the 2 records"):
+            translate_corpus(make_uppercase_translator(fail_after_batches=0), records, output_path)
+    assert output_path.read_text() == translated
+
+    checkpoint_path = tmp_path / "translations.jsonl.checkpoint.json"
+    checkpoint_path.unlink()
+    with pytest.raises(FileExistsError):
+        translate_corpus(make_uppercase_translator(fail_after_batches=0), read_records(lines), output_path)
+    assert output_path.read_text() == translated
+
+    checkpoint = translate_corpus(make_uppercase_translator(), read_records(other_lines), output_path, overwrite=True)
+    assert checkpoint.num_records == 4
+    assert [json.loads(line)["siglum"] for line in output_path.read_text().splitlines()] == ["w0", "v1", "v2", "v3"]
+
+
+def test_records_without_words_or_tags_are_rejected():
+    with pytest.raises(ValueError, match="Line 3"):
+        list(read_records(['{"words": ["a"], "tags": ["N"]}', "", '{"words": ["a"]}']))
@@ -0,0 +1,52 @@
+import torch
+
+from morpht5 import (
+    MorphT5AutoConfig,
+    MorphT5AutoForConditionalGeneration,
+    MorphT5ConcatConfig,
+    MorphT5ConcatForConditionalGeneration,
+)
+from morpht5.models.modeling_morph_t5_concat import MorphT5ConcatEncoderModel
+
+
+def test_folded_morph_autoencoder_matches_the_training_time_path(tmp_path, tiny_config_kwargs, example_inputs, example_labels):
+    torch.manual_seed(0)
+    config = MorphT5AutoConfig(morph_compressed_embedding_size=8, **tiny_config_kwargs)
+    model = MorphT5AutoForConditionalGeneration(config).eval()
+    with torch.inference_mode():
+        expected = model(**example_inputs, labels=example_labels).logits
+
+    model.fold_morph_embeddings()
+    assert not hasattr(model.encoder, "morph_compress_morphs")
+    model.save_pretrained(tmp_path)
+    reloaded = MorphT5AutoForConditionalGeneration.from_pretrained(tmp_path).eval()
+
+    for folded in (model, reloaded):
+        with torch.inference_mode():
+            torch.testing.assert_close(folded(**example_inputs, labels=example_labels).logits, expected)
+
+
+def test_folded_concat_word_table_matches_the_training_time_path(tmp_path, tiny_config_kwargs, example_inputs, example_labels):
+    torch.manual_seed(0)
+    config = MorphT5ConcatConfig(morph_embedding_size=4, **tiny_config_kwargs)
+
+    model = MorphT5ConcatForConditionalGeneration(config).eval()
+    with torch.inference_mode():
+        expected = model(**example_inputs, labels=example_labels).logits
+    model.fold_morph_embeddings()
+    assert not hasattr(model.encoder, "morph_compress_words")
+    with torch.inference_mode():
+        torch.testing.assert_close(model(**example_inputs, labels=example_labels).logits, expected)
+
+    encoder = MorphT5ConcatEncoderModel(config).eval()
+    with torch.inference_mode():
+        expected = encoder(**example_inputs).last_hidden_state
+    encoder.fold_morph_embeddings()
+    assert encoder.shared is None
+    encoder.save_pretrained(tmp_path)
+    reloaded = MorphT5ConcatEncoderModel.from_pretrained(tmp_path).eval()
+    assert reloaded.shared is None
+
+    for folded in (encoder, reloaded):
+        with torch.inference_mode():
+            torch.testing.assert_close(folded(**example_inputs).last_hidden_state, expected)
@@ -0,0 +1,63 @@
+import torch
+from transformers import LogitsProcessor, LogitsProcessorList, StoppingCriteriaList
+
+from morpht5 import BlockCountLogitsProcessor, BlockCountStoppingCriteria, MorphT5SumConfig, MorphT5SumForConditionalGeneration
+
+SOURCE_SEP, TARGET_SEP, EOS = 3, 4, 1
+
+
+class FavourTargetSeparator(LogitsProcessor):
+    """Simulates a model which keeps opening new blocks instead of ending the sequence."""
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        scores[:, TARGET_SEP] = scores.max(dim=-1).values + 1.0
+        scores[:, EOS] = -float("inf")
+        return scores
+
+
+def test_generation_ends_once_all_blocks_are_emitted(tiny_config_kwargs, example_inputs):
+    torch.manual_seed(0)
+    model = MorphT5SumForConditionalGeneration(MorphT5SumConfig(**tiny_config_kwargs)).eval()
+
+    block_count_kwargs = dict(
+        source_input_ids=example_inputs["input_ids"],
+        source_block_sep_token_id=SOURCE_SEP,
+        target_block_sep_token_id=TARGET_SEP,
+        eos_token_id=EOS,
+    )
+
+    for num_beams in (1, 3):
+        unconstrained = model.generate(
+            **example_inputs,
+            max_new_tokens=20,
+            num_beams=num_beams,
+            logits_processor=LogitsProcessorList([FavourTargetSeparator()]),
+        )
+        constrained = model.generate(
+            **example_inputs,
+            max_new_tokens=20,
+            num_beams=num_beams,
+            logits_processor=LogitsProcessorList([FavourTargetSeparator(), BlockCountLogitsProcessor(**block_count_kwargs)]),
+            stopping_criteria=StoppingCriteriaList([BlockCountStoppingCriteria(**block_count_kwargs)]),
+        )
+
+        assert unconstrained.shape[1] == 21
+        assert (constrained == TARGET_SEP).sum(dim=-1).tolist() == [2, 1]
+        assert (constrained == EOS).any(dim=-1).all()
+        assert constrained.shape[1] == 4
+
+
+def test_assisted_generation_with_a_morph_draft_model_matches_greedy_search(tiny_config_kwargs, example_inputs):
+    torch.manual_seed(0)
+    config = MorphT5SumConfig(**(tiny_config_kwargs | dict(d_model=32, d_ff=64, num_layers=3)))
+    model = MorphT5SumForConditionalGeneration(config).eval()
+    draft_model = MorphT5SumForConditionalGeneration(MorphT5SumConfig(**tiny_config_kwargs)).eval()
+
+    # Assisted generation only supports a batch of a single sequence
+    inputs = {name: tensor[:1] for name, tensor in example_inputs.items()}
+    greedy = model.generate(**inputs, max_new_tokens=20)
+
+    # A draft model which always agrees with the model makes every proposed token be verified in a single forward pass
+    for assistant_model in (draft_model, model):
+        assisted = model.generate(**inputs, max_new_tokens=20, assistant_model=assistant_model)
+        torch.testing.assert_close(assisted, greedy, rtol=0, atol=0)
@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+import morpht5
+from morpht5.models import modeling_morph_t5_concat
+from morpht5.tagsets import biblehub
+
+
+def get_imported_modules(code: str) -> list[str]:
+    """The modules imported by running `code` in a fresh interpreter."""
+    code += "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_lightweight_parts_do_not_import_torch_or_the_models():
+    modules = get_imported_modules("import morpht5\nmorpht5.format_interlinear, morpht5.SentinelToken, morpht5.BibleHubTag")
+    assert "torch" not in modules and "transformers" not in modules
+    assert "morpht5.tagsets.biblehub" in modules and "morpht5.tagsets.oblubienica" not in modules
+
+
+def test_model_classes_import_only_their_own_modeling_module():
+    modules = get_imported_modules("from morpht5 import MorphT5SumConfig")
+    assert [module for module in modules if module.startswith("morpht5.models.")] == ["morpht5.models.modeling_morph_t5_sum"]
+
+
+def test_lazy_attributes_are_the_original_objects():
+    assert morpht5.MorphT5ConcatModel is modeling_morph_t5_concat.MorphT5ConcatModel
+    assert morpht5.BibleHubTag is biblehub.Tag
+    assert set(morpht5.__all__) <= set(dir(morpht5))
+    assert all(getattr(morpht5, name) is not None for name in morpht5.__all__)
@@ -0,0 +1,25 @@
+import copy
+
+import torch
+
+from morpht5 import MorphT5SumConfig, MorphT5SumForConditionalGeneration
+
+
+def test_chunked_loss_matches_the_full_logits_loss(tiny_config_kwargs, example_inputs):
+    torch.manual_seed(0)
+    config = MorphT5SumConfig(dropout_rate=0.0, **tiny_config_kwargs)
+    model = MorphT5SumForConditionalGeneration(config).train()
+    chunked_model = copy.deepcopy(model)
+    chunked_model.config.loss_chunk_size = 3
+
+    labels = torch.tensor([[9, 4, 10, 33, 4, 1], [11, 1, -100, -100, -100, -100]])
+
+    outputs = model(**example_inputs, labels=labels)
+    chunked_outputs = chunked_model(**example_inputs, labels=labels)
+    outputs.loss.backward()
+    chunked_outputs.loss.backward()
+
+    assert chunked_outputs.logits is None
+    torch.testing.assert_close(chunked_outputs.loss, outputs.loss)
+    for (name, parameter), chunked_parameter in zip(model.named_parameters(), chunked_model.parameters()):
+        torch.testing.assert_close(chunked_parameter.grad, parameter.grad, msg=name)
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+import pytest
+
+from morpht5.serving import MicroBatcher, ServerOverloaded, TranslationServer, run_load_test
+from morpht5.serving.load_test import request_json
+from morpht5.serving.server import HTTPError, read_request
+
+
+def test_batcher_groups_concurrent_requests_within_the_token_budget():
+    batches = []
+
+    def process_batch(items: list[int]) -> list[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    async def run() -> list[int]:
+        batcher = MicroBatcher(process_batch, max_wait_ms=50, max_batch_tokens=40, max_batch_size=8)
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(item, num_tokens=10) for item in range(6)))
+        finally:
+            await batcher.stop()
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8, 10]
+    # 4 requests of 10 tokens fill the 40 token budget, the rest goes into the next batch
+    assert batches == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_batcher_rejects_requests_beyond_max_pending():
+    started, release = threading.Event(), threading.Event()
+
+    def process_batch(items: list[int]) -> list[int]:
+        started.set()
+        release.wait()
+        return items
+
+    async def run() -> None:
+        batcher = MicroBatcher(process_batch, max_wait_ms=0, max_batch_size=1, max_pending=2)
+        await batcher.start()
+        try:
+            running = [asyncio.create_task(batcher.submit(0, num_tokens=1))]
+            await asyncio.to_thread(started.wait)
+            # The first request is being processed, the next two wait for a batch
+            running += [asyncio.create_task(batcher.submit(item, num_tokens=1)) for item in (1, 2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ServerOverloaded):
+                await batcher.submit(3, num_tokens=1)
+            release.set()
+            assert await asyncio.gather(*running) == [0, 1, 2]
+            assert batcher.stats.num_rejected == 1
+        finally:
+            release.set()
+            await batcher.stop()
+
+    asyncio.run(run())
+
+
+def test_server_translates_concurrent_requests_in_batches(make_uppercase_translator):
+    translator = make_uppercase_translator()
+    verse = {"words": ["logos", "theos"], "tags": ["N-NMS", "N-NMS"]}
+    lookup_threads = set()
+    translator.lookup = lambda words, tags: lookup_threads.add(threading.current_thread())
+
+    async def run() -> tuple[dict, list[tuple[int, dict]]]:
+        server = TranslationServer(translator, max_wait_ms=20, max_batch_tokens=64)
+        http_server = await server.start(port=0)
+        host, port = http_server.sockets[0].getsockname()[:2]
+        try:
+            report = await run_load_test(host, port, [verse], num_requests=32, concurrency=8)
+            reader, writer = await asyncio.open_connection(host, port)
+            responses = [
+                await request_json(reader, writer, "POST", "/translate", verse),
+                await request_json(reader, writer, "POST", "/translate", {"words": ["logos"], "tags": []}),
+                await request_json(reader, writer, "GET", "/missing"),
+            ]
+            writer.close()
+            return report, responses
+        finally:
+            http_server.close()
+            await server.batcher.stop()
+
+    report, responses = asyncio.run(run())
+    assert report["num_ok"] == 32
+    assert max(len(batch) for batch in translator.batches) > 1
+    assert [status for status, _ in responses] == [200, 400, 404]
+    assert responses[0][1] == {"blocks": ["L", "T"]}
+    # The cache lookups, which may read from disk, do not block the event loop
+    assert lookup_threads and threading.main_thread() not in lookup_threads
+
+
+@pytest.mark.parametrize("content_length, status", [("-1", 400), ("abc", 400), (str(2**21), 413)])
+def test_invalid_content_lengths_are_rejected_before_reading_the_body(content_length, status):
+    async def run() -> None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(f"POST /translate HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode())
+        reader.feed_eof()
+        await read_request(reader)
+
+    with pytest.raises(HTTPError) as error:
+        asyncio.run(run())
+    assert error.value.status == status
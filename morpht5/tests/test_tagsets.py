@@ -0,0 +1,57 @@
+import pickle
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+from morpht5 import BIBLEHUB_TAGSET, OBLUBIENICA_TAGSET, BibleHubTag, OblubienicaTag
+from morpht5.tagsets import generate
+
+
+@pytest.mark.parametrize("table, enum", [(BIBLEHUB_TAGSET, BibleHubTag), (OBLUBIENICA_TAGSET, OblubienicaTag)])
+def test_enum_view_matches_the_table(table, enum):
+    assert [member.value for member in enum] == list(table.tags)
+    assert all(table.ids[member.value] == tag_id for tag_id, member in enumerate(enum))
+    member = enum(table.tags[-1])
+    assert enum[member.name] is member
+    assert pickle.loads(pickle.dumps(member)) is member
+
+
+class BibleHubEnum(Enum):
+    """
+    Tagset for the BibleHub dataset.
+    """
+
+
+class OblubienicaEnum(Enum):
+    """
+    Tagset for the Oblubienica dataset.
+    """
+
+
+@pytest.mark.parametrize("enum, class_enum", [(BibleHubTag, BibleHubEnum), (OblubienicaTag, OblubienicaEnum)])
+def test_enum_view_has_the_docstring_of_a_class_statement(enum, class_enum):
+    assert enum.__doc__ == class_enum.__doc__
+
+
+@pytest.mark.parametrize("table", [BIBLEHUB_TAGSET, OBLUBIENICA_TAGSET])
+def test_features_are_stored_for_every_tag(table):
+    for labels, label_ids in table.features.values():
+        assert len(label_ids) == len(table)
+        assert labels[0] == "" and max(label_ids) < len(labels)
+
+
+def test_tags_are_decomposed_alike_in_both_tagsets():
+    # "says" (Mark 2:11) in both tagsets
+    biblehub = BIBLEHUB_TAGSET.decompose("V-PIA-3S")
+    oblubienica = OBLUBIENICA_TAGSET.decompose("vi Pres Act 3 Sg")
+    common = ["person", "tense", "mood", "number"]
+    assert [biblehub[feature] for feature in common] == [oblubienica[feature] for feature in common]
+    assert [biblehub[feature] for feature in common] == ["3", "present", "indicative", "singular"]
+    assert BIBLEHUB_TAGSET.decompose("Conj") == {"pos": "Conj"}
+
+
+@pytest.mark.parametrize("module_name", list(generate.TABLES))
+def test_generated_tables_are_up_to_date(module_name):
+    path = Path(generate.__file__).with_name(f"{module_name}.py")
+    assert generate.generate_table(module_name) == path.read_text()
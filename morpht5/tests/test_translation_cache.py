@@ -0,0 +1,79 @@
+import torch
+from tokenizers import Tokenizer, models, pre_tokenizers
+from transformers import T5TokenizerFast
+
+from morpht5 import MorphT5SumConfig, MorphT5SumForConditionalGeneration, MorphT5Tokenizer, MorphTokenizer
+from morpht5.serving import InterlinearTranslator, TranslationCache
+
+WORDS = [f"w{index}" for index in range(16)]
+TAGS = ["N-NMS", "V-PIA-3S", "Art-NMS", "Conj"]
+
+
+def get_translator(
+    config_kwargs: dict, cache: TranslationCache, num_beams: int = 1, seed: int = 0
+) -> InterlinearTranslator:
+    tokens = ["<pad>", "</s>", "<unk>"] + WORDS + [f"<extra_id_{index}>" for index in range(100)]
+    word_level = Tokenizer(models.WordLevel({token: index for index, token in enumerate(tokens)}, unk_token="<unk>"))
+    word_level.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    tokenizer = MorphT5Tokenizer(
+        text_tokenizer=T5TokenizerFast(tokenizer_object=word_level, eos_token="</s>", pad_token="<pad>", extra_ids=100),
+        morph_tokenizer=MorphTokenizer({tag: index + 4 for index, tag in enumerate(TAGS)}),
+    )
+    config = MorphT5SumConfig(**(config_kwargs | dict(vocab_size=len(tokens), num_layers=1)))
+    torch.manual_seed(seed)
+    return InterlinearTranslator(
+        MorphT5SumForConditionalGeneration(config), tokenizer, max_new_tokens=8, num_beams=num_beams, cache=cache
+    )
+
+
+def test_cache_evicts_the_least_recently_used_verses_from_memory_only(tmp_path):
+    cache = TranslationCache(tmp_path / "cache.sqlite", max_memory_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, [key.upper()])
+    assert cache.get("c") == ["C"]
+    # "a" was evicted from memory, but is still on disk
+    assert cache.get("a") == ["A"]
+    assert cache.get("missing") is None
+    assert cache.stats.to_dict() == {"memory_hits": 1, "disk_hits": 1, "misses": 1, "hit_rate": 0.667}
+    assert len(cache) == 3
+    cache.close()
+
+    reopened = TranslationCache(tmp_path / "cache.sqlite")
+    assert [reopened.get(key) for key in ("a", "b", "c")] == [["A"], ["B"], ["C"]]
+    assert reopened.stats.disk_hits == 3
+
+
+def test_cached_verses_skip_tokenization_and_generation(tmp_path, monkeypatch, tiny_config_kwargs):
+    verses = [(["w1", "w2", "w3"], ["N-NMS", "Conj", "Art-NMS"]), (["w4", "w5"], ["V-PIA-3S", "Conj"])]
+    translator = get_translator(tiny_config_kwargs, TranslationCache(tmp_path / "cache.sqlite"))
+    expected = translator.translate_verses(verses)
+
+    calls = []
+    monkeypatch.setattr(translator, "encode", lambda *args: calls.append("encode"))
+    monkeypatch.setattr(translator.model, "generate", lambda *args, **kwargs: calls.append("generate"))
+    # Whitespace around the words does not make another verse
+    assert translator.translate_verses([([" w1", "w2", "w3 "], verses[0][1]), verses[1]]) == expected
+    assert calls == []
+    assert translator.cache.stats.misses == 2
+
+    # Another process serving the same model finds the translations on disk, but not those of other settings
+    translator.cache.close()
+    reopened = TranslationCache(tmp_path / "cache.sqlite")
+    assert get_translator(tiny_config_kwargs, reopened).translate_verses(verses) == expected
+    assert reopened.stats.disk_hits == 2
+    get_translator(tiny_config_kwargs, reopened, num_beams=2).translate_verses(verses[:1])
+    assert reopened.stats.misses == 1
+
+
+def test_other_weights_loaded_from_the_same_path_miss_the_disk_cache(tmp_path, tiny_config_kwargs):
+    verses = [(["w1", "w2", "w3"], ["N-NMS", "Conj", "Art-NMS"])]
+    cache = TranslationCache(tmp_path / "cache.sqlite")
+    translator = get_translator(tiny_config_kwargs, cache)
+    translator.translate_verses(verses)
+
+    # Initialized from another seed, as if retrained and saved to the same path
+    retrained = get_translator(tiny_config_kwargs, cache, seed=1)
+    assert retrained.model.name_or_path == translator.model.name_or_path
+    assert retrained.model_id != translator.model_id
+    assert retrained.lookup(*verses[0]) is None
+    assert get_translator(tiny_config_kwargs, cache).lookup(*verses[0]) is not None
@@ -0,0 +1,33 @@
+import pytest
+import torch
+
+from morpht5 import TargetVocabulary
+
+
+def test_trimmed_target_vocabulary_generates_the_same_outputs(
+    morph_model_classes, tiny_config_kwargs, example_inputs, tmp_path
+):
+    config_class, model_class, morph_kwargs = morph_model_classes
+    config = config_class(**tiny_config_kwargs, **morph_kwargs)
+    torch.manual_seed(0)
+    model = model_class(config).eval()
+    expected = model.generate(**example_inputs, max_new_tokens=12)
+
+    # Greedy search only ever picks the top token, so a vocabulary holding the outputs reproduces them
+    vocabulary = TargetVocabulary.from_labels(expected[:, 1:].tolist() + [[-100]], special_token_ids=[0, 1])
+    vocabulary.save(tmp_path / "target_vocabulary.json")
+    vocabulary = TargetVocabulary.load(tmp_path / "target_vocabulary.json")
+    assert len(vocabulary) < config.vocab_size
+    model.trim_target_vocabulary(vocabulary)
+
+    assert model.lm_head.out_features == len(vocabulary)
+    assert model.get_decoder().get_input_embeddings().num_embeddings == len(vocabulary)
+    assert model.get_encoder().get_input_embeddings().num_embeddings == config.vocab_size
+    torch.testing.assert_close(model.generate(**example_inputs, max_new_tokens=12), expected, rtol=0, atol=0)
+    outputs = model.generate(**example_inputs, max_new_tokens=12, return_dict_in_generate=True)
+    torch.testing.assert_close(outputs.sequences, expected, rtol=0, atol=0)
+
+    with pytest.raises(ValueError):
+        vocabulary.to_reduced(torch.tensor([config.vocab_size - 1]))
+    with pytest.raises(ValueError):
+        model.save_pretrained(tmp_path)